@@ -0,0 +1,86 @@
+"""
+Snapshot Storage Benchmark
+Compares CSV, Parquet and Feather snapshots by file size, write time, full
+load time, and a dashboard-style projected + filtered load
+
+Usage: python benchmarks/bench_storage.py --rows 1000000
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from storage import FORMAT_SUFFIXES, read_deals, read_raw_deals, write_deals
+from synthetic import generate_raw_deals
+from transform import GameDataTransformer
+
+# Columns and filter of the Active Deals table in dashboard/app.py
+TABLE_COLUMNS = ["title", "thumbnail", "current_price", "retail_price", "discount_pct", "deal_rating", "store"]
+TABLE_FILTERS = [("discount_pct", ">=", 50), ("current_price", "<=", 20)]
+
+
+def best_time(func, repeat: int) -> tuple:
+    """Run func repeat times and return (best seconds, last result)"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def bench_frame(label: str, df, reader, workdir: Path, repeat: int, projected: bool) -> None:
+    """Print size and timings of one frame written in every format"""
+    print(f"{label} ({len(df):,} rows)")
+    print(f"  {'format':8s} {'size MB':>9s} {'write ms':>10s} {'load ms':>10s}" + (
+        f" {'table ms':>10s} {'rows':>9s}" if projected else ""
+    ))
+
+    baseline = None
+    for fmt, suffix in FORMAT_SUFFIXES.items():
+        path = workdir / f"{label.replace(' ', '_')}{suffix}"
+        write_seconds, size = best_time(lambda: write_deals(df, path), repeat)
+        load_seconds, _ = best_time(lambda: reader(path), repeat)
+        line = f"  {fmt:8s} {size / 1e6:9.2f} {write_seconds * 1000:10.1f} {load_seconds * 1000:10.1f}"
+
+        if projected:
+            table_seconds, table = best_time(
+                lambda: read_deals(path, columns=TABLE_COLUMNS, filters=TABLE_FILTERS), repeat
+            )
+            line += f" {table_seconds * 1000:10.1f} {len(table):9,}"
+
+        if baseline is None:
+            baseline = (size, load_seconds)
+        else:
+            line += f"   ({baseline[0] / size:.1f}x smaller, {baseline[1] / load_seconds:.1f}x faster load)"
+        print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    raw = generate_raw_deals(args.rows)
+    processed = GameDataTransformer.transform_deals_data_fused(raw, sort=True)
+    stores = pd.DataFrame({"store_id": range(1, 41), "store_name": [f"Store {i}" for i in range(1, 41)]})
+    processed = GameDataTransformer.attach_store_names(processed, stores)
+
+    with tempfile.TemporaryDirectory(prefix="bench_storage_") as workdir:
+        workdir = Path(workdir)
+        bench_frame("raw snapshot", raw, read_raw_deals, workdir, args.repeat, projected=False)
+        bench_frame("processed snapshot", processed, read_deals, workdir, args.repeat, projected=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,349 @@
+"""
+Benchmark Suite
+Times fetching (against a local replay server), each transform step, the
+pipeline's save paths, dashboard snapshot loads and dashboard aggregations
+on synthetic deals, saves the results as a JSON baseline, and compares a
+run against a saved baseline to flag regressions
+
+Usage: python benchmarks/bench_suite.py --scale 100k --save
+       python benchmarks/bench_suite.py --scale 100k --compare benchmarks/baselines/100k.json
+"""
+
+import argparse
+import json
+import logging
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "dashboard"))
+
+from api_config import APIConfig
+from fetch_data import GamePriceFetcher
+from pipeline import GameDealPipeline
+from queries import (
+    BEST_DEALS_COLUMNS,
+    DEALS_TABLE_COLUMNS,
+    OVERVIEW_COLUMNS,
+    STORE_COLUMNS,
+    deals_table,
+    deals_table_filters,
+    overview_metrics,
+    read_snapshot,
+    store_metrics,
+    store_options,
+    top_store_counts,
+)
+from replay import ReplayServer, fixture_name
+from storage import FORMAT_SUFFIXES, write_deals
+from synthetic import generate_raw_deals
+from transform import GameDataTransformer
+from validation import DealValidator
+
+SCALES = {"1k": 1_000, "100k": 100_000, "10M": 10_000_000}
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# Fetch benchmarks page through the replay server; cap the rows so large
+# scales measure per-page overhead without writing millions of fixtures
+FETCH_MAX_ROWS = 60_000
+
+# Synthetic store catalog covering every store ID the generator draws
+STORES = pd.DataFrame({"store_id": range(1, 41), "store_name": [f"Store {i}" for i in range(1, 41)]})
+
+
+def best_time(func, repeat: int) -> tuple:
+    """Run func repeat times and return (best seconds, last result)"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def result_rows(result):
+    """Row count of a benchmark result, when it has one"""
+    if isinstance(result, (pd.DataFrame, pd.Series, list)):
+        return len(result)
+    return None
+
+
+class Suite:
+    """Collects named timings, skipping names excluded by --only"""
+
+    def __init__(self, repeat: int, only=None):
+        self.repeat = repeat
+        self.only = only
+        self.results = {}
+
+    def wanted(self, group: str) -> bool:
+        return not self.only or any(group.startswith(prefix) for prefix in self.only)
+
+    def time(self, name: str, func, repeat=None, rows=None):
+        """Time func (best of repeat) under name and return its last result"""
+        seconds, result = best_time(func, repeat or self.repeat)
+        self.results[name] = {"seconds": round(seconds, 6), "rows": rows if rows is not None else result_rows(result)}
+        print(f"  {name:44s} {seconds * 1000:11.2f} ms")
+        return result
+
+
+def write_deal_fixtures(raw: pd.DataFrame, fixture_dir: Path, page_size: int) -> int:
+    """Write raw deals as replay fixtures of the paged /deals endpoint, returning the page count"""
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    pages = 0
+    for start in range(0, len(raw), page_size):
+        params = APIConfig.get_deals_endpoint_params(pages, page_size)
+        body = raw.iloc[start:start + page_size].to_json(orient="records")
+        (fixture_dir / fixture_name("deals", params)).write_text(
+            f'{{"endpoint": "deals", "params": {json.dumps(params)}, "headers": {{}}, "body": {body}}}',
+            encoding="utf-8",
+        )
+        pages += 1
+    return pages
+
+
+def bench_fetch(suite: Suite, raw: pd.DataFrame, workdir: Path) -> None:
+    """Page the deals catalog through GamePriceFetcher against a local replay server"""
+    rows = raw.head(FETCH_MAX_ROWS)
+    pages = write_deal_fixtures(rows, workdir / "fixtures", APIConfig.DEALS_PAGE_SIZE)
+    print(f"fetch ({len(rows):,} rows, {pages:,} pages from a local replay server)")
+
+    with ReplayServer(workdir / "fixtures", port=0) as server:
+        fetcher = GamePriceFetcher(requests_per_second=1e6)
+        fetcher.cheapshark_url = server.base_url
+        try:
+            fetched = suite.time(
+                "fetch.iter_deal_pages", lambda: sum(len(page) for page in fetcher.iter_deal_pages()), rows=len(rows)
+            )
+        finally:
+            fetcher.close()
+
+    if fetched != len(rows):
+        print(f"  Warning: fetched {fetched:,} of {len(rows):,} rows")
+
+
+def bench_transform(suite: Suite, raw: pd.DataFrame) -> pd.DataFrame:
+    """Time validation, each transform_deals_data step and the whole transform"""
+    print(f"transform ({len(raw):,} rows)")
+    transformer = GameDataTransformer
+
+    suite.time("validate.deals", lambda: DealValidator.validate(raw).valid)
+    cleaned = suite.time("transform.clean_deal_data", lambda: transformer.clean_deal_data(raw))
+    with_discount = suite.time(
+        "transform.calculate_discount_percentage", lambda: transformer.calculate_discount_percentage(cleaned)
+    )
+    with_quality = suite.time(
+        "transform.categorize_deal_quality", lambda: transformer.categorize_deal_quality(with_discount)
+    )
+    with_time = suite.time("transform.add_time_metadata", lambda: transformer.add_time_metadata(with_quality))
+    ordered = with_time[transformer._ordered_columns(with_time.columns)]
+    suite.time("transform.apply_deals_schema", lambda: transformer.apply_deals_schema(ordered))
+
+    transformed = suite.time("transform.transform_deals_data", lambda: transformer.transform_deals_data(raw))
+    suite.time("transform.sort_by_deal_quality", lambda: transformer.sort_by_deal_quality(transformed))
+    processed = suite.time(
+        "transform.transform_deals_data_fused", lambda: transformer.transform_deals_data_fused(raw, sort=True)
+    )
+    return suite.time("transform.attach_store_names", lambda: transformer.attach_store_names(processed, STORES))
+
+
+def game_pass_lookup(raw: pd.DataFrame, every: int = 50) -> dict:
+    """Synthetic Game Pass lookup covering every n-th distinct title"""
+    titles = GameDataTransformer.normalize_titles(raw["title"].drop_duplicates())
+    return {title: f"GP{i}" for i, title in enumerate(titles.iloc[::every])}
+
+
+def bench_save(suite: Suite, raw: pd.DataFrame, processed: pd.DataFrame, workdir: Path) -> Path:
+    """Time GameDealPipeline's save paths with every pipeline directory inside workdir"""
+    print(f"save ({len(processed):,} rows, {APIConfig.STORAGE_FORMAT})")
+
+    pipeline = GameDealPipeline(base_dir=workdir / "pipeline")
+    try:
+        # A fixed name, so the end-to-end run below writes a separate snapshot
+        processed_file = pipeline.snapshot_path(pipeline.processed_dir, "deals_processed_", datetime(2024, 1, 1))
+        suite.time("save.write_deals", lambda: write_deals(processed, processed_file))
+        index_file = suite.time(
+            "save.best_price_index", lambda: pipeline.save_best_price_index(processed, processed_file)
+        )
+        suite.time("save.price_history", lambda: pipeline.append_price_history(processed))
+        suite.time(
+            "save.manifest",
+            lambda: pipeline.publish_snapshot(processed_file, len(processed), processed.dtypes, index_file),
+        )
+
+        valid = DealValidator.validate(raw).valid
+        lookup = game_pass_lookup(raw)
+        suite.time(
+            "save.transform_and_save_deals",
+            lambda: pipeline.transform_and_save_deals(valid, lookup, stores=STORES),
+            repeat=1,
+        )
+    finally:
+        pipeline.close()
+    return processed_file
+
+
+def bench_dashboard(suite: Suite, snapshot: Path) -> None:
+    """Time the dashboard's uncached snapshot loads and per-page aggregations"""
+    print(f"dashboard ({snapshot.name})")
+
+    table_filters = deals_table_filters(50, 70)
+    overview = suite.time("dashboard.load_overview", lambda: read_snapshot(snapshot, OVERVIEW_COLUMNS))
+    table = suite.time(
+        "dashboard.load_deals_table", lambda: read_snapshot(snapshot, DEALS_TABLE_COLUMNS, table_filters)
+    )
+    suite.time("dashboard.load_best_deals", lambda: read_snapshot(snapshot, BEST_DEALS_COLUMNS))
+    stores = suite.time("dashboard.load_store_comparison", lambda: read_snapshot(snapshot, STORE_COLUMNS))
+    suite.time("dashboard.load_all_columns", lambda: read_snapshot(snapshot))
+
+    suite.time("dashboard.overview_metrics", lambda: overview_metrics(overview))
+    suite.time("dashboard.top_store_counts", lambda: top_store_counts(overview))
+    suite.time("dashboard.deals_table", lambda: deals_table(table))
+    options = suite.time("dashboard.store_options", lambda: store_options(stores))
+    suite.time("dashboard.store_metrics", lambda: store_metrics(stores, options[:5]))
+
+
+def run_suite(rows: int, repeat: int, only=None) -> dict:
+    """
+    Run every benchmark group on a synthetic catalog
+
+    Args:
+        rows: Synthetic raw deal count
+        repeat: Timed runs per benchmark (the best is kept)
+        only: Group name prefixes to run (all when None)
+
+    Returns:
+        Results document as saved to a baseline file
+    """
+    suite = Suite(repeat, only)
+    raw = generate_raw_deals(rows)
+
+    with tempfile.TemporaryDirectory(prefix="bench_suite_") as workdir:
+        workdir = Path(workdir)
+        if suite.wanted("fetch"):
+            bench_fetch(suite, raw, workdir)
+
+        processed = None
+        if suite.wanted("transform"):
+            processed = bench_transform(suite, raw)
+
+        if suite.wanted("save") or suite.wanted("dashboard"):
+            if processed is None:
+                processed = GameDataTransformer.attach_store_names(
+                    GameDataTransformer.transform_deals_data_fused(raw, sort=True), STORES
+                )
+            if suite.wanted("save"):
+                snapshot = bench_save(suite, raw, processed, workdir)
+            else:
+                snapshot = workdir / f"deals_processed{FORMAT_SUFFIXES[APIConfig.STORAGE_FORMAT]}"
+                write_deals(processed, snapshot)
+
+            if suite.wanted("dashboard"):
+                bench_dashboard(suite, snapshot)
+
+    return {
+        "rows": rows,
+        "repeat": repeat,
+        "storage_format": APIConfig.STORAGE_FORMAT,
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "machine": platform.machine(),
+        "results": suite.results,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float, min_delta: float) -> list:
+    """
+    Print current timings against a baseline and return the regressions
+
+    A benchmark regresses when it is more than threshold (a fraction)
+    slower than its baseline and the slowdown exceeds min_delta seconds,
+    so sub-millisecond noise on tiny scales is not flagged.
+
+    Args:
+        baseline: Saved results document
+        current: Results document of this run
+        threshold: Allowed slowdown, e.g. 0.2 for 20%
+        min_delta: Ignore slowdowns below this many seconds
+
+    Returns:
+        Names of regressed benchmarks
+    """
+    for key in ("rows", "storage_format"):
+        if baseline.get(key) != current.get(key):
+            print(f"Warning: baseline {key} {baseline.get(key)!r} differs from this run's {current.get(key)!r}")
+
+    print(f"{'benchmark':44s} {'baseline ms':>12s} {'current ms':>12s} {'change':>8s}")
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:44s} {'-':>12s} {result['seconds'] * 1000:12.2f}      new")
+            continue
+
+        change = result["seconds"] / base["seconds"] - 1 if base["seconds"] else 0.0
+        regressed = change > threshold and result["seconds"] - base["seconds"] > min_delta
+        if regressed:
+            regressions.append(name)
+        print(
+            f"{name:44s} {base['seconds'] * 1000:12.2f} {result['seconds'] * 1000:12.2f} "
+            f"{change:+7.1%}" + ("  REGRESSION" if regressed else "")
+        )
+
+    for name in baseline["results"].keys() - current["results"].keys():
+        print(f"{name:44s} missing from this run")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scale", choices=SCALES, default="100k")
+    parser.add_argument("--rows", type=int, help="Override the scale's row count")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--format", choices=FORMAT_SUFFIXES, help="Snapshot format (defaults to PLAYSMART_STORAGE_FORMAT)")
+    parser.add_argument("--only", nargs="+", choices=["fetch", "transform", "save", "dashboard"],
+                        help="Benchmark groups to run (validation is timed with transform)")
+    parser.add_argument("--save", nargs="?", const="", metavar="PATH",
+                        help="Write results as a baseline (defaults to benchmarks/baselines/<scale>.json)")
+    parser.add_argument("--compare", metavar="BASELINE", help="Compare against a saved baseline")
+    parser.add_argument("--results", metavar="PATH", help="Compare saved results instead of running the suite")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before flagging (0.2 = 20%%)")
+    parser.add_argument("--min-delta", type=float, default=0.02, help="Ignore slowdowns below this many seconds")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    if args.format:
+        APIConfig.STORAGE_FORMAT = args.format
+
+    if args.results:
+        current = json.loads(Path(args.results).read_text(encoding="utf-8"))
+    else:
+        rows = args.rows or SCALES[args.scale]
+        print(f"Benchmark suite: {rows:,} synthetic deals, best of {args.repeat}")
+        current = run_suite(rows, args.repeat, args.only)
+
+    if args.save is not None:
+        path = Path(args.save) if args.save else BASELINE_DIR / f"{args.scale}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(current, indent=2) + "\n", encoding="utf-8")
+        print(f"Saved results to {path}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding="utf-8"))
+        regressions = compare(baseline, current, args.threshold, args.min_delta)
+        if regressions:
+            print(f"{len(regressions)} regressions beyond {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
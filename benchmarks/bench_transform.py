@@ -0,0 +1,136 @@
+"""
+Transform Metric Benchmark
+Compares the vectorized discount/quality metrics against the previous
+per-row implementation, and the fused transform against the step-by-step one
+
+Usage: python benchmarks/bench_transform.py --rows 1000000
+"""
+
+import argparse
+import logging
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from transform import GameDataTransformer
+from synthetic import generate_raw_deals
+
+
+def legacy_calculate_discount_percentage(df: pd.DataFrame) -> pd.DataFrame:
+    """Previous Series-arithmetic implementation, kept as the baseline"""
+    df = df.copy()
+    df["discount_pct"] = (
+        (df["retail_price"] - df["current_price"]) / df["retail_price"] * 100
+    ).round(2)
+    df["discount_pct"] = df["discount_pct"].fillna(0)
+    df["discount_pct"] = df["discount_pct"].clip(lower=0)
+    return df
+
+
+def legacy_categorize_deal_quality(df: pd.DataFrame) -> pd.DataFrame:
+    """Previous Series.apply implementation, kept as the baseline"""
+    df = df.copy()
+
+    def quality(discount):
+        if pd.isna(discount):
+            return "Unknown"
+        elif discount >= 75:
+            return "Exceptional"
+        elif discount >= 50:
+            return "Excellent"
+        elif discount >= 25:
+            return "Good"
+        elif discount >= 10:
+            return "Moderate"
+        else:
+            return "Minimal"
+
+    df["deal_quality"] = df["discount_pct"].apply(quality)
+    return df
+
+
+def best_of(func, df: pd.DataFrame, repeat: int) -> tuple:
+    """Run func repeat times and return (best seconds, last result)"""
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def peak_memory(func, df: pd.DataFrame) -> int:
+    """Peak traced allocation in bytes while running func(df)"""
+    tracemalloc.start()
+    try:
+        func(df)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def stepwise_transform(df: pd.DataFrame) -> pd.DataFrame:
+    """transform_deals_data followed by sort_by_deal_quality"""
+    return GameDataTransformer.sort_by_deal_quality(GameDataTransformer.transform_deals_data(df))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    raw = generate_raw_deals(args.rows)
+    cleaned = GameDataTransformer.clean_deal_data(raw)
+    print(f"Benchmarking metric stage on {len(cleaned):,} rows (best of {args.repeat})")
+
+    steps = [
+        ("calculate_discount_percentage", legacy_calculate_discount_percentage,
+         GameDataTransformer.calculate_discount_percentage, cleaned),
+    ]
+    with_discount = GameDataTransformer.calculate_discount_percentage(cleaned)
+    steps.append(
+        ("categorize_deal_quality", legacy_categorize_deal_quality,
+         GameDataTransformer.categorize_deal_quality, with_discount)
+    )
+
+    for name, legacy, current, frame in steps:
+        legacy_time, legacy_out = best_of(legacy, frame, args.repeat)
+        current_time, current_out = best_of(current, frame, args.repeat)
+
+        column = "discount_pct" if name == "calculate_discount_percentage" else "deal_quality"
+        matches = np.array_equal(
+            legacy_out[column].astype(str).to_numpy(), current_out[column].astype(str).to_numpy()
+        )
+
+        print(
+            f"  {name:32s} legacy {legacy_time * 1000:9.1f} ms   "
+            f"vectorized {current_time * 1000:9.1f} ms   "
+            f"speedup {legacy_time / current_time:6.1f}x   identical={matches}"
+        )
+
+    compare_fused(raw, args.repeat)
+
+
+def compare_fused(raw: pd.DataFrame, repeat: int) -> None:
+    """Report time and peak memory of the fused transform against the stepwise one"""
+    fused = GameDataTransformer.transform_deals_data_fused
+    input_mb = raw.memory_usage(deep=True).sum() / 1e6
+
+    print(f"Full transform + sort on {len(raw):,} raw rows (input {input_mb:.1f} MB)")
+    for name, func in [("stepwise", stepwise_transform), ("fused", fused)]:
+        seconds, _ = best_of(func, raw, repeat)
+        peak_mb = peak_memory(func, raw) / 1e6
+        print(f"  {name:10s} {seconds * 1000:9.1f} ms   peak {peak_mb:8.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Synthetic CheapShark Data Generator
+Builds deal frames shaped like the /deals API response for benchmarking
+"""
+
+import numpy as np
+import pandas as pd
+
+# Store IDs weighted roughly like the live catalog (Steam dominates)
+_STORE_IDS = np.array([1, 2, 3, 6, 7, 8, 11, 13, 15, 21, 23, 24, 25, 27, 28, 29, 30, 31, 33, 35])
+_STORE_WEIGHTS = np.array([30, 4, 8, 3, 8, 5, 4, 3, 4, 4, 6, 2, 3, 2, 2, 2, 2, 3, 2, 3], dtype="float64")
+_TITLE_WORDS = np.array([
+    "Dark", "Legend", "Quest", "Star", "Tactics", "Racing", "Space", "Dungeon",
+    "Empire", "Zero", "Shadow", "Kingdom", "Galaxy", "Rogue", "Hero", "Night",
+])
+
+
+def generate_raw_deals(n_rows: int, seed: int = 42, n_games: int = None) -> pd.DataFrame:
+    """
+    Generate a raw deals DataFrame with CheapShark column names and string values
+
+    Args:
+        n_rows: Number of deals
+        seed: Random seed for reproducible data
+        n_games: Distinct games the deals are spread over (defaults to n_rows // 3)
+
+    Returns:
+        DataFrame matching the /deals payload layout
+    """
+    rng = np.random.default_rng(seed)
+    n_games = max(1, n_games or n_rows // 3)
+
+    game_ids = rng.integers(1, n_games + 1, size=n_rows)
+    normal_price = np.round(rng.choice([4.99, 9.99, 14.99, 19.99, 29.99, 39.99, 59.99, 69.99], size=n_rows), 2)
+    savings = np.round(rng.beta(2, 2, size=n_rows) * 100, 6)
+    sale_price = np.round(normal_price * (1 - savings / 100), 2)
+    store_ids = rng.choice(_STORE_IDS, size=n_rows, p=_STORE_WEIGHTS / _STORE_WEIGHTS.sum())
+
+    words = _TITLE_WORDS[(game_ids[:, None] // (len(_TITLE_WORDS) ** np.arange(2))) % len(_TITLE_WORDS)]
+    titles = pd.Series(words[:, 0]) + " " + pd.Series(words[:, 1]) + " " + pd.Series(game_ids).astype(str)
+
+    return pd.DataFrame({
+        "internalName": titles.str.upper().str.replace(" ", "", regex=False),
+        "title": titles,
+        "metacriticLink": "",
+        "dealID": pd.Series(np.arange(n_rows)).map("deal{:010d}".format),
+        "storeID": store_ids.astype(str),
+        "gameID": game_ids.astype(str),
+        "salePrice": pd.Series(sale_price).map("{:.2f}".format),
+        "normalPrice": pd.Series(normal_price).map("{:.2f}".format),
+        "isOnSale": (savings > 0).astype(int).astype(str),
+        "savings": pd.Series(savings).map("{:.6f}".format),
+        "metacriticScore": rng.integers(0, 100, size=n_rows).astype(str),
+        "steamRatingPercent": rng.integers(0, 100, size=n_rows).astype(str),
+        "releaseDate": rng.integers(1_000_000_000, 1_700_000_000, size=n_rows),
+        "lastChange": rng.integers(1_700_000_000, 1_760_000_000, size=n_rows),
+        "dealRating": pd.Series(np.round(rng.uniform(0, 10, size=n_rows), 1)).map("{:.1f}".format),
+        "thumb": "https://cdn.example.com/capsule.jpg",
+    })
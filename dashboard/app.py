@@ -12,6 +12,27 @@ from pathlib import Path
 from datetime import datetime
 import warnings
 import os
+import sys
+
+# Reuse the pipeline's storage helpers so snapshots load with their compact schema
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from manifest import read_latest
+from price_index import BestPriceIndex
+from storage import snapshot_files
+from queries import (
+    BEST_DEALS_COLUMNS,
+    DEALS_TABLE_COLUMNS,
+    OVERVIEW_COLUMNS,
+    STORE_COLUMNS,
+    deals_table,
+    deals_table_filters,
+    overview_metrics,
+    read_snapshot,
+    store_metrics,
+    store_options,
+    top_store_counts,
+)
 
 # Fix for Python 3.13 asyncio event loop issue
 os.environ["STREAMLIT_SERVER_HEADLESS"] = "true"
@@ -116,72 +137,82 @@ st.markdown(
 )
 
 
-@st.cache_data
-def load_deals_data():
-    """Load the latest processed deals data"""
-    data_dir = Path(__file__).parent.parent / "processed_data"
+DATA_DIR = Path(__file__).parent.parent / "processed_data"
+
+
+def latest_snapshot():
+    """
+    Manifest of the current deals snapshot
 
-    # Find the latest deals file
-    deals_files = sorted(data_dir.glob("deals_processed*.csv"), reverse=True)
+    Reads processed_data/latest.json published by the pipeline. Data
+    directories written before the manifest existed fall back to the
+    newest snapshot by name.
+    """
+    manifest = read_latest(DATA_DIR)
+    if manifest is not None:
+        return manifest
 
+    deals_files = snapshot_files(DATA_DIR, "deals_processed_")
     if not deals_files:
         return None
 
     latest_file = deals_files[0]
-    df = pd.read_csv(latest_file)
-
-    # Ensure numeric columns
-    for col in ["current_price", "retail_price", "discount_pct", "deal_rating"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    return df.sort_values("discount_pct", ascending=False)
-
-
-def get_store_name(store_id):
-    """Convert store ID to store name"""
-    store_names = {
-        1: "Steam",
-        2: "GameBillet",
-        3: "Green Man Gaming",
-        5: "GOG",
-        6: "Epic Games Store",
-        7: "Fanatical",
-        8: "Microsoft Store",
-        10: "Humble Bundle",
-        11: "2Game",
-        12: "Gamesplanet",
-        13: "Voidu",
-        14: "Gamer's Gate",
-        15: "WinGameStore",
-        16: "Allyouplay",
-        17: "IndieGala",
-        18: "Shopify",
-        19: "DreamGame",
-        20: "GamersGate",
-        21: "Nuuvem",
-        22: "Glyph",
-        23: "GameStop",
-        24: "Oculus",
-        25: "Best Buy",
-        26: "Nintendo",
-        27: "PlayStation Store",
-        28: "Ubisoft",
-        29: "Bethesda",
-        30: "Blizzard",
-        31: "Rockstar Games",
-        32: "2K Games",
-        33: "Borderlands",
-        34: "Amazon",
-        35: "Twitch",
-        36: "Instant Gaming",
-        37: "Eneba",
-        38: "Kinguin",
-        39: "Gamers Gate",
-        40: "MacGameStore",
-        41: "GamePlanet",
+    index_file = BestPriceIndex.index_path(latest_file)
+    return {
+        "path": latest_file.name,
+        "sha256": str(latest_file.stat().st_mtime),
+        "index": index_file.name if index_file.exists() else None,
+        "published_at": datetime.fromtimestamp(latest_file.stat().st_mtime).isoformat(timespec="seconds"),
     }
-    return store_names.get(int(store_id), f"Store {int(store_id)}")
+
+
+def load_deals_data(columns=None, filters=None):
+    """
+    Load the latest processed deals data
+
+    Args:
+        columns: Only load these columns (all when None)
+        filters: (column, op, value) tuples pushed down into the read
+    """
+    manifest = latest_snapshot()
+    if manifest is None:
+        return None
+
+    # The checksum is part of the cache key, so a new snapshot is picked up
+    return load_snapshot(manifest["path"], manifest["sha256"], columns, filters)
+
+
+@st.cache_data
+def load_snapshot(name, version, columns=None, filters=None):
+    """Read one deals snapshot, cached per file name and version"""
+    return read_snapshot(DATA_DIR / name, columns, filters, store_names=load_store_names)
+
+
+def load_best_price_index():
+    """Load the best price index saved alongside the latest deals snapshot"""
+    manifest = latest_snapshot()
+    if manifest is None or not manifest.get("index"):
+        return None
+
+    return load_index_file(manifest["index"])
+
+
+@st.cache_resource
+def load_index_file(name):
+    """Read one best price index file, cached per file name"""
+    return BestPriceIndex.load(DATA_DIR / name)
+
+
+@st.cache_data(ttl=3600)
+def load_store_names():
+    """Load the store catalog published by the pipeline as a store_id -> name Series"""
+    stores_file = Path(__file__).parent.parent / "processed_data" / "stores.csv"
+
+    if not stores_file.exists():
+        return pd.Series(dtype="object")
+
+    stores = pd.read_csv(stores_file)
+    return pd.Series(stores["store_name"].to_numpy(), index=stores["store_id"].astype("int64"))
 
 
 def format_deal_quality(quality):
@@ -206,7 +237,7 @@ def page_deals_overview():
         "There may be additional deals available, but these represent the highest-quality deals across 90+ retailers."
     )
 
-    deals = load_deals_data()
+    deals = load_deals_data(OVERVIEW_COLUMNS)
 
     if deals is None or deals.empty:
         st.warning("No deals data available. Run the pipeline first: `python pipeline/pipeline.py`")
@@ -214,17 +245,16 @@ def page_deals_overview():
 
     # Summary metrics
     col1, col2, col3 = st.columns(3)
+    summary = overview_metrics(deals)
 
     with col1:
-        st.metric("Total Deals Available", len(deals))
+        st.metric("Total Deals Available", summary["total"])
 
     with col2:
-        avg_discount = deals["discount_pct"].mean() if "discount_pct" in deals.columns else 0
-        st.metric("Average Discount", f"{avg_discount:.1f}%")
+        st.metric("Average Discount", f"{summary['avg_discount']:.1f}%")
 
     with col3:
-        max_discount = deals["discount_pct"].max() if "discount_pct" in deals.columns else 0
-        st.metric("Best Discount", f"{max_discount:.0f}%")
+        st.metric("Best Discount", f"{summary['max_discount']:.0f}%")
 
     st.divider()
 
@@ -233,12 +263,11 @@ def page_deals_overview():
 
     with col1:
         st.subheader("🏪 Top Stores by Deal Count")
-        if "store_id" in deals.columns:
-            store_counts = deals["store_id"].value_counts().head(8)
-            store_labels = [get_store_name(int(s)) for s in store_counts.index]
+        if "store" in deals.columns:
+            store_counts = top_store_counts(deals)
             fig = px.bar(
                 x=store_counts.values,
-                y=store_labels,
+                y=store_counts.index.astype(str),
                 orientation="h",
                 labels={"x": "Number of Deals", "y": "Store"},
                 color=store_counts.values,
@@ -289,33 +318,16 @@ def page_deals_overview():
             step=5
         )
 
-    # Apply filters
-    filtered_deals = deals[
-        (deals["discount_pct"] >= min_discount) &
-        (deals["current_price"] <= max_price)
-    ]
+    # Apply filters while reading, loading only the table's columns
+    filtered_deals = load_deals_data(DEALS_TABLE_COLUMNS, deals_table_filters(min_discount, max_price))
 
     # Display deals as table with thumbnails
     if len(filtered_deals) > 0:
         st.info(f"Showing {len(filtered_deals)} deals matching your criteria")
 
-        # Build table data
-        table_data = []
-        for _, deal in filtered_deals.iterrows():
-            thumb_url = deal.get('thumbnail', '')
-
-            table_data.append({
-                'Cover': thumb_url if thumb_url and isinstance(thumb_url, str) and thumb_url.startswith('http') else '',
-                'Game Title': deal.get('title', 'Unknown'),
-                'Current Price': f"${deal.get('current_price', 0):.2f}",
-                'Retail Price': f"${deal.get('retail_price', 0):.2f}",
-                'Discount %': f"{deal.get('discount_pct', 0):.1f}%",
-                'Deal Rating': f"{deal.get('deal_rating', 0):.1f}/10",
-                'Store': get_store_name(deal.get('store_id', 0))
-            })
+        display_df = deals_table(filtered_deals)
 
         # Display as dataframe with image column
-        display_df = pd.DataFrame(table_data)
         st.dataframe(
             display_df,
             use_container_width=True,
@@ -353,7 +365,7 @@ def page_best_deals():
     st.title("🏆 Best Deals - Ranked")
     st.markdown("Games with the deepest discounts from their retail price")
 
-    deals = load_deals_data()
+    deals = load_deals_data(BEST_DEALS_COLUMNS)
 
     if deals is None or deals.empty:
         st.warning("No deals data available")
@@ -368,8 +380,7 @@ def page_best_deals():
 
             with col1:
                 st.write(f"**{idx}. {deal.get('title', 'Unknown')}**")
-                store_name = get_store_name(deal.get('store_id', 0))
-                st.caption(f"📦 {store_name}")
+                st.caption(f"📦 {deal.get('store', 'Unknown')}")
 
             with col2:
                 st.metric(
@@ -396,41 +407,25 @@ def page_store_comparison():
     st.title("🏪 Store Comparison")
     st.markdown("See which stores have the best deals")
 
-    deals = load_deals_data()
+    deals = load_deals_data(STORE_COLUMNS)
 
     if deals is None or deals.empty:
         st.warning("No deals data available")
         return
 
-    if "store_id" not in deals.columns:
+    if "store" not in deals.columns:
         st.warning("Store information not available")
         return
 
-    # Get unique store IDs with their counts
-    store_counts = deals["store_id"].value_counts()
-    store_options = {get_store_name(sid): sid for sid in store_counts.index}
+    # Stores ordered by deal count
+    options = store_options(deals)
     selected_store_names = st.multiselect(
         "Select stores to compare",
-        options=list(store_options.keys()),
-        default=list(store_options.keys())[:5] if len(store_options) > 5 else list(store_options.keys())
+        options=options,
+        default=options[:5] if len(options) > 5 else options
     )
 
-    selected_store_ids = [store_options[name] for name in selected_store_names]
-    filtered = deals[deals["store_id"].isin(selected_store_ids)]
-
-    # Metrics by store
-    store_metrics = []
-    for store_id in selected_store_ids:
-        store_deals = filtered[filtered["store_id"] == store_id]
-        store_metrics.append({
-            "Store": get_store_name(store_id),
-            "Deal Count": len(store_deals),
-            "Avg Discount": store_deals["discount_pct"].mean(),
-            "Max Discount": store_deals["discount_pct"].max(),
-            "Avg Price": store_deals["current_price"].mean(),
-        })
-
-    metrics_df = pd.DataFrame(store_metrics)
+    metrics_df = store_metrics(deals, selected_store_names)
 
     st.subheader("Store Metrics")
     st.dataframe(metrics_df, use_container_width=True, hide_index=True)
@@ -467,6 +462,56 @@ def page_store_comparison():
         st.plotly_chart(fig, use_container_width=True)
 
 
+def page_price_finder():
+    """Cheapest place to buy a game, from the best price index"""
+    st.title("💲 Price Finder")
+    st.markdown("Find the cheapest store for any game in the catalog")
+
+    index = load_best_price_index()
+
+    if index is None or len(index) == 0:
+        st.warning("No price index available. Run the pipeline first: `python pipeline/pipeline.py`")
+        return
+
+    titles = index.index["title"]
+    game_id = st.selectbox(
+        "Game",
+        options=titles.index,
+        format_func=lambda gid: titles.get(gid, str(gid)),
+    )
+
+    best = index.lookup(game_id)
+    if best is not None:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.metric("Best Price", f"${best['best_price']:.2f}", delta=f"-{best['discount_pct']:.0f}%")
+            st.caption(f"📦 {best.get('best_store', 'Unknown')}")
+        with col2:
+            if pd.notna(best.get("runner_up_price")):
+                st.metric("Runner-up", f"${best['runner_up_price']:.2f}")
+                st.caption(f"📦 {best.get('runner_up_store', 'Unknown')}")
+            else:
+                st.metric("Runner-up", "—")
+        with col3:
+            st.metric("Stores Carrying", int(best["store_count"]))
+
+    st.divider()
+
+    st.subheader("🏷️ Best Deal per Game")
+    top = index.best_deals(25).reset_index()
+    st.dataframe(
+        pd.DataFrame({
+            "Game Title": top["title"],
+            "Best Price": top["best_price"].map("${:.2f}".format),
+            "Discount %": top["discount_pct"].map("{:.1f}%".format),
+            "Store": top["best_store"].astype(str) if "best_store" in top.columns else "Unknown",
+            "Stores": top["store_count"],
+        }),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
 def main():
     """Main app navigation"""
     st.sidebar.title("🎮 PlaySmart")
@@ -474,7 +519,7 @@ def main():
 
     page = st.sidebar.radio(
         "Navigation",
-        ["🔥 Active Deals", "🏆 Best Deals", "🏪 Store Comparison"],
+        ["🔥 Active Deals", "🏆 Best Deals", "🏪 Store Comparison", "💲 Price Finder"],
     )
 
     st.sidebar.markdown("---")
@@ -486,12 +531,10 @@ def main():
 
     st.sidebar.markdown("---")
     st.sidebar.markdown("**Last Updated**")
-    data_dir = Path(__file__).parent.parent / "processed_data"
-    deals_files = list(data_dir.glob("deals_processed*.csv"))
-    if deals_files:
-        latest_file = max(deals_files, key=lambda p: p.stat().st_mtime)
-        mtime = datetime.fromtimestamp(latest_file.stat().st_mtime)
-        st.sidebar.caption(f"{mtime.strftime('%Y-%m-%d %H:%M:%S')}")
+    manifest = latest_snapshot()
+    if manifest is not None:
+        published = datetime.fromisoformat(manifest["published_at"])
+        st.sidebar.caption(f"{published.strftime('%Y-%m-%d %H:%M:%S')}")
 
     # Route to pages
     if page == "🔥 Active Deals":
@@ -500,6 +543,8 @@ def main():
         page_best_deals()
     elif page == "🏪 Store Comparison":
         page_store_comparison()
+    elif page == "💲 Price Finder":
+        page_price_finder()
 
 
 if __name__ == "__main__":
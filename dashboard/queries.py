@@ -0,0 +1,129 @@
+"""
+PlaySmart Dashboard Queries
+Snapshot loading and per-page aggregations behind the dashboard, kept free
+of Streamlit so they can be benchmarked and reused outside the app
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+# Reuse the pipeline's storage helpers so snapshots load with their compact schema
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from storage import deals_columns, read_deals
+
+# Snapshot columns each page reads (Parquet/Feather snapshots decode only these)
+OVERVIEW_COLUMNS = ("current_price", "discount_pct", "store")
+DEALS_TABLE_COLUMNS = (
+    "title", "thumbnail", "current_price", "retail_price", "discount_pct", "deal_rating", "store",
+)
+BEST_DEALS_COLUMNS = (
+    "title", "store", "current_price", "retail_price", "discount_pct", "deal_rating", "deal_quality",
+)
+STORE_COLUMNS = ("store", "discount_pct", "current_price")
+
+
+def deals_table_filters(min_discount, max_price):
+    """Filters for the Active Deals table, pushed down into the snapshot read"""
+    return (("discount_pct", ">=", min_discount), ("current_price", "<=", max_price))
+
+
+def read_snapshot(path, columns=None, filters=None, store_names=None):
+    """
+    Read one deals snapshot sorted by discount
+
+    Args:
+        path: Snapshot file
+        columns: Only load these columns (all when None)
+        filters: (column, op, value) tuples pushed down into the read
+        store_names: Callable returning a store_id -> name Series, used for
+            snapshots written before store names were attached
+    """
+    load = None
+    if columns is not None:
+        available = deals_columns(path)
+        load = [col for col in dict.fromkeys(tuple(columns) + ("discount_pct",)) if col in available]
+        if "store" in columns and "store" not in available and "store_id" in available:
+            load.append("store_id")
+
+    df = read_deals(path, columns=load, filters=list(filters) if filters else None)
+
+    # Snapshots written before store names were attached only carry store_id
+    if "store" not in df.columns and "store_id" in df.columns:
+        store_ids = pd.to_numeric(df["store_id"], errors="coerce").astype("Int64")
+        names = store_ids.map(store_names() if store_names is not None else pd.Series(dtype="object"))
+        df["store"] = names.fillna("Store " + store_ids.astype(str))
+    if "store" in df.columns:
+        df["store"] = df["store"].astype("category")
+
+    if "discount_pct" not in df.columns:
+        return df
+    return df.sort_values("discount_pct", ascending=False)
+
+
+def overview_metrics(deals):
+    """Deal count, average and best discount for the overview header"""
+    if "discount_pct" not in deals.columns:
+        return {"total": len(deals), "avg_discount": 0, "max_discount": 0}
+    return {
+        "total": len(deals),
+        "avg_discount": deals["discount_pct"].mean(),
+        "max_discount": deals["discount_pct"].max(),
+    }
+
+
+def top_store_counts(deals, n=8):
+    """Deal count of the n stores with the most deals"""
+    return deals["store"].value_counts().head(n)
+
+
+def store_options(deals):
+    """Store names that have deals, ordered by deal count"""
+    store_counts = deals["store"].value_counts()
+    return [str(store) for store in store_counts[store_counts > 0].index]
+
+
+def store_metrics(deals, stores):
+    """
+    Deal count, discount and price metrics per store in a single grouped pass
+
+    Args:
+        deals: Deals with store, discount_pct and current_price
+        stores: Store names to include, in display order
+    """
+    filtered = deals[deals["store"].isin(stores)]
+    return (
+        filtered.groupby("store", observed=True)
+        .agg(
+            **{
+                "Deal Count": ("discount_pct", "size"),
+                "Avg Discount": ("discount_pct", "mean"),
+                "Max Discount": ("discount_pct", "max"),
+                "Avg Price": ("current_price", "mean"),
+            }
+        )
+        .reindex(stores)
+        .rename_axis("Store")
+        .reset_index()
+    )
+
+
+def deals_table(deals):
+    """Active Deals table with display-formatted columns, built column-wise"""
+    def column(name, default):
+        if name in deals.columns:
+            return deals[name]
+        return pd.Series(default, index=deals.index)
+
+    thumbs = column('thumbnail', '').astype(str)
+    return pd.DataFrame({
+        'Cover': thumbs.where(thumbs.str.startswith('http'), ''),
+        'Game Title': column('title', 'Unknown'),
+        'Current Price': column('current_price', 0).map('${:.2f}'.format),
+        'Retail Price': column('retail_price', 0).map('${:.2f}'.format),
+        'Discount %': column('discount_pct', 0).map('{:.1f}%'.format),
+        'Deal Rating': column('deal_rating', 0).map('{:.1f}/10'.format),
+        'Store': column('store', 'Unknown').astype(str),
+    })
@@ -0,0 +1,207 @@
+"""
+Aggregates Module
+Running, mergeable summary statistics over processed deal frames, so
+summaries can be built chunk by chunk without holding all rows, plus the
+persisted all-time totals and data file manifest behind the summary report
+"""
+
+import json
+import logging
+import math
+import os
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class RunningDealStats:
+    """Counts, sums, min/max and per-quality/per-store tallies updated per chunk"""
+
+    def __init__(self):
+        self.total_deals = 0
+        self.discount_count = 0
+        self.discount_sum = 0.0
+        self.discount_min: Optional[float] = None
+        self.discount_max: Optional[float] = None
+        self.quality_counts: Counter = Counter()
+        self.store_counts: Counter = Counter()
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> "RunningDealStats":
+        """Build stats for a single DataFrame"""
+        stats = cls()
+        stats.update(df)
+        return stats
+
+    def update(self, df: pd.DataFrame) -> None:
+        """
+        Fold one processed chunk into the running totals
+
+        Args:
+            df: Processed deals chunk
+        """
+        if df is None or df.empty:
+            return
+
+        self.total_deals += len(df)
+
+        if "discount_pct" in df.columns:
+            discount = df["discount_pct"].dropna().astype("float64")
+            if not discount.empty:
+                self.discount_count += len(discount)
+                self.discount_sum += float(discount.sum())
+                self._update_range(float(discount.min()), float(discount.max()))
+
+        if "deal_quality" in df.columns:
+            self.quality_counts.update(self._counts(df["deal_quality"]))
+
+        if "store" in df.columns:
+            self.store_counts.update(self._counts(df["store"]))
+
+    def merge(self, other: "RunningDealStats") -> None:
+        """
+        Combine another set of running stats into this one
+
+        Args:
+            other: Stats computed over a disjoint set of rows
+        """
+        self.total_deals += other.total_deals
+        self.discount_count += other.discount_count
+        self.discount_sum += other.discount_sum
+        if other.discount_count:
+            self._update_range(other.discount_min, other.discount_max)
+        self.quality_counts.update(other.quality_counts)
+        self.store_counts.update(other.store_counts)
+
+    def to_dict(self) -> dict:
+        """JSON-serializable snapshot of the running totals"""
+        return {
+            "total_deals": self.total_deals,
+            "discount_count": self.discount_count,
+            "discount_sum": self.discount_sum,
+            "discount_min": self.discount_min,
+            "discount_max": self.discount_max,
+            "quality_counts": dict(self.quality_counts),
+            "store_counts": dict(self.store_counts),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RunningDealStats":
+        """Rebuild running totals saved with to_dict"""
+        stats = cls()
+        stats.total_deals = int(data.get("total_deals", 0))
+        stats.discount_count = int(data.get("discount_count", 0))
+        stats.discount_sum = float(data.get("discount_sum", 0.0))
+        stats.discount_min = data.get("discount_min")
+        stats.discount_max = data.get("discount_max")
+        stats.quality_counts = Counter(data.get("quality_counts", {}))
+        stats.store_counts = Counter(data.get("store_counts", {}))
+        return stats
+
+    @property
+    def mean_discount(self) -> float:
+        """Average discount % over all rows seen (NaN if none)"""
+        if not self.discount_count:
+            return math.nan
+        return self.discount_sum / self.discount_count
+
+    def _update_range(self, low: float, high: float) -> None:
+        self.discount_min = low if self.discount_min is None else min(self.discount_min, low)
+        self.discount_max = high if self.discount_max is None else max(self.discount_max, high)
+
+    @staticmethod
+    def _counts(values: pd.Series) -> dict:
+        counts = values.value_counts()
+        return {str(key): int(count) for key, count in counts[counts > 0].items()}
+
+
+class AggregateState:
+    """All-time deal totals and data file manifest persisted between runs"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: JSON state file (loaded if it exists)
+        """
+        self.path = Path(path)
+        self.all_time = RunningDealStats()
+        self.runs = 0
+        self.last_run: Optional[str] = None
+        self.files: Dict[str, List[str]] = {}
+        self.exists = self.path.exists()
+
+        if self.exists:
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                self.all_time = RunningDealStats.from_dict(data.get("all_time", {}))
+                self.runs = int(data.get("runs", 0))
+                self.last_run = data.get("last_run")
+                self.files = {kind: list(names) for kind, names in data.get("files", {}).items()}
+            except (OSError, ValueError) as e:
+                logger.error(f"Error loading aggregate state from {self.path}: {e}")
+                self.exists = False
+
+    def record_run(self, stats: RunningDealStats) -> None:
+        """
+        Fold one run's stats into the all-time totals
+
+        Args:
+            stats: Stats over the rows processed by this run
+        """
+        self.all_time.merge(stats)
+        self.runs += 1
+        self.last_run = datetime.now().isoformat(timespec="seconds")
+
+    def record_file(self, kind: str, path: Path) -> None:
+        """
+        Add a data file to the manifest
+
+        Args:
+            kind: Manifest section, e.g. "raw" or "processed"
+            path: File written by the pipeline
+        """
+        names = self.files.setdefault(kind, [])
+        name = Path(path).name
+        if name not in names:
+            names.append(name)
+
+    def remove_file(self, kind: str, name: str) -> None:
+        """Drop a file name from a manifest section"""
+        names = self.files.get(kind, [])
+        if name in names:
+            names.remove(name)
+
+    def seed_files(self, kind: str, paths: Iterable[Path]) -> None:
+        """
+        Populate a manifest section from files written before the state existed
+
+        Args:
+            kind: Manifest section
+            paths: Existing files
+        """
+        for path in sorted(paths):
+            self.record_file(kind, path)
+
+    def file_count(self, kind: str) -> int:
+        """Number of manifest files of one kind"""
+        return len(self.files.get(kind, []))
+
+    def save(self) -> None:
+        """Write the state atomically (temporary file, then rename)"""
+        data = {
+            "runs": self.runs,
+            "last_run": self.last_run,
+            "all_time": self.all_time.to_dict(),
+            "files": self.files,
+        }
+        temp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        temp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(temp_path, self.path)
+        self.exists = True
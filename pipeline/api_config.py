@@ -4,7 +4,7 @@ Handles API endpoints for CheapShark and Game Pass pricing APIs
 """
 
 import os
-from typing import Dict
+from typing import Dict, Iterable, Optional
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -15,35 +15,129 @@ class APIConfig:
     """Centralized API configuration for game price tracking APIs"""
 
     # CheapShark API - No authentication required
-    CHEAPSHARK_BASE_URL = "https://www.cheapshark.com/api/1.0"
+    # (override to point at a local replay server, see replay.py)
+    CHEAPSHARK_BASE_URL = os.getenv("CHEAPSHARK_BASE_URL", "https://www.cheapshark.com/api/1.0")
+
+    # When set, every successful CheapShark response is saved here as a fixture
+    RECORD_FIXTURES_DIR = os.getenv("CHEAPSHARK_RECORD_DIR")
 
     # Game Pass API
     GAME_PASS_API_URL = "https://raw.githubusercontent.com/NikkelM/Game-Pass-API/main/data/gamePassData.json"
 
-    # Store IDs for CheapShark (PC platforms we care about)
+    # Fields identifying a game in the Game Pass catalog (first match wins)
+    GAME_PASS_TITLE_KEYS = ("productTitle", "title")
+    GAME_PASS_ID_KEYS = ("productId", "id")
+
+    # Top-level keys whose list holds the catalog records when the payload is
+    # an object rather than a bare list
+    GAME_PASS_LIST_KEYS = ("products", "Products", "games", "data")
+
+    # Flag deals for games already on Game Pass on each pipeline run
+    JOIN_GAME_PASS = True
+
+    # PC stores we care about: name -> storeID as listed by CheapShark's
+    # /stores endpoint (https://www.cheapshark.com/api/1.0/stores)
     STORES = {
         "Steam": 1,
-        "Epic Games Store": 6,
-        "GOG": 5,
-        "Humble Bundle": 12,
-        "Green Man Gaming": 10,
+        "Epic Games Store": 25,
+        "GOG": 7,
+        "Humble Store": 11,
+        "Green Man Gaming": 3,
     }
 
     # Number of deals to fetch (top-rated deals from CheapShark)
     MAX_DEALS = 100
 
+    # Fetch /deals once per store in STORES instead of one global query,
+    # keeping up to MAX_DEALS_PER_STORE deals from each
+    FETCH_DEALS_BY_STORE = False
+    MAX_DEALS_PER_STORE = 100
+
+    # Page size for paginated /deals requests (CheapShark allows at most 60)
+    DEALS_PAGE_SIZE = 60
+
+    # Maximum game IDs per batched /games request (CheapShark caps ids at 25)
+    MAX_GAME_IDS_PER_REQUEST = 25
+
+    # Fetch /games details for new or changed deals on each pipeline run
+    ENRICH_GAME_DETAILS = True
+
+    # Request throttling shared by all fetcher workers
+    REQUESTS_PER_SECOND = 2.0
+    RATE_LIMIT_BURST = 2
+
+    # Worker threads used for concurrent game detail fetching
+    MAX_CONCURRENT_REQUESTS = 4
+
+    # Keep-alive connection pool size per host
+    HTTP_POOL_SIZE = 10
+
+    # Retry policy for transient failures (connection errors, 429 and 5xx)
+    MAX_RETRIES = 4
+    RETRY_BACKOFF_BASE = 0.5  # seconds, doubled on each attempt
+    RETRY_BACKOFF_MAX = 30  # seconds, also caps honored Retry-After values
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    # On-disk response cache: freshness per endpoint (seconds) and size cap
+    CACHE_TTL_SECONDS = {
+        "deals": 10 * 60,
+        "games": 6 * 60 * 60,
+        "stores": 24 * 60 * 60,
+        "default": 60 * 60,
+    }
+    CACHE_MAX_BYTES = 200 * 1024 * 1024
+
+    # Price history dataset: game_id hash buckets per date partition
+    # (changing this only affects snapshots written afterwards)
+    HISTORY_BUCKETS = 16
+
+    # File format for raw and processed snapshots: "csv", "parquet" or "feather"
+    # (the columnar formats keep dtypes and support projection/filter pushdown)
+    STORAGE_FORMAT = os.getenv("PLAYSMART_STORAGE_FORMAT", "csv")
+
+    # Pipeline stages run at once, and how long a failed run's checkpoints stay resumable
+    MAX_CONCURRENT_STAGES = 4
+    CHECKPOINT_MAX_AGE_SECONDS = 6 * 60 * 60
+
+    # Daemon mode (pipeline.py --daemon): seconds between runs and random +/- spread
+    DAEMON_INTERVAL_SECONDS = 60 * 60
+    DAEMON_JITTER_SECONDS = 2 * 60
+
+    # Processed snapshots kept as files; older ones are compacted into price history
+    SNAPSHOT_RETENTION = 10
+
     @staticmethod
-    def get_deals_endpoint_params() -> Dict[str, str]:
+    def get_deals_endpoint_params(
+        page_number: Optional[int] = None,
+        page_size: Optional[int] = None,
+        store_id: Optional[int] = None,
+    ) -> Dict[str, str]:
         """
         Build parameters for CheapShark deals endpoint
 
+        Args:
+            page_number: Zero-based page to request (None for a single capped request)
+            page_size: Deals per page (defaults to DEALS_PAGE_SIZE)
+            store_id: Restrict results to one CheapShark store
+
         Returns:
             Dictionary of query parameters
         """
-        return {
-            "sortBy": "Savings",
-            "limit": str(APIConfig.MAX_DEALS),
-        }
+        if page_number is None:
+            params = {
+                "sortBy": "Savings",
+                "limit": str(APIConfig.MAX_DEALS),
+            }
+        else:
+            params = {
+                "sortBy": "Savings",
+                "pageNumber": str(page_number),
+                "pageSize": str(page_size or APIConfig.DEALS_PAGE_SIZE),
+            }
+
+        if store_id is not None:
+            params["storeID"] = str(store_id)
+        return params
 
     @staticmethod
     def get_game_endpoint_params(game_id: int) -> Dict[str, str]:
@@ -58,6 +152,19 @@ class APIConfig:
         """
         return {"id": str(game_id)}
 
+    @staticmethod
+    def get_games_batch_params(game_ids: Iterable) -> Dict[str, str]:
+        """
+        Build parameters for a multi-game CheapShark games lookup
+
+        Args:
+            game_ids: CheapShark game IDs (at most MAX_GAME_IDS_PER_REQUEST)
+
+        Returns:
+            Dictionary of query parameters
+        """
+        return {"ids": ",".join(str(game_id) for game_id in game_ids)}
+
     @staticmethod
     def validate_config() -> bool:
         """
@@ -0,0 +1,233 @@
+"""
+Backfill Script
+Re-transforms the raw_data/deals_raw_* archive (CSV, Parquet or Feather)
+in parallel after a change to transform logic
+
+Usage: python pipeline/backfill.py --workers 4 [--force]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+# Add pipeline directory to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from storage import read_raw_deals, snapshot_files, snapshot_time, write_deals
+from transform import GameDataTransformer
+from validation import DealValidator, write_quarantine
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+)
+logger = logging.getLogger(__name__)
+
+
+def backfill_file(
+    raw_file: str,
+    output_file: str,
+    stores: Optional[pd.DataFrame] = None,
+    quarantine_file: Optional[str] = None,
+) -> dict:
+    """
+    Validate, transform and write one raw snapshot atomically (runs in a worker process)
+
+    Rows failing DealValidator rules are quarantined exactly as in the live
+    pipeline. The output is written to a temporary name and renamed into
+    place, so an interrupted run never leaves a partial file behind.
+
+    Args:
+        raw_file: Raw snapshot path
+        output_file: Processed output path
+        stores: Store catalog used to name each deal's store, if available
+        quarantine_file: CSV receiving rejected rows (replaced on each run)
+
+    Returns:
+        Dictionary with file, rows_in, rows_out, quarantined, reasons and seconds
+    """
+    start = time.perf_counter()
+    raw_path, output_path = Path(raw_file), Path(output_file)
+
+    raw = read_raw_deals(raw_path)
+    result = DealValidator.validate(raw)
+    DealValidator.log_counts(result)
+    if quarantine_file is not None:
+        # A rerun (--force) replaces the snapshot's quarantine instead of appending to it
+        Path(quarantine_file).unlink(missing_ok=True)
+        write_quarantine(result.rejected, Path(quarantine_file))
+
+    transformed = GameDataTransformer.transform_deals_data_fused(
+        result.valid, sort=True, fetched_at=snapshot_time(raw_path)
+    )
+    if stores is not None and "store_id" in transformed.columns:
+        transformed = GameDataTransformer.attach_store_names(transformed, stores)
+
+    # Keep the extension last so write_deals picks the output format
+    temp_path = output_path.with_name(f".{output_path.stem}.{os.getpid()}.tmp{output_path.suffix}")
+    write_deals(transformed, temp_path)
+    os.replace(temp_path, output_path)
+
+    return {
+        "file": raw_path.name,
+        "rows_in": len(raw),
+        "rows_out": len(transformed),
+        "quarantined": len(result.rejected),
+        "reasons": dict(result.counts),
+        "seconds": time.perf_counter() - start,
+    }
+
+
+class BackfillRunner:
+    """Fans raw snapshots out over a process pool and reports throughput"""
+
+    def __init__(
+        self,
+        raw_dir: Optional[Path] = None,
+        output_dir: Optional[Path] = None,
+        workers: Optional[int] = None,
+        force: bool = False,
+        quarantine_dir: Optional[Path] = None,
+    ):
+        """
+        Args:
+            raw_dir: Directory of deals_raw_* snapshots (defaults to raw_data/)
+            output_dir: Destination directory (defaults to processed_data/backfill/)
+            workers: Worker processes (defaults to the CPU count)
+            force: Reprocess snapshots that already have an output
+            quarantine_dir: Directory for rejected rows (defaults to quarantine/backfill/)
+        """
+        base_dir = Path(__file__).parent.parent
+        self.raw_dir = Path(raw_dir) if raw_dir else base_dir / "raw_data"
+        self.output_dir = Path(output_dir) if output_dir else base_dir / "processed_data" / "backfill"
+        self.quarantine_dir = Path(quarantine_dir) if quarantine_dir else base_dir / "quarantine" / "backfill"
+        self.workers = workers or os.cpu_count() or 1
+        self.force = force
+
+        stores_file = base_dir / "processed_data" / "stores.csv"
+        self.stores = pd.read_csv(stores_file) if stores_file.exists() else None
+
+    def output_for(self, raw_file: Path) -> Path:
+        """Processed output path for a raw snapshot (same format as the input)"""
+        return self.output_dir / raw_file.name.replace("deals_raw_", "deals_processed_", 1)
+
+    def quarantine_for(self, raw_file: Path) -> Path:
+        """Quarantine CSV for a raw snapshot's rejected rows"""
+        return self.quarantine_dir / f"{raw_file.stem.replace('deals_raw_', 'deals_quarantine_', 1)}.csv"
+
+    def pending_files(self) -> List[Path]:
+        """
+        Raw snapshots still to process
+
+        Snapshots with an existing output are skipped unless force is set,
+        which is what lets an interrupted backfill resume.
+
+        Returns:
+            Sorted list of raw snapshot paths
+        """
+        raw_files = sorted(snapshot_files(self.raw_dir, "deals_raw_"))
+        if self.force:
+            return raw_files
+        return [path for path in raw_files if not self.output_for(path).exists()]
+
+    def run(self) -> dict:
+        """
+        Process every pending snapshot
+
+        Returns:
+            Throughput report with files, rows, failures, seconds,
+            files_per_sec and rows_per_sec
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+
+        pending = self.pending_files()
+        total_files = len(snapshot_files(self.raw_dir, "deals_raw_"))
+        logger.info(
+            f"Backfilling {len(pending)} of {total_files} raw snapshots "
+            f"with {self.workers} workers into {self.output_dir}"
+        )
+
+        start = time.perf_counter()
+        done, rows_in, rows_out, failures = 0, 0, 0, []
+        quarantined, reasons = 0, Counter()
+
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(
+                    backfill_file,
+                    str(path),
+                    str(self.output_for(path)),
+                    self.stores,
+                    str(self.quarantine_for(path)),
+                ): path
+                for path in pending
+            }
+
+            for future in as_completed(futures):
+                path = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Error backfilling {path.name}: {e}")
+                    failures.append(path.name)
+                    continue
+
+                done += 1
+                rows_in += result["rows_in"]
+                rows_out += result["rows_out"]
+                quarantined += result["quarantined"]
+                reasons.update(result["reasons"])
+                logger.info(
+                    f"[{done}/{len(pending)}] {result['file']}: "
+                    f"{result['rows_out']}/{result['rows_in']} rows "
+                    f"({result['quarantined']} quarantined) in {result['seconds']:.2f}s"
+                )
+
+        elapsed = time.perf_counter() - start
+        report = {
+            "files": done,
+            "skipped": total_files - len(pending),
+            "failures": failures,
+            "rows_in": rows_in,
+            "rows_out": rows_out,
+            "quarantined": quarantined,
+            "reject_reasons": dict(reasons.most_common()),
+            "seconds": round(elapsed, 3),
+            "files_per_sec": round(done / elapsed, 2) if elapsed else 0.0,
+            "rows_per_sec": round(rows_in / elapsed, 1) if elapsed else 0.0,
+        }
+
+        logger.info(
+            f"Backfill complete: {done} files, {rows_in} rows in {elapsed:.1f}s "
+            f"({report['files_per_sec']} files/sec, {report['rows_per_sec']} rows/sec); "
+            f"{report['skipped']} already done, {len(failures)} failed"
+        )
+        if quarantined:
+            logger.info(f"Quarantined {quarantined} rows to {self.quarantine_dir}: {report['reject_reasons']}")
+        return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Re-transform the raw deals archive in parallel")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--raw-dir", type=Path, help="Raw snapshot directory")
+    parser.add_argument("--output-dir", type=Path, help="Destination directory")
+    parser.add_argument("--force", action="store_true", help="Reprocess snapshots already backfilled")
+    parser.add_argument("--quarantine-dir", type=Path, help="Directory for rows failing validation")
+    args = parser.parse_args()
+
+    report = BackfillRunner(args.raw_dir, args.output_dir, args.workers, args.force, args.quarantine_dir).run()
+    return 1 if report["failures"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
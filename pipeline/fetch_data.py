@@ -5,25 +5,401 @@ Fetches game price data from CheapShark API and Game Pass API
 
 import requests
 import pandas as pd
+import codecs
+import io
+import itertools
+import json
 import logging
+import random
+import re
+import threading
 import time
-from typing import Optional, List
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Sequence, Tuple
 from api_config import APIConfig
+from metrics import METRICS, instrumented
+from http_cache import CachedResponse, ResponseCache
+from replay import FixtureRecorder
+from transform import normalize_title
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket:
+    """Thread-safe token bucket limiting request rate across all workers"""
+
+    def __init__(self, rate: float, capacity: float = 1):
+        """
+        Initialize the bucket full
+
+        Args:
+            rate: Tokens added per second (sustained requests per second)
+            capacity: Maximum tokens held, i.e. the allowed burst size
+        """
+        self.rate = rate
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class JsonRecordScanner:
+    """
+    Incrementally extracts title-bearing records from a streamed JSON document
+
+    Text is fed in arbitrary chunks. Records are the objects directly inside
+    the top-level list, or inside a list stored under one of list_keys on
+    the top-level object; objects nested within a record (publisher, images)
+    are never matched. Only the record currently open is buffered, so memory
+    stays proportional to one record rather than to the document size.
+    """
+
+    _STRUCTURE = re.compile(r'[{}\[\]"]')
+    _STRING_END = re.compile(r'["\\]')
+
+    # Longest key kept while looking for list_keys outside records
+    _MAX_KEY_LENGTH = 256
+
+    def __init__(
+        self,
+        title_keys: Sequence[str],
+        id_keys: Sequence[str] = (),
+        list_keys: Sequence[str] = (),
+    ):
+        """
+        Args:
+            title_keys: Keys identifying a record's title (first match wins)
+            id_keys: Keys identifying a record's ID (first match wins)
+            list_keys: Top-level object keys whose list holds the records
+        """
+        self.title_keys = title_keys
+        self.id_keys = id_keys
+        self.list_keys = set(list_keys)
+        self._buffer = io.StringIO()
+        # Open containers: (bracket, whether a list's elements are records)
+        self._stack: List[Tuple[str, bool]] = []
+        self._record_depth: Optional[int] = None  # stack depth of the open record
+        self._key = ""  # string being read outside records
+        self._last_key: Optional[str] = None
+        self._in_string = False
+        self._escaped = False
+
+    def _write(self, text: str) -> None:
+        if self._record_depth is not None:
+            self._buffer.write(text)
+        elif self._in_string and len(self._key) < self._MAX_KEY_LENGTH:
+            self._key += text[: self._MAX_KEY_LENGTH - len(self._key)]
+
+    def _close_record(self, records: List[Tuple[str, Optional[str]]]) -> None:
+        try:
+            obj = json.loads(self._buffer.getvalue())
+        except ValueError:
+            obj = None
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self._record_depth = None
+
+        if not isinstance(obj, dict):
+            return
+        title = next((obj[key] for key in self.title_keys if obj.get(key)), None)
+        if title is not None:
+            product_id = next((obj[key] for key in self.id_keys if obj.get(key)), None)
+            records.append((str(title), None if product_id is None else str(product_id)))
+
+    def _open_list(self) -> None:
+        if self._record_depth is not None:
+            is_records = False
+        elif not self._stack:
+            is_records = True
+        else:
+            is_records = len(self._stack) == 1 and self._stack[0][0] == "{" and self._last_key in self.list_keys
+        self._stack.append(("[", is_records))
+
+    def feed(self, text: str) -> List[Tuple[str, Optional[str]]]:
+        """
+        Consume the next chunk of the document
+
+        Args:
+            text: Decoded text chunk
+
+        Returns:
+            (title, id) pairs for records completed within this chunk
+        """
+        records: List[Tuple[str, Optional[str]]] = []
+        pos, end = 0, len(text)
+
+        while pos < end:
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                    self._write(text[pos])
+                    pos += 1
+                    continue
+
+                match = self._STRING_END.search(text, pos)
+                if match is None:
+                    self._write(text[pos:])
+                    break
+
+                if match.group() == '"':
+                    self._write(text[pos:match.start()])
+                    self._in_string = False
+                    if self._record_depth is None:
+                        self._last_key = self._key
+                    else:
+                        self._buffer.write('"')
+                else:
+                    self._write(text[pos:match.end()])
+                    self._escaped = True
+                pos = match.end()
+                continue
+
+            match = self._STRUCTURE.search(text, pos)
+            if match is None:
+                self._write(text[pos:])
+                break
+
+            self._write(text[pos:match.start()])
+            char = match.group()
+            pos = match.end()
+
+            if char == '"':
+                self._write(char)
+                self._in_string = True
+                self._key = ""
+            elif char == "{":
+                if self._record_depth is None and self._stack and self._stack[-1] == ("[", True):
+                    self._record_depth = len(self._stack)
+                self._write(char)
+                self._stack.append(("{", False))
+            elif char == "[":
+                self._write(char)
+                self._open_list()
+            elif self._stack:
+                self._write(char)
+                self._stack.pop()
+                if char == "}" and self._record_depth == len(self._stack):
+                    self._close_record(records)
+
+        return records
+
+
+def _store_key(name: str) -> str:
+    """Lowercase letters and digits of a store name, so "GreenManGaming" matches "Green Man Gaming" too"""
+    return normalize_title(name).replace(" ", "")
+
+
 class GamePriceFetcher:
     """Fetches game price data from CheapShark and Game Pass APIs"""
 
-    def __init__(self):
-        """Initialize fetcher with rate limiting"""
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        pool_size: Optional[int] = None,
+        cache: Optional[ResponseCache] = None,
+        recorder: Optional[FixtureRecorder] = None,
+    ):
+        """
+        Initialize fetcher with a pooled HTTP session and rate limiting
+
+        Args:
+            max_workers: Worker threads for concurrent detail fetching
+            requests_per_second: Request rate enforced across all workers
+            pool_size: Keep-alive connections kept open per host
+            cache: Optional persistent response cache
+            recorder: Optional fixture recorder capturing responses for replay
+        """
         self.cheapshark_url = APIConfig.CHEAPSHARK_BASE_URL
-        self.rate_limit_delay = 0.5  # seconds between requests
         self.timeout = 10  # seconds
+        self.max_workers = max_workers or APIConfig.MAX_CONCURRENT_REQUESTS
+        self.rate_limiter = TokenBucket(
+            requests_per_second or APIConfig.REQUESTS_PER_SECOND,
+            APIConfig.RATE_LIMIT_BURST,
+        )
+
+        # One keep-alive session reused by every request and worker thread
+        pool_size = pool_size or max(APIConfig.HTTP_POOL_SIZE, self.max_workers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.cache = cache
+        self.recorder = recorder
+
+        # Retry accounting per endpoint
+        self.retry_counts: Counter = Counter()
+        self.retry_wait_seconds: Dict[str, float] = defaultdict(float)
+        self._stats_lock = threading.Lock()
+
+        # Game ID -> error message for the last fetch_multiple_game_details call
+        self.failed_game_ids: Dict[str, str] = {}
+
+        # Store ID -> error message for shards of the last fetch_deals_by_store call
+        self.failed_store_ids: Dict[int, str] = {}
+
+    def close(self) -> None:
+        """Close the pooled HTTP session and the response cache"""
+        self.session.close()
+        if self.cache:
+            self.cache.close()
+
+    def __enter__(self) -> "GamePriceFetcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @staticmethod
+    def _retry_delay(response: Optional[requests.Response], attempt: int) -> float:
+        """
+        Seconds to wait before the next attempt
 
+        Honors a Retry-After header (seconds or HTTP date) when present,
+        otherwise uses exponential backoff with full jitter.
+
+        Args:
+            response: Failed response, or None for a connection error
+            attempt: Zero-based attempt number that just failed
+
+        Returns:
+            Delay in seconds, capped at APIConfig.RETRY_BACKOFF_MAX
+        """
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    retry_at = parsedate_to_datetime(retry_after)
+                    delay = retry_at.timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0.0), APIConfig.RETRY_BACKOFF_MAX)
+
+        backoff = min(APIConfig.RETRY_BACKOFF_MAX, APIConfig.RETRY_BACKOFF_BASE * 2 ** attempt)
+        return random.uniform(0, backoff)
+
+    def _record_retry(self, endpoint: str, delay: float) -> None:
+        """Count one retry and its wait time against an endpoint"""
+        with self._stats_lock:
+            self.retry_counts[endpoint] += 1
+            self.retry_wait_seconds[endpoint] += delay
+        METRICS.count_retry(endpoint)
+
+    def _get_json(self, endpoint: str, params: Dict[str, str], revalidate: bool = False) -> Any:
+        """
+        Issue a rate-limited GET against a CheapShark endpoint
+
+        Fresh cached responses are served without a request; stale ones are
+        revalidated with a conditional request. With a recorder attached,
+        responses served from the cache are recorded too. Transient failures
+        (connection errors, timeouts, 429 and 5xx) are retried up to
+        APIConfig.MAX_RETRIES times.
+
+        Args:
+            endpoint: Endpoint path relative to the base URL (e.g. "deals")
+            params: Query parameters
+            revalidate: Send a conditional request even when the cached
+                response is still within its TTL
+
+        Returns:
+            Decoded JSON payload
+
+        Raises:
+            requests.RequestException: If the request fails after all retries
+        """
+        url = f"{self.cheapshark_url}/{endpoint}"
+
+        cached = self.cache.lookup(url, params) if self.cache else None
+        if cached is not None and not revalidate and self.cache.is_fresh(cached, endpoint):
+            self.cache.record_hit()
+            return self._cached_payload(endpoint, params, cached)
+        headers = cached.conditional_headers() if cached is not None else {}
+
+        for attempt in range(APIConfig.MAX_RETRIES + 1):
+            self.rate_limiter.acquire()
+            retries_left = attempt < APIConfig.MAX_RETRIES
+
+            start = time.perf_counter()
+            try:
+                response = self.session.get(
+                    url, params=params, headers=headers, timeout=self.timeout
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                METRICS.observe_http(endpoint, time.perf_counter() - start, None)
+                if not retries_left:
+                    raise
+                delay = self._retry_delay(None, attempt)
+                logger.warning(f"{endpoint}: {e}; retrying in {delay:.1f}s")
+            else:
+                METRICS.observe_http(endpoint, time.perf_counter() - start, response.status_code)
+                if response.status_code == 304 and cached is not None:
+                    self.cache.mark_revalidated(cached)
+                    return self._cached_payload(endpoint, params, cached)
+                if response.status_code not in APIConfig.RETRY_STATUS_CODES or not retries_left:
+                    response.raise_for_status()
+                    if self.cache:
+                        self.cache.store(url, params, response)
+                    if self.recorder:
+                        self.recorder.record(endpoint, params, response)
+                    return response.json()
+                delay = self._retry_delay(response, attempt)
+                logger.warning(
+                    f"{endpoint}: HTTP {response.status_code}; retrying in {delay:.1f}s"
+                )
+
+            self._record_retry(endpoint, delay)
+            time.sleep(delay)
+
+    def _cached_payload(self, endpoint: str, params: Dict[str, str], cached: CachedResponse) -> Any:
+        """Decode a cached response, recording it as a fixture in record mode"""
+        payload = cached.payload()
+        if self.recorder:
+            self.recorder.record_payload(endpoint, params, payload, cached.validators())
+        return payload
+
+    def retry_summary(self) -> Dict[str, dict]:
+        """
+        Retry counts and total backoff time per endpoint
+
+        Returns:
+            Dictionary mapping endpoint to {"retries": int, "wait_seconds": float}
+        """
+        with self._stats_lock:
+            return {
+                endpoint: {
+                    "retries": count,
+                    "wait_seconds": round(self.retry_wait_seconds[endpoint], 2),
+                }
+                for endpoint, count in self.retry_counts.items()
+            }
+
+    @instrumented("fetch.fetch_deals")
     def fetch_deals(self) -> Optional[pd.DataFrame]:
         """
         Fetch current game deals from CheapShark
@@ -33,13 +409,9 @@ class GamePriceFetcher:
         """
         try:
             logger.info("Fetching game deals from CheapShark...")
-            url = f"{self.cheapshark_url}/deals"
             params = APIConfig.get_deals_endpoint_params()
 
-            response = requests.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-
-            deals = response.json()
+            deals = self._get_json("deals", params)
             if not deals:
                 logger.warning("No deals returned from API")
                 return None
@@ -56,6 +428,199 @@ class GamePriceFetcher:
             logger.error(f"Unexpected error fetching deals: {e}")
             return None
 
+    def iter_deal_pages(
+        self,
+        max_rows: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        page_size: Optional[int] = None,
+        store_id: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream the CheapShark deals catalog one page at a time
+
+        Only the current page is held in memory, so callers can process
+        arbitrarily large catalogs as the pages arrive. Iteration stops at
+        the end of the catalog or when a budget is hit; a page that still
+        fails after retries raises, so a truncated catalog is never mistaken
+        for a complete one.
+
+        Args:
+            max_rows: Stop after yielding this many deals in total
+            max_pages: Stop after requesting this many pages
+            page_size: Deals per page (defaults to APIConfig.DEALS_PAGE_SIZE)
+            store_id: Restrict the stream to one CheapShark store
+
+        Yields:
+            DataFrame chunk per page
+
+        Raises:
+            requests.RequestException: If a page fails after all retries
+        """
+        page_size = page_size or APIConfig.DEALS_PAGE_SIZE
+        rows_yielded = 0
+        page_number = 0
+        source = "CheapShark" if store_id is None else f"CheapShark store {store_id}"
+
+        logger.info(f"Streaming game deals from {source}...")
+
+        while max_pages is None or page_number < max_pages:
+            if max_rows is not None and rows_yielded >= max_rows:
+                break
+
+            params = APIConfig.get_deals_endpoint_params(page_number, page_size, store_id)
+            try:
+                deals = self._get_json("deals", params)
+            except requests.RequestException as e:
+                logger.error(f"Error fetching deals page {page_number} from {source}: {e}")
+                raise
+
+            if not deals:
+                break
+
+            if max_rows is not None:
+                deals = deals[: max_rows - rows_yielded]
+
+            rows_yielded += len(deals)
+            page_number += 1
+            yield pd.DataFrame(deals)
+
+            # A short page means the catalog is exhausted
+            if len(deals) < page_size:
+                break
+
+        logger.info(f"Streamed {rows_yielded} deals across {page_number} pages from {source}")
+
+    @instrumented("fetch.fetch_deals_by_store")
+    def fetch_deals_by_store(
+        self,
+        store_ids: Optional[List[int]] = None,
+        max_rows_per_store: Optional[int] = None,
+        max_pages_per_store: Optional[int] = None,
+    ) -> Optional[pd.DataFrame]:
+        """
+        Fetch deals with one paginated shard per store, all shards in parallel
+
+        Every shard shares this fetcher's rate limiter, so the combined
+        request rate stays within budget while total time tracks the
+        slowest store rather than the sum of all stores. Shards that fail
+        are skipped and listed in self.failed_store_ids.
+
+        Args:
+            store_ids: CheapShark store IDs (defaults to APIConfig.STORES,
+                resolved by name against the store catalog)
+            max_rows_per_store: Deal budget per store (defaults to APIConfig.MAX_DEALS_PER_STORE)
+            max_pages_per_store: Page budget per store
+
+        Returns:
+            Deduplicated DataFrame of deals across stores or None if nothing was fetched
+        """
+        store_ids = list(store_ids or self.resolve_store_ids().values())
+        max_rows = max_rows_per_store or APIConfig.MAX_DEALS_PER_STORE
+        self.failed_store_ids = {}
+
+        def fetch_shard(store_id: int) -> Optional[pd.DataFrame]:
+            try:
+                pages = list(self.iter_deal_pages(max_rows, max_pages_per_store, store_id=store_id))
+            except Exception as e:
+                logger.error(f"Error fetching deals for store {store_id}: {e}")
+                self.failed_store_ids[store_id] = str(e)
+                return None
+            return pd.concat(pages, ignore_index=True) if pages else None
+
+        logger.info(f"Fetching game deals from {len(store_ids)} stores in parallel...")
+        with ThreadPoolExecutor(max_workers=max(1, len(store_ids))) as executor:
+            shards = list(executor.map(fetch_shard, store_ids))
+
+        for store_id, shard in zip(store_ids, shards):
+            count = 0 if shard is None else len(shard)
+            logger.info(f"Store {store_id}: {count} deals")
+        if self.failed_store_ids:
+            logger.warning(
+                f"Failed to fetch {len(self.failed_store_ids)}/{len(store_ids)} stores: "
+                f"{', '.join(map(str, self.failed_store_ids))}"
+            )
+
+        shards = [shard for shard in shards if shard is not None and not shard.empty]
+        if not shards:
+            logger.warning("No deals returned from any store")
+            return None
+
+        df = pd.concat(shards, ignore_index=True)
+        if "dealID" in df.columns:
+            df = df.drop_duplicates(subset="dealID", ignore_index=True)
+
+        logger.info(f"Successfully fetched {len(df)} deals across {len(shards)} stores")
+        return df
+
+    def resolve_store_ids(self, names: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Look up CheapShark store IDs by store name in the (cached) store catalog
+
+        Names are matched ignoring case, spaces and punctuation. Names the
+        catalog does not list, or every name when it is unavailable, fall
+        back to the IDs in APIConfig.STORES.
+
+        Args:
+            names: Store names (defaults to the keys of APIConfig.STORES)
+
+        Returns:
+            Dictionary mapping each name to its store ID
+        """
+        names = list(names or APIConfig.STORES)
+        catalog = self.fetch_stores()
+        by_name = {}
+        if catalog is not None:
+            by_name = dict(zip(catalog["store_name"].map(_store_key), catalog["store_id"].astype(int)))
+
+        resolved = {}
+        for name in names:
+            store_id = by_name.get(_store_key(name))
+            if store_id is None:
+                if catalog is not None:
+                    logger.warning(f"Store {name!r} is not in the store catalog; using its configured ID")
+                store_id = APIConfig.STORES.get(name)
+            if store_id is None:
+                logger.warning(f"Unknown store {name!r}; skipping")
+                continue
+            resolved[name] = int(store_id)
+        return resolved
+
+    @instrumented("fetch.fetch_stores")
+    def fetch_stores(self) -> Optional[pd.DataFrame]:
+        """
+        Fetch the CheapShark store catalog
+
+        Served from the response cache while within the "stores" TTL.
+
+        Returns:
+            DataFrame with store_id, store_name and is_active columns or None if failed
+        """
+        try:
+            stores = self._get_json("stores", {})
+            if not stores:
+                logger.warning("No stores returned from API")
+                return None
+
+            df = pd.DataFrame(stores)
+            df = pd.DataFrame({
+                "store_id": pd.to_numeric(df["storeID"], errors="coerce").astype("Int64"),
+                "store_name": df["storeName"],
+                "is_active": (
+                    df["isActive"].astype(int).astype(bool) if "isActive" in df.columns else True
+                ),
+            }).dropna(subset=["store_id"])
+
+            logger.info(f"Fetched {len(df)} stores")
+            return df
+
+        except requests.RequestException as e:
+            logger.error(f"Error fetching stores: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error fetching stores: {e}")
+            return None
+
+    @instrumented("fetch.fetch_game_detail")
     def fetch_game_detail(self, game_id: str) -> Optional[dict]:
         """
         Fetch detailed information for a specific game including price history
@@ -67,16 +632,8 @@ class GamePriceFetcher:
             Dictionary with game details or None if failed
         """
         try:
-            time.sleep(self.rate_limit_delay)  # Rate limiting
-
-            url = f"{self.cheapshark_url}/games"
             params = APIConfig.get_game_endpoint_params(int(game_id))
-
-            response = requests.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-
-            game_data = response.json()
-            return game_data
+            return self._get_json("games", params)
 
         except requests.RequestException as e:
             logger.error(f"Error fetching game {game_id}: {e}")
@@ -85,9 +642,12 @@ class GamePriceFetcher:
             logger.error(f"Unexpected error fetching game {game_id}: {e}")
             return None
 
+    @instrumented("fetch.fetch_price_history")
     def fetch_price_history(self, game_id: str) -> Optional[pd.DataFrame]:
         """
-        Fetch price history for a specific game
+        Fetch the current per-store prices for a specific game
+
+        Prices across runs are kept by PriceHistoryStore (see game_history).
 
         Args:
             game_id: CheapShark game ID
@@ -123,34 +683,241 @@ class GamePriceFetcher:
             logger.error(f"Error fetching price history for game {game_id}: {e}")
             return None
 
-    def fetch_multiple_game_details(self, game_ids: List[str]) -> pd.DataFrame:
+    @instrumented("fetch.fetch_game_pass_catalog")
+    def fetch_game_pass_catalog(self) -> Optional[Dict[str, str]]:
+        """
+        Stream the Game Pass catalog into a compact title lookup
+
+        The payload is parsed incrementally as it downloads, so the raw
+        document is never held in memory as a whole.
+
+        Returns:
+            Dictionary mapping normalized title to Game Pass product ID
+            (or the raw title when no ID is present), or None if failed
+        """
+        try:
+            logger.info("Streaming Game Pass catalog...")
+            scanner = JsonRecordScanner(
+                APIConfig.GAME_PASS_TITLE_KEYS, APIConfig.GAME_PASS_ID_KEYS, APIConfig.GAME_PASS_LIST_KEYS
+            )
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            lookup: Dict[str, str] = {}
+
+            with self.session.get(
+                APIConfig.GAME_PASS_API_URL, stream=True, timeout=self.timeout
+            ) as response:
+                response.raise_for_status()
+                # A trailing None flushes the decoder so the last record is not lost
+                for chunk in itertools.chain(response.iter_content(chunk_size=64 * 1024), [None]):
+                    text = decoder.decode(b"", final=True) if chunk is None else decoder.decode(chunk)
+                    for title, product_id in scanner.feed(text):
+                        key = normalize_title(title)
+                        if key:
+                            lookup.setdefault(key, product_id or title)
+
+            logger.info(f"Loaded {len(lookup)} Game Pass titles")
+            return lookup
+
+        except requests.RequestException as e:
+            logger.error(f"Error fetching Game Pass catalog: {e}")
+            return None
+        except Exception as e:
+            logger.error(f"Unexpected error fetching Game Pass catalog: {e}")
+            return None
+
+    @staticmethod
+    def _summarize_game(game_id: str, game_data: dict) -> dict:
+        """
+        Extract the key fields of a /games payload, using its first deal
+
+        Args:
+            game_id: CheapShark game ID
+            game_data: Decoded /games response for that ID
+
+        Returns:
+            Flat dictionary of game details
+        """
+        info = game_data.get("info", {})
+        deals = game_data.get("deals") or []
+        first_deal = deals[0] if deals else {}
+
+        return {
+            "game_id": game_id,
+            "title": info.get("title", "Unknown"),
+            "thumb": info.get("thumb", ""),
+            "current_price": first_deal.get("price"),
+            "retail_price": first_deal.get("retailPrice"),
+            "discount_percent": first_deal.get("savings"),
+            "deal_rating": first_deal.get("dealRating"),
+            "store_id": first_deal.get("storeID"),
+        }
+
+    def _fetch_game_summary(
+        self, index: int, game_id: str, total: int, revalidate: bool = False
+    ) -> Optional[dict]:
+        """
+        Fetch and summarize one game, recording failures instead of raising
+
+        Args:
+            index: Position of the game in the batch (for progress logging)
+            game_id: CheapShark game ID
+            total: Batch size
+            revalidate: Bypass a fresh cached response (the game's deals changed)
+
+        Returns:
+            Game summary dictionary or None if the fetch failed
+        """
+        logger.info(f"Fetching details for game {index + 1}/{total} (ID: {game_id})...")
+
+        try:
+            game_data = self._get_json(
+                "games", APIConfig.get_game_endpoint_params(int(game_id)), revalidate=revalidate
+            )
+        except Exception as e:
+            logger.error(f"Error fetching game {game_id}: {e}")
+            self.failed_game_ids[game_id] = str(e)
+            return None
+
+        if not game_data:
+            self.failed_game_ids[game_id] = "No data returned"
+            return None
+
+        return self._summarize_game(game_id, game_data)
+
+    @instrumented("fetch.fetch_game_details_batch")
+    def fetch_game_details_batch(self, game_ids: List[str], revalidate: bool = False) -> Dict[str, dict]:
+        """
+        Fetch details for up to MAX_GAME_IDS_PER_REQUEST games in one request
+
+        The batch URL is the cache key, so a batch holding a game whose deals
+        changed must revalidate: its fresh cached body predates the change.
+
+        Args:
+            game_ids: CheapShark game IDs
+            revalidate: Bypass a fresh cached response with a conditional request
+
+        Returns:
+            Dictionary mapping each returned game ID to its /games payload
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        payload = self._get_json("games", APIConfig.get_games_batch_params(game_ids), revalidate=revalidate)
+
+        # The multi-ID endpoint answers with an object keyed by game ID, or an
+        # empty list when none of the IDs are known
+        if not isinstance(payload, dict):
+            return {}
+        return {str(game_id): data for game_id, data in payload.items() if data}
+
+    def _fetch_batch_summaries(
+        self, index: int, batch: List[str], total: int, revalidate: bool = False
+    ) -> List[Optional[dict]]:
+        """
+        Fetch and summarize one batch of games, recording failures instead of raising
+
+        Args:
+            index: Position of the batch (for progress logging)
+            batch: CheapShark game IDs in this batch
+            total: Number of batches
+            revalidate: Bypass a fresh cached response for this batch
+
+        Returns:
+            Game summaries in batch order, None for IDs that failed
+        """
+        logger.info(f"Fetching details for batch {index + 1}/{total} ({len(batch)} games)...")
+
+        try:
+            games = self.fetch_game_details_batch(batch, revalidate=revalidate)
+        except Exception as e:
+            logger.error(f"Error fetching game batch {index + 1}: {e}")
+            for game_id in batch:
+                self.failed_game_ids[game_id] = str(e)
+            return [None] * len(batch)
+
+        summaries = []
+        for game_id in batch:
+            game_data = games.get(str(game_id))
+            if game_data:
+                summaries.append(self._summarize_game(game_id, game_data))
+            else:
+                self.failed_game_ids[game_id] = "No data returned"
+                summaries.append(None)
+        return summaries
+
+    @instrumented("fetch.fetch_multiple_game_details")
+    def fetch_multiple_game_details(
+        self,
+        game_ids: List[str],
+        max_workers: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        revalidate_ids: Optional[Iterable[str]] = None,
+    ) -> pd.DataFrame:
         """
         Fetch detailed information for multiple games
 
+        IDs are packed into multi-ID /games requests, which run on a thread
+        pool sharing one rate limiter. Results keep the order of game_ids;
+        IDs that fail are skipped and listed in self.failed_game_ids.
+
         Args:
             game_ids: List of CheapShark game IDs
+            max_workers: Concurrency limit (defaults to self.max_workers, 1 = sequential)
+            batch_size: IDs per request (defaults to APIConfig.MAX_GAME_IDS_PER_REQUEST,
+                1 = one single-game request per ID)
+            revalidate_ids: Games whose cached details are known to be stale;
+                any request containing one bypasses the response cache's TTL
 
         Returns:
             DataFrame with game details
         """
-        results = []
+        workers = max_workers or self.max_workers
+        batch_size = min(
+            batch_size or APIConfig.MAX_GAME_IDS_PER_REQUEST,
+            APIConfig.MAX_GAME_IDS_PER_REQUEST,
+        )
+        self.failed_game_ids = {}
 
-        for i, game_id in enumerate(game_ids):
-            logger.info(f"Fetching details for game {i+1}/{len(game_ids)} (ID: {game_id})...")
-            game_data = self.fetch_game_detail(game_id)
+        if batch_size > 1:
+            batches = [
+                list(game_ids[start:start + batch_size])
+                for start in range(0, len(game_ids), batch_size)
+            ]
+            fetch_one = self._fetch_batch_summaries
+        else:
+            batches = list(game_ids)
+            fetch_one = self._fetch_game_summary
 
-            if game_data:
-                # Extract key information
-                processed = {
-                    "game_id": game_id,
-                    "title": game_data.get("info", {}).get("title", "Unknown"),
-                    "thumb": game_data.get("info", {}).get("thumb", ""),
-                    "current_price": game_data.get("deals", [{}])[0].get("price") if game_data.get("deals") else None,
-                    "retail_price": game_data.get("deals", [{}])[0].get("retailPrice") if game_data.get("deals") else None,
-                    "discount_percent": game_data.get("deals", [{}])[0].get("savings") if game_data.get("deals") else None,
-                    "deal_rating": game_data.get("deals", [{}])[0].get("dealRating") if game_data.get("deals") else None,
-                    "store_id": game_data.get("deals", [{}])[0].get("storeID") if game_data.get("deals") else None,
-                }
-                results.append(processed)
+        stale = {str(game_id) for game_id in revalidate_ids or ()}
+        revalidate = [
+            any(str(game_id) in stale for game_id in batch) if batch_size > 1 else str(batch) in stale
+            for batch in batches
+        ]
+
+        total = len(batches)
+        if workers <= 1:
+            outcomes = [
+                fetch_one(i, batch, total, revalidate[i]) for i, batch in enumerate(batches)
+            ]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(
+                    executor.map(fetch_one, range(total), batches, [total] * total, revalidate)
+                )
+
+        if batch_size > 1:
+            summaries = [summary for outcome in outcomes for summary in outcome]
+        else:
+            summaries = outcomes
+        results = [summary for summary in summaries if summary is not None]
+
+        if self.failed_game_ids:
+            logger.warning(
+                f"Failed to fetch {len(self.failed_game_ids)}/{len(game_ids)} games: "
+                f"{', '.join(map(str, self.failed_game_ids))}"
+            )
+        logger.info(
+            f"Fetched details for {len(results)}/{len(game_ids)} games in {total} requests"
+        )
 
         return pd.DataFrame(results) if results else pd.DataFrame()
@@ -0,0 +1,291 @@
+"""
+Price History Store Module
+Appends every pipeline run to a Parquet dataset partitioned by snapshot
+date and hashed game_id, so one game's price series or a date range can
+be read without touching unrelated history
+
+Layout: history/date=YYYY-MM-DD/bucket=NN/part-<HHMMSS>-<id>.parquet
+"""
+
+import logging
+import uuid
+from datetime import date
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from api_config import APIConfig
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DateLike = Union[str, date, pd.Timestamp]
+
+# Columns kept per snapshot and their dtypes when read back
+HISTORY_SCHEMA = {
+    "game_id": "int32",
+    "title": "string",
+    "store_id": "Int16",
+    "store": "string",
+    "current_price": "float32",
+    "retail_price": "float32",
+    "discount_pct": "float32",
+    "deal_rating": "float32",
+    "fetched_at": "datetime64[ns]",
+}
+
+
+class HistoryAppender:
+    """
+    Writes one snapshot arriving in chunks, keeping a single open Parquet
+    file per bucket so a streamed run adds one part per bucket, not one per chunk
+
+    Parts are written under hidden .tmp names that history reads skip and
+    only renamed into place by close(); abort() deletes them instead, so a
+    failed run leaves no partial snapshot behind.
+    """
+
+    def __init__(self, store: "PriceHistoryStore", snapshot_time: pd.Timestamp):
+        """
+        Args:
+            store: Store receiving the snapshot
+            snapshot_time: Snapshot timestamp stamped on every row
+        """
+        self.store = store
+        self.snapshot_time = pd.Timestamp(snapshot_time)
+        self.date_dir = store.root / f"date={self.snapshot_time.strftime('%Y-%m-%d')}"
+        self.part_name = f"part-{self.snapshot_time.strftime('%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet"
+        self.rows = 0
+        self._columns: Optional[List[str]] = None
+        self._schema: Optional[pa.Schema] = None
+        self._writers: Dict[int, pq.ParquetWriter] = {}
+        self._parts: Dict[int, Path] = {}
+
+    def write(self, df: pd.DataFrame) -> int:
+        """
+        Append one chunk of the snapshot
+
+        Args:
+            df: Processed deals chunk
+
+        Returns:
+            Number of rows written
+        """
+        if self._columns is None:
+            self._columns = [col for col in HISTORY_SCHEMA if col in df.columns]
+        snapshot = df.reindex(columns=self._columns).dropna(subset=["game_id"])
+        if snapshot.empty:
+            return 0
+
+        snapshot = self.store._apply_schema(snapshot.assign(fetched_at=self.snapshot_time))
+        if self._schema is None:
+            self._schema = pa.Schema.from_pandas(snapshot, preserve_index=False)
+
+        buckets = self.store.bucket_of(snapshot["game_id"].to_numpy())
+        for bucket, rows in snapshot.groupby(buckets, sort=False):
+            bucket = int(bucket)
+            writer = self._writers.get(bucket)
+            if writer is None:
+                bucket_dir = self.date_dir / f"bucket={bucket:02d}"
+                bucket_dir.mkdir(parents=True, exist_ok=True)
+                part = self._parts[bucket] = bucket_dir / f".{self.part_name}.tmp"
+                writer = self._writers[bucket] = pq.ParquetWriter(str(part), self._schema)
+            writer.write_table(pa.Table.from_pandas(rows, schema=self._schema, preserve_index=False))
+
+        self.rows += len(snapshot)
+        return len(snapshot)
+
+    def close(self) -> None:
+        """Finish every bucket file and publish it (safe to call more than once)"""
+        writers, self._writers = self._writers, {}
+        try:
+            for writer in writers.values():
+                writer.close()
+        except Exception:
+            self.abort()
+            raise
+
+        parts, self._parts = self._parts, {}
+        for part in parts.values():
+            part.replace(part.with_name(self.part_name))
+        if parts:
+            logger.info(f"Appended {self.rows} rows to price history ({self.date_dir.name})")
+
+    def abort(self) -> None:
+        """Discard every unpublished bucket file (a no-op after close)"""
+        writers, self._writers = self._writers, {}
+        for writer in writers.values():
+            try:
+                writer.close()
+            except Exception:
+                pass
+        parts, self._parts = self._parts, {}
+        for part in parts.values():
+            part.unlink(missing_ok=True)
+        if parts:
+            logger.warning(f"Discarded {self.rows} unpublished price history rows ({self.date_dir.name})")
+        self.rows = 0
+
+    def __enter__(self) -> "HistoryAppender":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class PriceHistoryStore:
+    """Date- and game-partitioned Parquet dataset of every deals snapshot"""
+
+    def __init__(self, root: Path, buckets: Optional[int] = None):
+        """
+        Args:
+            root: Dataset directory
+            buckets: Number of game_id hash buckets per date (fixed for a dataset)
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.buckets = buckets or APIConfig.HISTORY_BUCKETS
+
+    def bucket_of(self, game_ids) -> np.ndarray:
+        """
+        Hash bucket for each game ID (Knuth multiplicative hash)
+
+        Args:
+            game_ids: Scalar or array of integer game IDs
+
+        Returns:
+            Array of bucket numbers
+        """
+        ids = np.asarray(game_ids, dtype="uint64")
+        return ((ids * np.uint64(2654435761)) & np.uint64(0xFFFFFFFF)) % np.uint64(self.buckets)
+
+    def append(self, df: pd.DataFrame, snapshot_time: Optional[pd.Timestamp] = None) -> int:
+        """
+        Append one processed deals snapshot
+
+        Args:
+            df: Processed deals DataFrame
+            snapshot_time: Snapshot timestamp (defaults to its fetched_at, else now)
+
+        Returns:
+            Number of rows written
+        """
+        if snapshot_time is None:
+            fetched_at = df["fetched_at"].dropna() if "fetched_at" in df.columns else ()
+            snapshot_time = pd.Timestamp(fetched_at.iloc[0]) if len(fetched_at) else pd.Timestamp.now()
+
+        with self.appender(snapshot_time) as appender:
+            return appender.write(df)
+
+    def appender(self, snapshot_time: pd.Timestamp) -> HistoryAppender:
+        """
+        Open a writer for one snapshot that arrives in chunks (close it when done)
+
+        Args:
+            snapshot_time: Snapshot timestamp
+
+        Returns:
+            HistoryAppender writing one part file per bucket
+        """
+        return HistoryAppender(self, snapshot_time)
+
+    def dates(self) -> List[str]:
+        """Snapshot dates present in the dataset (directory listing only)"""
+        return sorted(path.name.split("=", 1)[1] for path in self.root.glob("date=*") if path.is_dir())
+
+    def _files(
+        self,
+        start: Optional[DateLike],
+        end: Optional[DateLike],
+        buckets: Optional[Sequence[int]] = None,
+    ) -> List[str]:
+        """Parquet files in the selected date and bucket partitions"""
+        low = pd.Timestamp(start).strftime("%Y-%m-%d") if start is not None else None
+        high = pd.Timestamp(end).strftime("%Y-%m-%d") if end is not None else None
+
+        files = []
+        for date in self.dates():
+            if (low and date < low) or (high and date > high):
+                continue
+            date_dir = self.root / f"date={date}"
+            bucket_dirs = (
+                [date_dir / f"bucket={int(bucket):02d}" for bucket in sorted(set(buckets))]
+                if buckets is not None else sorted(date_dir.glob("bucket=*"))
+            )
+            for bucket_dir in bucket_dirs:
+                files.extend(str(path) for path in sorted(bucket_dir.glob("*.parquet")))
+        return files
+
+    def _read(self, files: List[str], filter_expr=None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        if not files:
+            return self._apply_schema(pd.DataFrame(columns=columns or list(HISTORY_SCHEMA)))
+
+        table = ds.dataset(files, format="parquet").to_table(columns=columns, filter=filter_expr)
+        return self._apply_schema(table.to_pandas())
+
+    def game_history(
+        self,
+        game_id: int,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """
+        Price series for one game, reading only its bucket in the selected dates
+
+        Args:
+            game_id: CheapShark game ID
+            start: First date (inclusive)
+            end: Last date (inclusive)
+            columns: Columns to load (defaults to all)
+
+        Returns:
+            DataFrame ordered by fetched_at
+        """
+        files = self._files(start, end, buckets=[int(self.bucket_of(game_id))])
+        df = self._read(files, ds.field("game_id") == int(game_id), columns)
+        return df.sort_values("fetched_at", ignore_index=True) if "fetched_at" in df.columns else df
+
+    def date_range(
+        self,
+        start: Optional[DateLike] = None,
+        end: Optional[DateLike] = None,
+        columns: Optional[List[str]] = None,
+        game_ids: Optional[Sequence[int]] = None,
+    ) -> pd.DataFrame:
+        """
+        All snapshots across games within a date range
+
+        Args:
+            start: First date (inclusive)
+            end: Last date (inclusive)
+            columns: Columns to load (defaults to all)
+            game_ids: Restrict to these games (reads only their buckets)
+
+        Returns:
+            DataFrame of history rows
+        """
+        if game_ids is None:
+            return self._read(self._files(start, end), None, columns)
+
+        ids = [int(game_id) for game_id in game_ids]
+        files = self._files(start, end, buckets=self.bucket_of(ids).tolist())
+        return self._read(files, ds.field("game_id").isin(ids), columns)
+
+    @staticmethod
+    def _apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+        casts = {col: dtype for col, dtype in HISTORY_SCHEMA.items() if col in df.columns}
+        for col in ("store", "title"):
+            # Categoricals are stored as plain strings so parts share one schema
+            if col in casts and isinstance(df[col].dtype, pd.CategoricalDtype):
+                df = df.assign(**{col: df[col].astype("object")})
+        return df.astype(casts)
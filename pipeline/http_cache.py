@@ -0,0 +1,246 @@
+"""
+HTTP Response Cache Module
+Persistent on-disk cache for CheapShark responses with TTL, conditional
+revalidation (ETag / Last-Modified) and LRU eviction under a size cap
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+import requests
+
+from api_config import APIConfig
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body with its validators"""
+
+    key: str
+    body: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    stored_at: float
+
+    def payload(self) -> Any:
+        """Decode the stored JSON body"""
+        return json.loads(self.body)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Headers that turn a refetch into a conditional request"""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def validators(self) -> Dict[str, str]:
+        """ETag / Last-Modified headers the response was stored with"""
+        headers = {}
+        if self.etag:
+            headers["ETag"] = self.etag
+        if self.last_modified:
+            headers["Last-Modified"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """SQLite-backed response cache keyed by URL and query parameters"""
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[Dict[str, int]] = None,
+    ):
+        """
+        Open (or create) the cache database
+
+        Args:
+            path: SQLite file location
+            max_bytes: Total body size kept before least-recently-used entries are evicted
+            ttl_seconds: Freshness lifetime per endpoint (falls back to the "default" key)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes or APIConfig.CACHE_MAX_BYTES
+        self.ttl_seconds = ttl_seconds or APIConfig.CACHE_TTL_SECONDS
+
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                body BLOB NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                stored_at REAL NOT NULL,
+                last_access REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_responses_access ON responses (last_access)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Dict[str, str]] = None) -> str:
+        """
+        Build a stable cache key from a URL and its query parameters
+
+        Args:
+            url: Request URL without query string
+            params: Query parameters (order does not matter)
+
+        Returns:
+            Hex digest identifying the request
+        """
+        query = urlencode(sorted((params or {}).items()))
+        return hashlib.sha256(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+    def ttl_for(self, endpoint: str) -> int:
+        """Freshness lifetime in seconds for an endpoint"""
+        return self.ttl_seconds.get(endpoint, self.ttl_seconds.get("default", 0))
+
+    def lookup(self, url: str, params: Optional[Dict[str, str]] = None) -> Optional[CachedResponse]:
+        """
+        Find a stored response and mark it as recently used
+
+        Args:
+            url: Request URL
+            params: Query parameters
+
+        Returns:
+            CachedResponse or None if the request was never stored
+        """
+        key = self.make_key(url, params)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+
+        return CachedResponse(key, row[0], row[1], row[2], row[3])
+
+    def is_fresh(self, entry: CachedResponse, endpoint: str) -> bool:
+        """Whether an entry is still within its endpoint's TTL"""
+        return time.time() - entry.stored_at < self.ttl_for(endpoint)
+
+    def record_hit(self) -> None:
+        """Count a response served straight from the cache"""
+        with self._lock:
+            self.hits += 1
+
+    def mark_revalidated(self, entry: CachedResponse) -> None:
+        """
+        Restart an entry's TTL after the server answered 304 Not Modified
+
+        Args:
+            entry: Entry confirmed unchanged by the server
+        """
+        now = time.time()
+        with self._lock:
+            self.revalidated += 1
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, last_access = ? WHERE key = ?",
+                (now, now, entry.key),
+            )
+            self._conn.commit()
+
+    def store(self, url: str, params: Optional[Dict[str, str]], response: requests.Response) -> None:
+        """
+        Save a fresh 200 response and evict old entries if over the size cap
+
+        Args:
+            url: Request URL
+            params: Query parameters
+            response: Successful response to store
+        """
+        key = self.make_key(url, params)
+        body = response.content
+        now = time.time()
+
+        with self._lock:
+            self.misses += 1
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    url,
+                    body,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                    now,
+                    len(body),
+                ),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least-recently-used entries until the cache fits max_bytes (lock held)"""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        evicted = []
+        for key, size in self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ):
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        logger.info(f"Evicted {len(evicted)} cached responses to stay under {self.max_bytes} bytes")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Cache effectiveness counters for this process
+
+        Returns:
+            Dictionary with hits, revalidated, misses and stored entry count
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            return {
+                "hits": self.hits,
+                "revalidated": self.revalidated,
+                "misses": self.misses,
+                "entries": entries,
+            }
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
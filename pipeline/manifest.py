@@ -0,0 +1,163 @@
+"""
+Snapshot Manifest Module
+Publishes processed_data/latest.json pointing at the current deals
+snapshot (schema, row count, checksum), and compacts old snapshots into
+the price history store so readers never list the data directory
+"""
+
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from history_store import PriceHistoryStore
+from price_index import BestPriceIndex
+from storage import read_deals, snapshot_format, snapshot_time
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+LATEST_MANIFEST = "latest.json"
+
+
+def file_sha256(path: Path, block_size: int = 1 << 20) -> str:
+    """
+    SHA-256 of a file, read in blocks
+
+    Args:
+        path: File to hash
+        block_size: Bytes read per block
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def publish_latest(
+    snapshot: Path,
+    rows: int,
+    schema: Dict[str, str],
+    index_file: Optional[Path] = None,
+) -> dict:
+    """
+    Atomically point latest.json (next to the snapshot) at a new snapshot
+
+    Args:
+        snapshot: Processed deals snapshot just written
+        rows: Number of rows in the snapshot
+        schema: Column name -> dtype name
+        index_file: Best price index saved for the snapshot, if any
+
+    Returns:
+        Manifest dictionary as written
+    """
+    snapshot = Path(snapshot)
+    manifest = {
+        "path": snapshot.name,
+        "format": snapshot_format(snapshot),
+        "rows": int(rows),
+        "schema": {col: str(dtype) for col, dtype in schema.items()},
+        "bytes": snapshot.stat().st_size,
+        "sha256": file_sha256(snapshot),
+        "index": Path(index_file).name if index_file is not None and Path(index_file).exists() else None,
+        "published_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+    manifest_path = snapshot.parent / LATEST_MANIFEST
+    temp_path = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.tmp")
+    temp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    os.replace(temp_path, manifest_path)
+    return manifest
+
+
+def read_latest(directory: Path) -> Optional[dict]:
+    """
+    Load latest.json from a processed data directory
+
+    Args:
+        directory: Directory holding the manifest
+
+    Returns:
+        Manifest dictionary or None if no snapshot has been published
+    """
+    manifest_path = Path(directory) / LATEST_MANIFEST
+    try:
+        return json.loads(manifest_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.error(f"Error reading {manifest_path}: {e}")
+        return None
+
+
+def verify_latest(directory: Path) -> bool:
+    """
+    Check the published snapshot against its manifest checksum
+
+    Args:
+        directory: Directory holding the manifest
+
+    Returns:
+        True if the snapshot exists and matches
+    """
+    manifest = read_latest(directory)
+    if manifest is None:
+        return False
+    snapshot = Path(directory) / manifest["path"]
+    return snapshot.exists() and file_sha256(snapshot) == manifest["sha256"]
+
+
+def compact_snapshots(
+    directory: Path,
+    snapshots: List[str],
+    compacted: List[str],
+    history: PriceHistoryStore,
+    keep: int,
+) -> List[str]:
+    """
+    Move all but the newest `keep` snapshots into the history store
+
+    Snapshots already appended to history when they were written are only
+    deleted; older ones are read and appended first. The best price index
+    saved next to each removed snapshot is deleted with it, and the
+    snapshot named by latest.json is never removed.
+
+    Args:
+        directory: Processed data directory
+        snapshots: Snapshot file names, oldest first (the file manifest)
+        compacted: Snapshot names already present in the history store
+        history: PriceHistoryStore receiving old snapshots
+        keep: Number of newest snapshots to keep as files
+
+    Returns:
+        Names of the snapshots removed
+    """
+    latest = read_latest(directory)
+    protected = {latest["path"]} if latest else set()
+    candidates = [name for name in snapshots[: max(len(snapshots) - keep, 0)] if name not in protected]
+
+    removed = []
+    for name in candidates:
+        path = Path(directory) / name
+        try:
+            if path.exists():
+                if name not in compacted:
+                    history.append(read_deals(path), snapshot_time(path))
+                path.unlink()
+            BestPriceIndex.index_path(path).unlink(missing_ok=True)
+            removed.append(name)
+        except Exception as e:
+            logger.error(f"Error compacting {name}: {e}")
+
+    if removed:
+        logger.info(f"Compacted {len(removed)} old snapshots into price history (keeping {keep})")
+    return removed
@@ -0,0 +1,348 @@
+"""
+Metrics Module
+Lightweight per-run instrumentation: wall time, rows in/out and bytes
+written per operation, HTTP latency histograms, retry counts and peak
+RSS, exported as a JSON record and a Prometheus textfile
+"""
+
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+import pandas as pd
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# HTTP latency histogram bucket upper bounds (seconds)
+HTTP_LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Peak resident set size of this process so far, or None where unavailable"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+def _label_value(value) -> str:
+    """Escape a Prometheus label value (backslash, double quote, newline)"""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class OpRecord:
+    """Mutable record for one tracked call; callers may set rows/bytes"""
+
+    __slots__ = ("rows_in", "rows_out", "bytes_written")
+
+    def __init__(self, rows_in: Optional[int] = None):
+        self.rows_in = rows_in
+        self.rows_out: Optional[int] = None
+        self.bytes_written: Optional[int] = None
+
+
+class _Stats:
+    """Operation and HTTP totals over one scope (a run, or the process lifetime)"""
+
+    def __init__(self):
+        self.ops: Dict[str, dict] = defaultdict(
+            lambda: {
+                "calls": 0,
+                "errors": 0,
+                "seconds": 0.0,
+                "max_seconds": 0.0,
+                "rows_in": 0,
+                "rows_out": 0,
+                "bytes_written": 0,
+                "rss_growth_bytes": None,
+            }
+        )
+        self.http_latency: Dict[str, dict] = defaultdict(
+            lambda: {"buckets": [0] * len(HTTP_LATENCY_BUCKETS), "count": 0, "sum": 0.0}
+        )
+        self.http_status: Counter = Counter()
+        self.http_retries: Counter = Counter()
+
+    def add_op(self, name: str, seconds: float, record: OpRecord, failed: bool, rss_growth: Optional[int]) -> None:
+        op = self.ops[name]
+        op["calls"] += 1
+        op["errors"] += int(failed)
+        op["seconds"] += seconds
+        op["max_seconds"] = max(op["max_seconds"], seconds)
+        op["rows_in"] += record.rows_in or 0
+        op["rows_out"] += record.rows_out or 0
+        op["bytes_written"] += record.bytes_written or 0
+        if rss_growth is not None:
+            op["rss_growth_bytes"] = max(op["rss_growth_bytes"] or 0, rss_growth)
+
+    def add_http(self, endpoint: str, seconds: float, status: Optional[int]) -> None:
+        histogram = self.http_latency[endpoint]
+        for i, bound in enumerate(HTTP_LATENCY_BUCKETS):
+            if seconds <= bound:
+                histogram["buckets"][i] += 1
+                break
+        histogram["count"] += 1
+        histogram["sum"] += seconds
+        self.http_status[(endpoint, str(status) if status is not None else "error")] += 1
+
+    def http_summary(self) -> Dict[str, dict]:
+        http = {}
+        for endpoint, histogram in self.http_latency.items():
+            http[endpoint] = {
+                "count": histogram["count"],
+                "sum_seconds": round(histogram["sum"], 6),
+                "buckets": dict(zip([str(b) for b in HTTP_LATENCY_BUCKETS], histogram["buckets"])),
+                "retries": self.http_retries.get(endpoint, 0),
+                "status": {
+                    status: count for (name, status), count in self.http_status.items() if name == endpoint
+                },
+            }
+        return http
+
+
+class MetricsRegistry:
+    """
+    Thread-safe metrics store
+
+    Per-run stats (reset by reset()) feed the JSON record; process-lifetime
+    stats feed the Prometheus counters, so they stay cumulative when the
+    daemon runs the pipeline repeatedly in one process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.lifetime = _Stats()
+        self.reset()
+
+    def reset(self) -> None:
+        """Start a new run"""
+        with self._lock:
+            self.started_at = datetime.now()
+            self._start = time.perf_counter()
+            self.run = _Stats()
+
+    @contextmanager
+    def track(self, name: str, rows_in: Optional[int] = None) -> Iterator[OpRecord]:
+        """
+        Time a block and record it under name
+
+        rss_growth_bytes is how far the block raised the process's peak RSS
+        (0 when it stayed under an earlier high-water mark); blocks running
+        concurrently share that growth.
+
+        Args:
+            name: Operation name, e.g. "transform.clean_deal_data"
+            rows_in: Input row count, if known
+
+        Yields:
+            OpRecord whose rows_out / bytes_written the block may set
+        """
+        record = OpRecord(rows_in)
+        rss_before = peak_rss_bytes()
+        start = time.perf_counter()
+        failed = False
+        try:
+            yield record
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            seconds = time.perf_counter() - start
+            rss_growth = peak_rss_bytes() - rss_before if rss_before is not None else None
+            with self._lock:
+                self.run.add_op(name, seconds, record, failed, rss_growth)
+                self.lifetime.add_op(name, seconds, record, failed, rss_growth)
+
+    def observe_http(self, endpoint: str, seconds: float, status: Optional[int]) -> None:
+        """
+        Record one HTTP attempt
+
+        Args:
+            endpoint: Endpoint path, e.g. "deals"
+            seconds: Request latency
+            status: Response status code (None for connection errors)
+        """
+        with self._lock:
+            self.run.add_http(endpoint, seconds, status)
+            self.lifetime.add_http(endpoint, seconds, status)
+
+    def count_retry(self, endpoint: str) -> None:
+        """Record one retried HTTP request"""
+        with self._lock:
+            self.run.http_retries[endpoint] += 1
+            self.lifetime.http_retries[endpoint] += 1
+
+    def snapshot(self, **run_info) -> dict:
+        """
+        Structured record of the run so far
+
+        Args:
+            run_info: Extra top-level fields (e.g. mode, success)
+
+        Returns:
+            JSON-serializable dictionary
+        """
+        with self._lock:
+            return {
+                "started_at": self.started_at.isoformat(timespec="seconds"),
+                "duration_seconds": round(time.perf_counter() - self._start, 6),
+                "peak_rss_bytes": peak_rss_bytes(),
+                **run_info,
+                "ops": {name: dict(op) for name, op in sorted(self.run.ops.items())},
+                "http": self.run.http_summary(),
+            }
+
+    def export_json(self, path: Path, **run_info) -> dict:
+        """
+        Append this run's record as one line of a JSON Lines file
+
+        Args:
+            path: .jsonl file
+            run_info: Extra top-level fields
+
+        Returns:
+            The record written
+        """
+        record = self.snapshot(**run_info)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+        return record
+
+    def export_prometheus(self, path: Path, prefix: str = "playsmart", **run_info) -> None:
+        """
+        Write a Prometheus textfile (for node_exporter's textfile collector)
+
+        Operation and HTTP counters and the latency histogram are cumulative
+        over the process lifetime; run_* fields, peak RSS and the per-op
+        max_seconds / rss_growth_bytes gauges describe the last run.
+
+        Args:
+            path: .prom file, replaced atomically
+            prefix: Metric name prefix
+            run_info: Numeric or boolean top-level fields exported as gauges
+        """
+        record = self.snapshot(**run_info)
+        with self._lock:
+            lifetime_ops = {name: dict(op) for name, op in sorted(self.lifetime.ops.items())}
+            lifetime_http = self.lifetime.http_summary()
+        lines = []
+
+        def metric(name: str, kind: str, help_text: str, samples) -> None:
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{_label_value(val)}"' for key, val in labels.items())
+                lines.append(f"{prefix}_{name}{{{label_text}}} {value}" if label_text else f"{prefix}_{name} {value}")
+
+        metric("run_duration_seconds", "gauge", "Wall time of the last run", [({}, record["duration_seconds"])])
+        metric("run_timestamp_seconds", "gauge", "Start of the last run (Unix time)",
+               [({}, int(self.started_at.timestamp()))])
+        if record["peak_rss_bytes"] is not None:
+            metric("peak_rss_bytes", "gauge", "Peak resident set size of the process", [({}, record["peak_rss_bytes"])])
+        for key, value in run_info.items():
+            if isinstance(value, (bool, int, float)):
+                metric(f"run_{key}", "gauge", f"Run field {key}", [({}, int(value) if isinstance(value, bool) else value)])
+
+        for field, help_text in (
+            ("calls", "Calls per operation"),
+            ("errors", "Calls that raised"),
+            ("seconds", "Wall time per operation"),
+            ("rows_in", "Rows passed in"),
+            ("rows_out", "Rows returned"),
+            ("bytes_written", "Bytes written to disk"),
+        ):
+            metric(f"op_{field}_total", "counter", help_text,
+                   [({"op": name}, op[field]) for name, op in lifetime_ops.items()])
+
+        ops = record["ops"]
+        metric("op_max_seconds", "gauge", "Slowest call per operation in the last run",
+               [({"op": name}, op["max_seconds"]) for name, op in ops.items()])
+        metric("op_rss_growth_bytes", "gauge", "Largest peak RSS increase per operation in the last run", [
+            ({"op": name}, op["rss_growth_bytes"]) for name, op in ops.items() if op["rss_growth_bytes"] is not None
+        ])
+
+        lines.append(f"# HELP {prefix}_http_request_duration_seconds CheapShark/Game Pass request latency")
+        lines.append(f"# TYPE {prefix}_http_request_duration_seconds histogram")
+        for endpoint, histogram in lifetime_http.items():
+            label = _label_value(endpoint)
+            cumulative = 0
+            for bound, count in histogram["buckets"].items():
+                cumulative += count
+                lines.append(f'{prefix}_http_request_duration_seconds_bucket{{endpoint="{label}",le="{bound}"}} {cumulative}')
+            lines.append(f'{prefix}_http_request_duration_seconds_bucket{{endpoint="{label}",le="+Inf"}} {histogram["count"]}')
+            lines.append(f'{prefix}_http_request_duration_seconds_sum{{endpoint="{label}"}} {histogram["sum_seconds"]}')
+            lines.append(f'{prefix}_http_request_duration_seconds_count{{endpoint="{label}"}} {histogram["count"]}')
+
+        metric("http_retries_total", "counter", "Retried requests per endpoint",
+               [({"endpoint": endpoint}, h["retries"]) for endpoint, h in lifetime_http.items()])
+        metric("http_responses_total", "counter", "Responses per endpoint and status", [
+            ({"endpoint": endpoint, "status": status}, count)
+            for endpoint, h in lifetime_http.items()
+            for status, count in h["status"].items()
+        ])
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        os.replace(temp_path, path)
+
+
+# Process-wide registry used by the instrumentation hooks
+METRICS = MetricsRegistry()
+
+
+def _row_count(value) -> Optional[int]:
+    return len(value) if isinstance(value, (pd.DataFrame, pd.Series)) else None
+
+
+def instrumented(name: str, bytes_result: bool = False):
+    """
+    Decorator recording a call in METRICS
+
+    Rows in come from the first DataFrame argument and rows out from a
+    DataFrame result; with bytes_result the (int) return value is counted
+    as bytes written.
+
+    Args:
+        name: Operation name
+        bytes_result: Treat the return value as bytes written
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            rows_in = next(
+                (_row_count(arg) for arg in (*args, *kwargs.values()) if isinstance(arg, pd.DataFrame)),
+                None,
+            )
+            with METRICS.track(name, rows_in) as record:
+                result = func(*args, **kwargs)
+                if bytes_result and isinstance(result, int):
+                    record.bytes_written = result
+                else:
+                    record.rows_out = _row_count(result)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -4,70 +4,182 @@ Orchestrates the complete data pipeline: fetch -> transform -> save
 Run this script to execute the entire end-to-end pipeline with one command
 """
 
+import argparse
 import logging
 import os
 import sys
+import tempfile
 from datetime import datetime
 import pandas as pd
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional
 
 # Add pipeline directory to path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from api_config import APIConfig
 from fetch_data import GamePriceFetcher
+from http_cache import ResponseCache
+from aggregates import AggregateState, RunningDealStats
+from history_store import HistoryAppender, PriceHistoryStore
+from manifest import compact_snapshots, publish_latest
+from metrics import METRICS, instrumented
+from price_index import BestPriceIndex
+from replay import FixtureRecorder
+from scheduler import IntervalScheduler
+from stages import Stage, StageRunner
+from storage import DealsFileWriter, iter_raw_deals, snapshot_files, snapshot_suffix, write_deals
+from streaming import TopKDeals, merge_sorted_runs, spill_run
 from transform import GameDataTransformer
+from validation import DealValidator, write_quarantine
 
 # Configure logging
-log_dir = Path(__file__).parent.parent / "logs"
-log_dir.mkdir(exist_ok=True)
-
-log_file = log_dir / f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler(log_file),
-        logging.StreamHandler(),
-    ],
-)
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
 
+def add_log_file(log_dir: Path) -> logging.FileHandler:
+    """
+    Also write every log record to a timestamped file in log_dir
+
+    Args:
+        log_dir: Directory for pipeline_<timestamp>.log files
+
+    Returns:
+        Handler attached to the root logger (remove it when done)
+    """
+    log_dir.mkdir(parents=True, exist_ok=True)
+    handler = logging.FileHandler(log_dir / f"pipeline_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    logging.getLogger().addHandler(handler)
+    return handler
+
+
 class GameDealPipeline:
     """Master pipeline for fetching, transforming, and saving game deal data"""
 
-    def __init__(self):
-        """Initialize pipeline with data directories"""
-        self.base_dir = Path(__file__).parent.parent
-        self.raw_dir = self.base_dir / "raw_data"
-        self.processed_dir = self.base_dir / "processed_data"
+    def __init__(
+        self,
+        base_dir: Optional[Path] = None,
+        raw_dir: Optional[Path] = None,
+        processed_dir: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        log_dir: Optional[Path] = None,
+    ):
+        """
+        Initialize pipeline with data directories
+
+        Args:
+            base_dir: Root of every data directory not given explicitly
+                (defaults to the project root)
+            raw_dir: Raw snapshots (defaults to base_dir/raw_data)
+            processed_dir: Processed snapshots, history and state (defaults to base_dir/processed_data)
+            cache_dir: HTTP cache and stage checkpoints (defaults to base_dir/cache)
+            log_dir: Run log files (defaults to base_dir/logs)
+        """
+        self.base_dir = Path(base_dir) if base_dir else Path(__file__).parent.parent
+        self.raw_dir = Path(raw_dir) if raw_dir else self.base_dir / "raw_data"
+        self.processed_dir = Path(processed_dir) if processed_dir else self.base_dir / "processed_data"
 
         # Create directories if they don't exist
-        self.raw_dir.mkdir(exist_ok=True)
-        self.processed_dir.mkdir(exist_ok=True)
+        self.raw_dir.mkdir(parents=True, exist_ok=True)
+        self.processed_dir.mkdir(parents=True, exist_ok=True)
+
+        self.log_dir = Path(log_dir) if log_dir else self.base_dir / "logs"
+        self._log_handler = add_log_file(self.log_dir)
+        self.log_file = Path(self._log_handler.baseFilename)
+
+        # Raw rows failing validation, with reason codes
+        self.quarantine_dir = self.base_dir / "quarantine"
+
+        # Shared fetcher so every stage reuses one pooled HTTP session and cache
+        self.cache_dir = Path(cache_dir) if cache_dir else self.base_dir / "cache"
+        recorder = (
+            FixtureRecorder(Path(APIConfig.RECORD_FIXTURES_DIR))
+            if APIConfig.RECORD_FIXTURES_DIR else None
+        )
+        self.fetcher = GamePriceFetcher(
+            cache=ResponseCache(self.cache_dir / "http_cache.sqlite"),
+            recorder=recorder,
+        )
+
+        # Incremental enrichment index and the details it covers
+        self.enrichment_state_file = self.processed_dir / "enrichment_state.csv"
+        self.game_details_file = self.processed_dir / "game_details.csv"
+
+        # Store catalog snapshot shared with the dashboard
+        self.stores_file = self.processed_dir / "stores.csv"
+
+        # Every run's deals, partitioned by date and hashed game_id
+        self.history = PriceHistoryStore(self.processed_dir / "history")
+
+        # Per-run metrics: JSON Lines history plus a Prometheus textfile
+        self.metrics_dir = self.base_dir / "metrics"
+
+        # Stage graph of the current batch run (see run)
+        self.runner: Optional[StageRunner] = None
+
+        # All-time summary totals and data file manifest, updated per run
+        self.aggregates = AggregateState(self.processed_dir / "aggregate_state.json")
+        if not self.aggregates.exists:
+            # One-time seed from files written before the manifest existed
+            self.aggregates.seed_files("raw", snapshot_files(self.raw_dir, "deals_raw_"))
+            self.aggregates.seed_files("processed", snapshot_files(self.processed_dir, "deals_processed_"))
 
         logger.info(f"Pipeline initialized")
         logger.info(f"Raw data directory: {self.raw_dir}")
         logger.info(f"Processed data directory: {self.processed_dir}")
 
-    def fetch_deals(self) -> pd.DataFrame:
+    def snapshot_path(self, directory: Path, prefix: str, timestamp: Optional[datetime] = None) -> Path:
+        """
+        Timestamped snapshot path in the configured storage format
+
+        Args:
+            directory: Destination directory
+            prefix: File name prefix, e.g. "deals_raw_"
+            timestamp: Run time (defaults to now)
+
+        Returns:
+            Path such as raw_data/deals_raw_20240101_120000.parquet
+        """
+        stamp = (timestamp or datetime.now()).strftime("%Y%m%d_%H%M%S")
+        return directory / f"{prefix}{stamp}{snapshot_suffix(APIConfig.STORAGE_FORMAT)}"
+
+    def fetch_deals(self, by_store: Optional[bool] = None) -> pd.DataFrame:
         """
         Fetch current game deals from CheapShark
 
+        Args:
+            by_store: Fetch one parallel shard per store in APIConfig.STORES
+                (defaults to APIConfig.FETCH_DEALS_BY_STORE)
+
         Returns:
-            DataFrame with deal information or None if failed
+            DataFrame with deal information or None if failed (including
+            when any store shard failed)
         """
         logger.info("Starting game deals fetch...")
-        fetcher = GamePriceFetcher()
+
+        if by_store is None:
+            by_store = APIConfig.FETCH_DEALS_BY_STORE
 
         try:
-            df = fetcher.fetch_deals()
+            if by_store:
+                df = self.fetcher.fetch_deals_by_store()
+                if self.fetcher.failed_store_ids:
+                    # Per-store coverage is the point of sharding; never save a partial catalog
+                    logger.error(
+                        f"Deals fetch incomplete: stores {sorted(self.fetcher.failed_store_ids)} failed"
+                    )
+                    return None
+            else:
+                df = self.fetcher.fetch_deals()
             if df is not None and len(df) > 0:
                 # Save raw data
-                raw_file = self.raw_dir / f"deals_raw_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-                df.to_csv(raw_file, index=False)
+                raw_file = self.snapshot_path(self.raw_dir, "deals_raw_")
+                write_deals(df, raw_file)
+                self.aggregates.record_file("raw", raw_file)
                 logger.info(f"Saved raw deals data to {raw_file}")
                 return df
             else:
@@ -77,12 +189,126 @@ class GameDealPipeline:
             logger.error(f"Error fetching deals: {e}")
             return None
 
-    def transform_and_save_deals(self, deals_df: pd.DataFrame) -> pd.DataFrame:
+    def load_store_catalog(self) -> Optional[pd.DataFrame]:
+        """
+        Fetch the store catalog (cached by TTL) and publish it for the dashboard
+
+        Falls back to the last saved catalog if the fetch fails.
+
+        Returns:
+            Store catalog DataFrame or None if unavailable
+        """
+        stores = self.fetcher.fetch_stores()
+        if stores is not None:
+            stores.to_csv(self.stores_file, index=False)
+            return stores
+
+        if self.stores_file.exists():
+            logger.warning(f"Using saved store catalog from {self.stores_file}")
+            return pd.read_csv(self.stores_file)
+
+        logger.warning("Store catalog unavailable")
+        return None
+
+    def stream_deals(
+        self, max_rows: Optional[int] = None, max_pages: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream the deals catalog page by page, appending each page to one raw file
+
+        Args:
+            max_rows: Total deal budget for the run
+            max_pages: Page budget for the run
+
+        Yields:
+            Raw deal DataFrame chunks as they arrive
+
+        Raises:
+            requests.RequestException: If a page fails after all retries (the
+                partial raw file is deleted)
+        """
+        logger.info("Starting streaming game deals fetch...")
+
+        raw_file = self.snapshot_path(self.raw_dir, "deals_raw_")
+        columns = None
+
+        try:
+            with DealsFileWriter(raw_file) as writer:
+                for chunk in self.fetcher.iter_deal_pages(max_rows=max_rows, max_pages=max_pages):
+                    # Pages can omit optional fields; keep the raw file's columns stable
+                    if columns is None:
+                        columns = list(chunk.columns)
+                        self.aggregates.record_file("raw", raw_file)
+                    else:
+                        chunk = chunk.reindex(columns=columns)
+                    writer.write(chunk)
+                    yield chunk
+        except Exception:
+            # Never keep a truncated catalog as a raw snapshot
+            raw_file.unlink(missing_ok=True)
+            self.aggregates.remove_file("raw", raw_file.name)
+            raise
+
+        total = writer.rows
+        if total:
+            logger.info(f"Saved {total} raw deals to {raw_file}")
+        else:
+            logger.warning("No deals data retrieved")
+
+    def validate_deals(self, deals_df: pd.DataFrame, quarantine_file: Optional[Path] = None) -> pd.DataFrame:
+        """
+        Check raw deals against DealValidator rules and quarantine failing rows
+
+        Args:
+            deals_df: Raw game deals DataFrame
+            quarantine_file: Quarantine CSV to append to (defaults to a new
+                quarantine/deals_quarantine_<timestamp>.csv)
+
+        Returns:
+            Rows passing every rule
+        """
+        with METRICS.track("validate.deals", len(deals_df)) as record:
+            result = DealValidator.validate(deals_df)
+            record.rows_out = len(result.valid)
+        DealValidator.log_counts(result)
+
+        if len(result.rejected):
+            if quarantine_file is None:
+                quarantine_file = (
+                    self.quarantine_dir / f"deals_quarantine_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                )
+            write_quarantine(result.rejected, quarantine_file)
+            logger.info(f"Quarantined {len(result.rejected)} rows to {quarantine_file}")
+
+        return result.valid
+
+    def validate_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Validate raw deal chunks, quarantining failures from the whole stream into one file
+
+        Args:
+            chunks: Raw deal chunks
+
+        Yields:
+            Valid rows of each chunk
+        """
+        quarantine_file = self.quarantine_dir / f"deals_quarantine_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        for chunk in chunks:
+            yield self.validate_deals(chunk, quarantine_file)
+
+    def transform_and_save_deals(
+        self,
+        deals_df: pd.DataFrame,
+        game_pass_lookup: Optional[dict] = None,
+        stores: Optional[pd.DataFrame] = None,
+    ) -> pd.DataFrame:
         """
         Transform game deal data and save to processed directory
 
         Args:
             deals_df: Raw game deals DataFrame
+            game_pass_lookup: Normalized title -> Game Pass product ID, if available
+            stores: Store catalog used to name each deal's store, if available
 
         Returns:
             Transformed DataFrame
@@ -94,30 +320,392 @@ class GameDealPipeline:
             return None
 
         try:
-            # Transform data
-            transformed = GameDataTransformer.transform_deals_data(deals_df)
+            # Transform and sort by deal quality in a single pass
+            transformed = GameDataTransformer.transform_deals_data_fused(deals_df, sort=True)
 
-            # Sort by deal quality
-            transformed = GameDataTransformer.sort_by_deal_quality(transformed)
+            # Attach store names
+            if stores is not None and "store_id" in transformed.columns:
+                transformed = GameDataTransformer.attach_store_names(transformed, stores)
+
+            # Flag games already on Game Pass
+            if game_pass_lookup:
+                transformed = GameDataTransformer.flag_game_pass(transformed, game_pass_lookup)
 
             # Save processed data
-            processed_file = self.processed_dir / f"deals_processed_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            transformed.to_csv(processed_file, index=False)
+            processed_file = self.snapshot_path(self.processed_dir, "deals_processed_")
+            write_deals(transformed, processed_file)
+            self.aggregates.record_file("processed", processed_file)
             logger.info(f"Saved processed deals data to {processed_file}")
 
+            index_file = self.save_best_price_index(transformed, processed_file)
+            if self.append_price_history(transformed):
+                self.aggregates.record_file("history", processed_file)
+            self.publish_snapshot(processed_file, len(transformed), transformed.dtypes, index_file)
+
             return transformed
 
         except Exception as e:
             logger.error(f"Error transforming deals: {e}")
             return None
 
-    def create_summary_report(self, deals_df: pd.DataFrame) -> None:
-        """Create a summary report of the pipeline run"""
+    @instrumented("save.best_price_index")
+    def save_best_price_index(self, deals_df: pd.DataFrame, processed_file: Path) -> Optional[Path]:
+        """
+        Build the per-game best price index and save it next to the deals file
+
+        Args:
+            deals_df: Processed deals DataFrame
+            processed_file: Deals snapshot the index belongs to
+
+        Returns:
+            Path of the saved index or None if failed
+        """
+        try:
+            index = BestPriceIndex(GameDataTransformer.build_best_price_index(deals_df))
+            index_file = BestPriceIndex.index_path(processed_file)
+            index.save(index_file)
+            logger.info(f"Saved best price index for {len(index)} games to {index_file}")
+            return index_file
+        except Exception as e:
+            logger.error(f"Error building best price index: {e}")
+            return None
+
+    @instrumented("save.manifest")
+    def publish_snapshot(
+        self, processed_file: Path, rows: int, dtypes: pd.Series, index_file: Optional[Path] = None
+    ) -> None:
+        """
+        Point processed_data/latest.json at a newly written snapshot (non-fatal)
+
+        Args:
+            processed_file: Snapshot just written
+            rows: Rows in the snapshot
+            dtypes: Column dtypes of the snapshot
+            index_file: Best price index saved for the snapshot, if any
+        """
+        try:
+            manifest = publish_latest(processed_file, rows, dtypes.to_dict(), index_file)
+            logger.info(f"Published {manifest['path']} ({manifest['rows']} rows) as the latest snapshot")
+        except Exception as e:
+            logger.error(f"Error publishing latest snapshot manifest: {e}")
+
+    @instrumented("save.compact")
+    def compact_snapshots(self) -> None:
+        """Fold processed snapshots beyond APIConfig.SNAPSHOT_RETENTION into price history (non-fatal)"""
+        try:
+            removed = compact_snapshots(
+                self.processed_dir,
+                self.aggregates.files.get("processed", []),
+                self.aggregates.files.get("history", []),
+                self.history,
+                APIConfig.SNAPSHOT_RETENTION,
+            )
+            for name in removed:
+                self.aggregates.remove_file("processed", name)
+                self.aggregates.remove_file("history", name)
+        except Exception as e:
+            logger.error(f"Error compacting old snapshots: {e}")
+
+    @instrumented("save.price_history")
+    def append_price_history(
+        self,
+        deals_df: pd.DataFrame,
+        snapshot_time: Optional[pd.Timestamp] = None,
+        appender: Optional[HistoryAppender] = None,
+    ) -> bool:
+        """
+        Append processed deals to the price history dataset (non-fatal)
+
+        Args:
+            deals_df: Processed deals DataFrame
+            snapshot_time: Snapshot timestamp (ignored with appender)
+            appender: Open per-run appender that a streamed snapshot's chunks share
+
+        Returns:
+            True if the rows were appended
+        """
+        try:
+            if appender is not None:
+                appender.write(deals_df)
+            else:
+                self.history.append(deals_df, snapshot_time)
+            return True
+        except Exception as e:
+            logger.error(f"Error appending price history: {e}")
+            return False
+
+    def transform_and_save_deals_stream(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        game_pass_lookup: Optional[dict] = None,
+        stores: Optional[pd.DataFrame] = None,
+        top_k: Optional[int] = None,
+    ) -> Optional[RunningDealStats]:
+        """
+        Transform raw deal chunks with bounded memory and save one sorted file
+
+        Each transformed chunk is sorted and spilled to a temporary run, then
+        the runs are k-way merged into the processed file. With top_k only the
+        best top_k deals are kept in memory and saved instead. Summary
+        statistics are accumulated as running aggregates.
+
+        Args:
+            chunks: Raw deal chunks, e.g. stream_deals() or iter_raw_deals()
+            game_pass_lookup: Normalized title -> Game Pass product ID, if available
+            stores: Store catalog used to name each deal's store, if available
+            top_k: Keep only the best top_k deals instead of the full sorted output
+
+        Returns:
+            Running stats over every transformed row, or None if failed
+        """
+        logger.info("Starting streaming transformation of deals data...")
+
+        stats = RunningDealStats()
+        top = TopKDeals(top_k) if top_k else None
+        run_time = datetime.now()
+        processed_file = self.snapshot_path(self.processed_dir, "deals_processed_", run_time)
+        # One history part per bucket for the whole run, not one per chunk,
+        # published only once the processed file is saved
+        history = self.history.appender(pd.Timestamp(run_time))
+
+        try:
+            with tempfile.TemporaryDirectory(dir=self.processed_dir, prefix="runs_") as run_dir:
+                runs = []
+                columns = None
+                in_history = True
+
+                for chunk in GameDataTransformer.transform_deals_chunks(chunks, sort=True):
+                    if stores is not None and "store_id" in chunk.columns:
+                        chunk = GameDataTransformer.attach_store_names(chunk, stores)
+                    if game_pass_lookup:
+                        chunk = GameDataTransformer.flag_game_pass(chunk, game_pass_lookup)
+
+                    # Keep every run's columns identical for the merge
+                    if columns is None:
+                        columns = list(chunk.columns)
+                    chunk = chunk.reindex(columns=columns)
+
+                    stats.update(chunk)
+                    if in_history and not self.append_price_history(chunk, appender=history):
+                        # Drop the chunks written so far; compaction appends the whole snapshot later
+                        history.abort()
+                        in_history = False
+                    if top is not None:
+                        top.update(chunk)
+                    else:
+                        runs.append(spill_run(chunk, Path(run_dir), len(runs)))
+
+                if not stats.total_deals:
+                    logger.warning("No data to transform")
+                    return None
+
+                if top is not None:
+                    result = top.result()
+                    write_deals(result, processed_file)
+                    rows, dtypes = len(result), result.dtypes
+                else:
+                    with METRICS.track("save.merge_sorted_runs") as record:
+                        rows, dtypes = merge_sorted_runs(runs, processed_file), chunk.dtypes
+                        record.rows_out, record.bytes_written = rows, processed_file.stat().st_size
+                self.aggregates.record_file("processed", processed_file)
+
+                if in_history:
+                    try:
+                        history.close()
+                    except Exception as e:
+                        logger.error(f"Error finishing price history: {e}")
+                        in_history = False
+                if in_history:
+                    self.aggregates.record_file("history", processed_file)
+
+            self.publish_snapshot(processed_file, rows, dtypes)
+
+            logger.info(f"Saved processed deals data to {processed_file} ({stats.total_deals} deals transformed)")
+            return stats
+
+        except Exception as e:
+            logger.error(f"Error transforming deal stream: {e}")
+            return None
+
+        finally:
+            # Discards the parts of a failed run; a no-op once published
+            history.abort()
+
+    def run_stream(
+        self,
+        max_rows: Optional[int] = None,
+        max_pages: Optional[int] = None,
+        raw_file: Optional[Path] = None,
+        top_k: Optional[int] = None,
+        chunksize: int = 50_000,
+    ) -> bool:
+        """
+        Execute the pipeline in bounded memory over the paginated catalog or a raw CSV
+
+        Args:
+            max_rows: Total deal budget when streaming from the API
+            max_pages: Page budget when streaming from the API
+            raw_file: Re-transform this raw snapshot instead of fetching
+            top_k: Keep only the best top_k deals in the processed file
+            chunksize: Rows per chunk when reading raw_file
+
+        Returns:
+            True if pipeline runs successfully, False otherwise
+        """
+        logger.info("="*60)
+        logger.info("Starting PlaySmart Game Deal Pipeline (streaming)")
+        logger.info("="*60)
+
+        METRICS.reset()
+        success = False
+        try:
+            if raw_file is not None:
+                chunks = iter_raw_deals(raw_file, chunksize)
+            else:
+                chunks = self.stream_deals(max_rows=max_rows, max_pages=max_pages)
+
+            stats = self.transform_and_save_deals_stream(
+                self.validate_chunks(chunks), stores=self.load_store_catalog(), top_k=top_k
+            )
+            if stats is None:
+                logger.error("Failed to transform deal stream. Pipeline failed.")
+                return False
+
+            self.aggregates.record_run(stats)
+            self.compact_snapshots()
+            self.create_summary_report(stats=stats)
+
+            logger.info(f"Processed {stats.total_deals} game deals")
+            success = True
+            return True
+
+        except Exception as e:
+            logger.error(f"Pipeline execution failed: {e}", exc_info=True)
+            return False
+
+        finally:
+            self.save_aggregate_state()
+            self.log_http_stats()
+            self.export_metrics("stream", success)
+
+    # Raw deal fields that identify a deal revision
+    DEAL_SIGNATURE_COLUMNS = ["gameID", "dealID", "lastChange", "salePrice"]
+
+    def find_changed_games(self, deals_df: pd.DataFrame) -> tuple:
+        """
+        Compare the current deals against the last-seen enrichment state
+
+        A game counts as changed when any of its deals is new, has a different
+        lastChange/salePrice, or disappeared since the previous run.
+
+        Args:
+            deals_df: Raw deals DataFrame from CheapShark
+
+        Returns:
+            Tuple of (current signature DataFrame, list of new or changed game IDs)
+        """
+        columns = [col for col in self.DEAL_SIGNATURE_COLUMNS if col in deals_df.columns]
+        current = deals_df[columns].dropna(subset=["gameID"]).astype(str).drop_duplicates()
+
+        if not self.enrichment_state_file.exists():
+            return current, current["gameID"].unique().tolist()
+
+        previous = pd.read_csv(self.enrichment_state_file, dtype=str, keep_default_na=False)
+        previous = previous[[col for col in columns if col in previous.columns]]
+
+        # Rows present on only one side are new, changed or removed deal revisions
+        merged = current.merge(previous, how="outer", on=list(previous.columns), indicator=True)
+        changed = set(merged.loc[merged["_merge"] != "both", "gameID"])
+
+        current_ids = current["gameID"].unique()
+        return current, [game_id for game_id in current_ids if game_id in changed]
+
+    def enrich_game_details(self, deals_df: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Fetch /games details only for new or changed games and merge with cached ones
+
+        Args:
+            deals_df: Raw deals DataFrame from CheapShark
+
+        Returns:
+            Game details for every game in deals_df, or None if enrichment failed
+        """
+        logger.info("Starting incremental game detail enrichment...")
+
+        if deals_df is None or deals_df.empty or "gameID" not in deals_df.columns:
+            logger.warning("No deals to enrich")
+            return None
+
+        try:
+            current, changed_ids = self.find_changed_games(deals_df)
+            current_ids = set(current["gameID"])
+
+            cached = pd.DataFrame()
+            if self.game_details_file.exists():
+                cached = pd.read_csv(self.game_details_file, dtype={"game_id": str})
+                cached = cached[cached["game_id"].isin(current_ids)]
+
+            # Games with no cached details are fetched even when their deals are unchanged
+            missing_ids = current_ids - set(cached["game_id"]) if not cached.empty else current_ids
+            to_fetch = list(dict.fromkeys(changed_ids + sorted(missing_ids)))
+
+            logger.info(
+                f"{len(to_fetch)}/{len(current_ids)} games new or changed; "
+                f"reusing {len(current_ids) - len(to_fetch)} cached details"
+            )
+
+            fresh = (
+                # Changed games bypass the /games cache TTL: a fresh cached batch
+                # body would still hold their pre-change details
+                self.fetcher.fetch_multiple_game_details(to_fetch, revalidate_ids=changed_ids)
+                if to_fetch else pd.DataFrame()
+            )
+            failed_ids = set(self.fetcher.failed_game_ids) if to_fetch else set()
+
+            # Keep stale details for games whose refetch failed
+            if not cached.empty:
+                refreshed = set(to_fetch) - failed_ids
+                cached = cached[~cached["game_id"].isin(refreshed)]
+            details = pd.concat([cached, fresh], ignore_index=True)
+            details.to_csv(self.game_details_file, index=False)
+
+            # Failed games stay out of the state so the next run retries them
+            state = current[~current["gameID"].isin(failed_ids)]
+            state.to_csv(self.enrichment_state_file, index=False)
+
+            logger.info(f"Saved details for {len(details)} games to {self.game_details_file}")
+            return details
+
+        except Exception as e:
+            logger.error(f"Error enriching game details: {e}")
+            return None
+
+    @instrumented("report.summary")
+    def create_summary_report(
+        self,
+        deals_df: Optional[pd.DataFrame] = None,
+        stats: Optional[RunningDealStats] = None,
+        stage_timings: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Create a summary report of the pipeline run
+
+        Args:
+            deals_df: Processed deals (ignored when stats is given)
+            stats: Running aggregates, e.g. accumulated over streamed chunks
+            stage_timings: Per-stage wall time lines from StageRunner
+
+        All-time totals and file counts come from the persisted aggregate
+        state, so no data directory is scanned.
+        """
         logger.info("Creating summary report...")
 
         report_file = self.processed_dir / "pipeline_summary.txt"
 
         try:
+            if stats is None and deals_df is not None:
+                stats = RunningDealStats.from_frame(deals_df)
+
             with open(report_file, "w") as f:
                 f.write(f"PlaySmart Pipeline Execution Summary\n")
                 f.write(f"{'='*60}\n")
@@ -126,43 +714,158 @@ class GameDealPipeline:
                 f.write(f"Processed Data Directory: {self.processed_dir}\n")
 
                 # Data summary
-                if deals_df is not None and not deals_df.empty:
+                if stats is not None and stats.total_deals:
                     f.write(f"\nDeals Summary:\n")
-                    f.write(f"  Total Deals: {len(deals_df)}\n")
-
-                    if "discount_pct" in deals_df.columns:
-                        f.write(f"  Average Discount: {deals_df['discount_pct'].mean():.2f}%\n")
-                        f.write(f"  Max Discount: {deals_df['discount_pct'].max():.2f}%\n")
-
-                    if "deal_quality" in deals_df.columns:
-                        quality_counts = deals_df["deal_quality"].value_counts()
-                        f.write(f"\n  Deal Quality Breakdown:\n")
-                        for quality, count in quality_counts.items():
-                            f.write(f"    {quality}: {count}\n")
+                    self._write_stats(f, stats)
 
-                    if "store" in deals_df.columns:
-                        store_counts = deals_df["store"].value_counts()
-                        f.write(f"\n  Deals by Store:\n")
-                        for store, count in store_counts.head(10).items():
-                            f.write(f"    {store}: {count}\n")
+                all_time = self.aggregates.all_time
+                if all_time.total_deals:
+                    f.write(f"\nAll-Time Summary ({self.aggregates.runs} runs):\n")
+                    self._write_stats(f, all_time)
 
                 # File counts
-                raw_files = list(self.raw_dir.glob("*_raw*.csv"))
-                processed_files = list(self.processed_dir.glob("*_processed*.csv"))
-
                 f.write(f"\nData Files:\n")
-                f.write(f"  Raw Data Files: {len(raw_files)}\n")
-                f.write(f"  Processed Data Files: {len(processed_files)}\n")
-                f.write(f"  Log File: {log_file}\n")
+                f.write(f"  Raw Data Files: {self.aggregates.file_count('raw')}\n")
+                f.write(f"  Processed Data Files: {self.aggregates.file_count('processed')}\n")
+                f.write(f"  Log File: {self.log_file}\n")
+
+                if stage_timings:
+                    f.write(f"\nStage Timings:\n")
+                    for line in stage_timings:
+                        f.write(f"  {line}\n")
 
             logger.info(f"Summary report saved to {report_file}")
 
         except Exception as e:
             logger.error(f"Error creating summary report: {e}")
 
-    def run(self) -> bool:
+    @staticmethod
+    def _write_stats(f, stats: RunningDealStats) -> None:
+        f.write(f"  Total Deals: {stats.total_deals}\n")
+
+        if stats.discount_count:
+            f.write(f"  Average Discount: {stats.mean_discount:.2f}%\n")
+            f.write(f"  Max Discount: {stats.discount_max:.2f}%\n")
+
+        if stats.quality_counts:
+            f.write(f"\n  Deal Quality Breakdown:\n")
+            for quality, count in stats.quality_counts.most_common():
+                f.write(f"    {quality}: {count}\n")
+
+        if stats.store_counts:
+            f.write(f"\n  Deals by Store:\n")
+            for store, count in stats.store_counts.most_common(10):
+                f.write(f"    {store}: {count}\n")
+
+    def save_aggregate_state(self) -> None:
+        """Persist all-time totals and the file manifest (non-fatal)"""
+        try:
+            self.aggregates.save()
+        except Exception as e:
+            logger.error(f"Error saving aggregate state: {e}")
+
+    def export_metrics(self, mode: str, success: bool) -> None:
+        """
+        Export this run's metrics (non-fatal)
+
+        Appends one JSON record to metrics/pipeline_runs.jsonl and rewrites
+        metrics/playsmart.prom for Prometheus' node_exporter textfile collector.
+
+        Args:
+            mode: "batch" or "stream"
+            success: Whether the run succeeded
+        """
+        try:
+            METRICS.export_json(self.metrics_dir / "pipeline_runs.jsonl", mode=mode, success=success)
+            METRICS.export_prometheus(self.metrics_dir / "playsmart.prom", success=success)
+            logger.info(f"Exported run metrics to {self.metrics_dir}")
+        except Exception as e:
+            logger.error(f"Error exporting metrics: {e}")
+
+    def log_http_stats(self) -> None:
+        """Log cache effectiveness plus retry counts and backoff time accumulated by the fetcher"""
+        if self.fetcher.cache:
+            cache_stats = self.fetcher.cache.stats()
+            logger.info(
+                f"HTTP cache: {cache_stats['hits']} hits, {cache_stats['revalidated']} revalidated, "
+                f"{cache_stats['misses']} misses ({cache_stats['entries']} entries stored)"
+            )
+
+        retries = self.fetcher.retry_summary()
+        if not retries:
+            logger.info("HTTP retries: none")
+            return
+
+        for endpoint, stats in retries.items():
+            logger.info(
+                f"HTTP retries for /{endpoint}: {stats['retries']} "
+                f"({stats['wait_seconds']:.1f}s spent backing off)"
+            )
+
+    def build_stages(self) -> List[Stage]:
         """
-        Execute the complete pipeline
+        Declare the batch pipeline as a stage graph
+
+        deals, stores and Game Pass have no dependencies and fetch
+        concurrently; game details enrichment runs alongside transform.
+
+        Returns:
+            Stages in report order
+        """
+        return [
+            Stage("deals", lambda _: self.fetch_deals()),
+            Stage("validate", lambda r: self.validate_deals(r["deals"]), deps=("deals",)),
+            Stage(
+                "game_pass",
+                lambda _: self.fetcher.fetch_game_pass_catalog() if APIConfig.JOIN_GAME_PASS else None,
+                required=False,
+            ),
+            Stage("stores", lambda _: self.load_store_catalog(), required=False),
+            Stage(
+                "transform",
+                lambda r: self.transform_and_save_deals(r["validate"], r["game_pass"], r["stores"]),
+                deps=("validate", "game_pass", "stores"),
+            ),
+            Stage(
+                "game_details",
+                lambda r: self.enrich_game_details(r["validate"]) if APIConfig.ENRICH_GAME_DETAILS else None,
+                deps=("validate",),
+                required=False,
+            ),
+            Stage(
+                "report",
+                lambda r: self.finish_run(r["transform"]),
+                deps=("transform", "game_details"),
+                checkpoint=False,
+            ),
+        ]
+
+    def finish_run(self, transformed_df: pd.DataFrame) -> RunningDealStats:
+        """
+        Fold this run into the all-time totals, compact old snapshots and write the summary
+
+        Args:
+            transformed_df: Processed deals of this run
+
+        Returns:
+            Stats over this run's deals
+        """
+        stats = RunningDealStats.from_frame(transformed_df)
+        self.aggregates.record_run(stats)
+        self.compact_snapshots()
+        self.create_summary_report(stats=stats, stage_timings=self.runner.timing_lines() if self.runner else None)
+        return stats
+
+    def run(self, resume: bool = True) -> bool:
+        """
+        Execute the complete pipeline as a stage graph
+
+        Each stage's output is checkpointed under cache/checkpoints, so after
+        a failure the next run resumes from the last completed stages
+        instead of refetching.
+
+        Args:
+            resume: Reuse checkpoints left by a failed run
 
         Returns:
             True if pipeline runs successfully, False otherwise
@@ -171,40 +874,121 @@ class GameDealPipeline:
         logger.info("Starting PlaySmart Game Deal Pipeline")
         logger.info("="*60)
 
+        METRICS.reset()
+        success = False
         try:
             # Validate configuration
             if not APIConfig.validate_config():
                 logger.error("API configuration validation failed")
                 return False
 
-            # Fetch deals
-            deals_df = self.fetch_deals()
-            if deals_df is None:
-                logger.error("Failed to fetch deals. Pipeline failed.")
-                return False
+            self.runner = StageRunner(
+                self.build_stages(),
+                self.cache_dir / "checkpoints",
+                max_workers=APIConfig.MAX_CONCURRENT_STAGES,
+                max_checkpoint_age=APIConfig.CHECKPOINT_MAX_AGE_SECONDS,
+            )
+            success = self.runner.run(resume=resume)
 
-            # Transform and save
-            transformed_df = self.transform_and_save_deals(deals_df)
-            if transformed_df is None:
-                logger.error("Failed to transform deals. Pipeline failed.")
-                return False
+            logger.info("Stage timings:")
+            for line in self.runner.timing_lines():
+                logger.info(f"  {line}")
 
-            # Create summary report
-            self.create_summary_report(transformed_df)
+            if not success:
+                logger.error("Pipeline failed; completed stages are checkpointed for the next run")
+                return False
 
             logger.info("="*60)
             logger.info("PlaySmart Pipeline Completed Successfully!")
             logger.info("="*60)
             logger.info(f"Check {self.processed_dir} for processed data files")
-            logger.info(f"Processed {len(transformed_df)} game deals")
+            logger.info(f"Processed {len(self.runner.results['transform'])} game deals")
             return True
 
         except Exception as e:
             logger.error(f"Pipeline execution failed: {e}", exc_info=True)
             return False
 
+        finally:
+            self.save_aggregate_state()
+            self.log_http_stats()
+            self.export_metrics("batch", success)
+
+    def run_daemon(
+        self,
+        job: Optional[Callable[[], bool]] = None,
+        interval: Optional[float] = None,
+        jitter: Optional[float] = None,
+    ) -> None:
+        """
+        Run the pipeline repeatedly in this process until SIGTERM/SIGINT
+
+        The HTTP session, response cache and aggregate state stay warm
+        between runs. A tick that arrives while the previous run is still in
+        progress is skipped, and shutdown waits for the current run.
+
+        Args:
+            job: Callable for one run (defaults to run)
+            interval: Seconds between runs (defaults to APIConfig.DAEMON_INTERVAL_SECONDS)
+            jitter: Random +/- seconds per interval (defaults to APIConfig.DAEMON_JITTER_SECONDS)
+        """
+        scheduler = IntervalScheduler(
+            job or self.run,
+            interval if interval is not None else APIConfig.DAEMON_INTERVAL_SECONDS,
+            jitter if jitter is not None else APIConfig.DAEMON_JITTER_SECONDS,
+        )
+        scheduler.install_signal_handlers()
+        try:
+            scheduler.run_forever()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Persist aggregate state and release the HTTP session, cache and log file"""
+        self.save_aggregate_state()
+        self.fetcher.close()
+        logging.getLogger().removeHandler(self._log_handler)
+        self._log_handler.close()
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the PlaySmart game deal pipeline")
+    parser.add_argument("--stream", action="store_true",
+                        help="Walk the paginated deals catalog in bounded memory")
+    parser.add_argument("--raw-file", type=Path,
+                        help="Stream-transform an existing raw snapshot instead of fetching")
+    parser.add_argument("--max-rows", type=int, help="Deal budget for --stream")
+    parser.add_argument("--max-pages", type=int, help="Page budget for --stream")
+    parser.add_argument("--top-k", type=int, help="Keep only the best K deals when streaming")
+    parser.add_argument("--fresh", action="store_true",
+                        help="Ignore checkpoints from a failed run and start over")
+    parser.add_argument("--daemon", action="store_true",
+                        help="Keep running on an interval until SIGTERM instead of exiting")
+    parser.add_argument("--interval", type=float,
+                        help="Seconds between --daemon runs (default: APIConfig.DAEMON_INTERVAL_SECONDS)")
+    parser.add_argument("--jitter", type=float,
+                        help="Random +/- seconds added to each --daemon interval")
+    return parser.parse_args()
+
 
 if __name__ == "__main__":
+    args = parse_args()
     pipeline = GameDealPipeline()
-    success = pipeline.run()
+
+    if args.stream or args.raw_file:
+        job = lambda: pipeline.run_stream(
+            max_rows=args.max_rows,
+            max_pages=args.max_pages,
+            raw_file=args.raw_file,
+            top_k=args.top_k,
+        )
+    else:
+        job = lambda: pipeline.run(resume=not args.fresh)
+
+    if args.daemon:
+        pipeline.run_daemon(job, interval=args.interval, jitter=args.jitter)
+        sys.exit(0)
+
+    success = job()
+    pipeline.close()
     sys.exit(0 if success else 1)
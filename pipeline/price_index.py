@@ -0,0 +1,100 @@
+"""
+Best Price Index Module
+Loads the per-game best price index saved alongside each deals snapshot
+and answers "cheapest place to buy X" without scanning the deals
+"""
+
+import logging
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Compact dtypes for the index columns
+INDEX_SCHEMA = {
+    "game_id": "Int32",
+    "retail_price": "float32",
+    "discount_pct": "float32",
+    "deal_rating": "float32",
+    "best_price": "float32",
+    "best_store": "category",
+    "best_store_id": "Int16",
+    "runner_up_price": "float32",
+    "runner_up_store": "category",
+    "runner_up_store_id": "Int16",
+    "store_count": "int32",
+}
+
+
+class BestPriceIndex:
+    """Per-game best price lookup backed by a hash index on game_id"""
+
+    def __init__(self, index: pd.DataFrame):
+        """
+        Args:
+            index: Frame from GameDataTransformer.build_best_price_index,
+                indexed by game_id and ordered by best discount
+        """
+        self.index = index
+
+    @staticmethod
+    def index_path(deals_file: Path) -> Path:
+        """Index file stored alongside a deals_processed_<ts> snapshot"""
+        deals_file = Path(deals_file)
+        name = deals_file.name.replace("deals_processed_", "best_prices_", 1)
+        return deals_file.with_name(name).with_suffix(".csv")
+
+    def save(self, path: Path) -> None:
+        """Write the index to CSV"""
+        self.index.to_csv(path, index=True)
+
+    @classmethod
+    def load(cls, path: Path) -> "BestPriceIndex":
+        """
+        Read an index written by save
+
+        Args:
+            path: Index CSV
+
+        Returns:
+            BestPriceIndex with compact dtypes
+        """
+        header = pd.read_csv(path, nrows=0).columns
+        dtypes = {col: dtype for col, dtype in INDEX_SCHEMA.items() if col in header}
+        index = pd.read_csv(path, dtype=dtypes).set_index("game_id")
+        return cls(index)
+
+    def lookup(self, game_id: int) -> Optional[dict]:
+        """
+        Best and runner-up price for one game (hash lookup, O(1))
+
+        Args:
+            game_id: CheapShark game ID
+
+        Returns:
+            Dictionary of index columns or None if the game is not indexed
+        """
+        try:
+            row = self.index.loc[game_id]
+        except KeyError:
+            return None
+        return {"game_id": game_id, **row.to_dict()}
+
+    def best_deals(self, k: int = 20) -> pd.DataFrame:
+        """
+        Best deal per game, highest discount first (O(k) read of the ordered index)
+
+        Args:
+            k: Number of games
+
+        Returns:
+            Top k rows of the index
+        """
+        return self.index.head(k)
+
+    def __len__(self) -> int:
+        return len(self.index)
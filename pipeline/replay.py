@@ -0,0 +1,264 @@
+"""
+CheapShark Record/Replay Module
+Captures real API responses to fixture files and serves them back from a
+local stand-in server with configurable latency, errors and rate limiting,
+so fetching and caching can be benchmarked without network access
+
+Record:  CHEAPSHARK_RECORD_DIR=fixtures/cheapshark python pipeline/pipeline.py
+Replay:  python pipeline/replay.py --fixtures fixtures/cheapshark --port 8765
+         CHEAPSHARK_BASE_URL=http://127.0.0.1:8765/api/1.0 python pipeline/pipeline.py
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def fixture_name(endpoint: str, params: Optional[Dict[str, str]] = None) -> str:
+    """
+    Build the fixture file name for a request
+
+    Args:
+        endpoint: Endpoint path relative to the API base (e.g. "deals")
+        params: Query parameters (order does not matter)
+
+    Returns:
+        File name such as "deals_3f2a9c1b0d4e5f67.json"
+    """
+    query = urlencode(sorted((params or {}).items()))
+    digest = hashlib.sha1(query.encode("utf-8")).hexdigest()[:16]
+    return f"{endpoint.strip('/').replace('/', '_')}_{digest}.json"
+
+
+class FixtureRecorder:
+    """Writes successful API responses to fixture files"""
+
+    def __init__(self, fixture_dir: Path):
+        """
+        Args:
+            fixture_dir: Directory receiving one JSON file per distinct request
+        """
+        self.fixture_dir = Path(fixture_dir)
+        self.fixture_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, params: Dict[str, str], response: requests.Response) -> None:
+        """
+        Save a response as a fixture, replacing any earlier recording
+
+        Args:
+            endpoint: Endpoint path relative to the API base
+            params: Query parameters sent
+            response: Successful response
+        """
+        headers = {
+            name: response.headers[name]
+            for name in ("ETag", "Last-Modified")
+            if name in response.headers
+        }
+        self.record_payload(endpoint, params, response.json(), headers)
+
+    def record_payload(
+        self, endpoint: str, params: Dict[str, str], body: Any, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Save an already decoded response, e.g. one served from the response cache
+
+        Args:
+            endpoint: Endpoint path relative to the API base
+            params: Query parameters sent
+            body: Decoded JSON body
+            headers: ETag / Last-Modified validators to replay
+        """
+        fixture = {
+            "endpoint": endpoint,
+            "params": dict(params or {}),
+            "headers": dict(headers or {}),
+            "body": body,
+        }
+
+        path = self.fixture_dir / fixture_name(endpoint, params)
+        with self._lock:
+            path.write_text(json.dumps(fixture), encoding="utf-8")
+
+
+class ReplayServer:
+    """Local HTTP stand-in for the CheapShark API serving recorded fixtures"""
+
+    def __init__(
+        self,
+        fixture_dir: Path,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            fixture_dir: Directory of recorded fixtures
+            host: Interface to bind
+            port: Port to bind (0 picks a free port)
+            latency: Seconds added to every response
+            latency_jitter: Extra uniformly random delay up to this many seconds
+            error_rate: Fraction of requests answered with HTTP 503
+            rate_limit_rate: Fraction of requests answered with HTTP 429
+            retry_after: Retry-After value sent with injected 429 responses
+            seed: Random seed for reproducible fault injection
+        """
+        self.fixture_dir = Path(fixture_dir)
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self._random_lock = threading.Lock()
+
+        self.request_counts: Dict[int, int] = {}
+        self._counts_lock = threading.Lock()
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """Value to use for APIConfig.CHEAPSHARK_BASE_URL"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api/1.0"
+
+    def _count(self, status: int) -> None:
+        with self._counts_lock:
+            self.request_counts[status] = self.request_counts.get(status, 0) + 1
+
+    def _load_fixture(self, endpoint: str, params: Dict[str, str]) -> Optional[dict]:
+        path = self.fixture_dir / fixture_name(endpoint, params)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                endpoint = parts.path.rstrip("/").rsplit("/", 1)[-1]
+                params = dict(parse_qsl(parts.query))
+
+                with server._random_lock:
+                    delay = server.latency + server.random.uniform(0, server.latency_jitter)
+                    roll = server.random.random()
+                time.sleep(delay)
+
+                if roll < server.rate_limit_rate:
+                    self._send(429, [], {"Retry-After": str(server.retry_after)})
+                    return
+                if roll < server.rate_limit_rate + server.error_rate:
+                    self._send(503, [])
+                    return
+
+                fixture = server._load_fixture(endpoint, params)
+                if fixture is None:
+                    # CheapShark answers unknown lookups with an empty list
+                    self._send(200, [])
+                    return
+
+                headers = fixture.get("headers", {})
+                etag = headers.get("ETag")
+                if etag and self.headers.get("If-None-Match") == etag:
+                    self._send(304, None, headers)
+                    return
+
+                self._send(200, fixture["body"], headers)
+
+            def _send(self, status: int, body, headers: Optional[Dict[str, str]] = None):
+                server._count(status)
+                payload = b"" if body is None else json.dumps(body).encode("utf-8")
+
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                logger.debug(format % args)
+
+        return Handler
+
+    def start(self) -> "ReplayServer":
+        """Serve in a background thread"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(f"Replay server listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Serve recorded CheapShark fixtures locally")
+    parser.add_argument("--fixtures", type=Path, required=True, help="Fixture directory")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added per response")
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction answered with 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Fraction answered with 429")
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = ReplayServer(
+        args.fixtures,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        seed=args.seed,
+    )
+    logger.info(f"Serving fixtures from {args.fixtures} at {server.base_url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+Scheduler Module
+Runs a job on a fixed interval with random jitter inside one long-lived
+process, skipping ticks while the previous run is still going and
+stopping cleanly on SIGTERM/SIGINT
+"""
+
+import logging
+import random
+import signal
+import threading
+import time
+from typing import Callable, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class IntervalScheduler:
+    """Fires a job every interval (+/- jitter) seconds on a worker thread"""
+
+    def __init__(
+        self,
+        job: Callable[[], object],
+        interval: float,
+        jitter: float = 0.0,
+        run_immediately: bool = True,
+        seed: Optional[int] = None,
+    ):
+        """
+        Args:
+            job: Callable run on each tick (its return value is logged)
+            interval: Seconds between ticks
+            jitter: Each wait is shifted by a uniform random amount in [-jitter, jitter]
+            run_immediately: Fire the first tick at start-up instead of after one interval
+            seed: Random seed for reproducible jitter
+        """
+        self.job = job
+        self.interval = interval
+        self.jitter = min(jitter, interval)
+        self.run_immediately = run_immediately
+        self.random = random.Random(seed)
+
+        self.stop_event = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self.runs = 0
+        self.skipped = 0
+
+    def next_delay(self) -> float:
+        """Seconds until the next tick"""
+        return max(0.0, self.interval + self.random.uniform(-self.jitter, self.jitter))
+
+    def is_running(self) -> bool:
+        """True while a job run is in progress"""
+        return self._worker is not None and self._worker.is_alive()
+
+    def _run_job(self) -> None:
+        start = time.perf_counter()
+        try:
+            result = self.job()
+            logger.info(f"Scheduled run finished in {time.perf_counter() - start:.1f}s (result: {result})")
+        except Exception as e:
+            logger.error(f"Scheduled run failed after {time.perf_counter() - start:.1f}s: {e}", exc_info=True)
+
+    def tick(self) -> bool:
+        """
+        Start a run unless the previous one is still in progress
+
+        Returns:
+            True if a run was started
+        """
+        if self.is_running():
+            self.skipped += 1
+            logger.warning("Previous run still in progress; skipping this tick")
+            return False
+
+        self.runs += 1
+        self._worker = threading.Thread(target=self._run_job, name=f"scheduled-run-{self.runs}")
+        self._worker.start()
+        return True
+
+    def stop(self, *_) -> None:
+        """Request shutdown (safe to call from a signal handler)"""
+        if not self.stop_event.is_set():
+            logger.info("Shutdown requested; finishing the current run before exiting")
+        self.stop_event.set()
+
+    def install_signal_handlers(self) -> None:
+        """Route SIGTERM, SIGINT (and SIGBREAK on Windows) to stop()"""
+        for name in ("SIGTERM", "SIGINT", "SIGBREAK"):
+            signum = getattr(signal, name, None)
+            if signum is not None:
+                signal.signal(signum, self.stop)
+
+    def run_forever(self) -> None:
+        """Tick until stop() is called, then wait for the in-flight run to finish"""
+        logger.info(
+            f"Scheduler started: every {self.interval:.0f}s (+/- {self.jitter:.0f}s jitter)"
+        )
+
+        delay = 0.0 if self.run_immediately else self.next_delay()
+        while not self.stop_event.wait(delay):
+            self.tick()
+            delay = self.next_delay()
+            logger.info(f"Next run in {delay:.0f}s")
+
+        if self.is_running():
+            self._worker.join()
+        logger.info(f"Scheduler stopped after {self.runs} runs ({self.skipped} ticks skipped)")
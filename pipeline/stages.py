@@ -0,0 +1,201 @@
+"""
+Pipeline Stages Module
+Runs pipeline stages declared as a dependency graph: independent stages
+run concurrently, each completed stage's output is checkpointed so a
+failed run resumes where it stopped, and per-stage wall time is recorded
+"""
+
+import logging
+import os
+import pickle
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from metrics import METRICS
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Stage:
+    """One pipeline step and the stages whose outputs it consumes"""
+
+    name: str
+    func: Callable[[Dict[str, Any]], Any]
+    deps: Tuple[str, ...] = ()
+    # A required stage failing (exception or None output) fails the run;
+    # an optional one passes None on to its dependents. None outputs are
+    # never checkpointed, so a resumed run retries the stage
+    required: bool = True
+    checkpoint: bool = True
+
+
+class StageRunner:
+    """Schedules stages on a thread pool as soon as their dependencies finish"""
+
+    def __init__(
+        self,
+        stages: Sequence[Stage],
+        checkpoint_dir: Path,
+        max_workers: int = 4,
+        max_checkpoint_age: Optional[float] = None,
+    ):
+        """
+        Args:
+            stages: Stages in report order (dependencies must be declared first)
+            checkpoint_dir: Directory for per-stage output checkpoints
+            max_workers: Stages run at once
+            max_checkpoint_age: Ignore checkpoints older than this many seconds
+        """
+        self.stages = {stage.name: stage for stage in stages}
+        for stage in stages:
+            missing = [dep for dep in stage.deps if dep not in self.stages]
+            if missing:
+                raise ValueError(f"Stage {stage.name!r} depends on unknown stages {missing}")
+
+        self.checkpoint_dir = Path(checkpoint_dir)
+        self.max_workers = max_workers
+        self.max_checkpoint_age = max_checkpoint_age
+        self.results: Dict[str, Any] = {}
+        self.timings: Dict[str, dict] = {}
+
+    def _checkpoint_path(self, name: str) -> Path:
+        return self.checkpoint_dir / f"{name}.pkl"
+
+    def _load_checkpoint(self, stage: Stage) -> Tuple[bool, Any]:
+        """(found, output) for a usable checkpoint of stage"""
+        path = self._checkpoint_path(stage.name)
+        if not stage.checkpoint or not path.exists():
+            return False, None
+        if self.max_checkpoint_age is not None and time.time() - path.stat().st_mtime > self.max_checkpoint_age:
+            logger.info(f"Ignoring stale checkpoint for stage {stage.name}")
+            return False, None
+
+        try:
+            with open(path, "rb") as f:
+                output = pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Unreadable checkpoint for stage {stage.name}: {e}")
+            return False, None
+        return output is not None, output
+
+    def _save_checkpoint(self, stage: Stage, output: Any) -> None:
+        if not stage.checkpoint:
+            return
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+        path = self._checkpoint_path(stage.name)
+        temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, "wb") as f:
+                pickle.dump(output, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not checkpoint stage {stage.name}: {e}")
+
+    def clear_checkpoints(self) -> None:
+        """Delete every stage checkpoint"""
+        for name in self.stages:
+            self._checkpoint_path(name).unlink(missing_ok=True)
+
+    @staticmethod
+    def _execute(stage: Stage, inputs: Dict[str, Any]) -> Tuple[Any, float, Optional[Exception]]:
+        start = time.perf_counter()
+        try:
+            with METRICS.track(f"stage.{stage.name}"):
+                output = stage.func(inputs)
+            error = None
+        except Exception as e:
+            output, error = None, e
+        return output, time.perf_counter() - start, error
+
+    def run(self, resume: bool = True) -> bool:
+        """
+        Run every stage, resuming from checkpoints of an earlier failed run
+
+        Checkpoints are cleared once all stages succeed, so the next run
+        starts fresh.
+
+        Args:
+            resume: Reuse existing checkpoints (False discards them first)
+
+        Returns:
+            True if every required stage succeeded
+        """
+        if not resume:
+            self.clear_checkpoints()
+
+        self.results, self.timings = {}, {}
+        pending = dict(self.stages)
+        running: Dict[Future, str] = {}
+        failed = False
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="stage") as executor:
+            while True:
+                # Start (or restore) every stage whose dependencies are done
+                progressed = True
+                while progressed and not failed:
+                    progressed = False
+                    for name, stage in list(pending.items()):
+                        if not all(dep in self.results for dep in stage.deps):
+                            continue
+                        del pending[name]
+                        progressed = True
+
+                        found, output = self._load_checkpoint(stage) if resume else (False, None)
+                        if found:
+                            self.results[name] = output
+                            self.timings[name] = {"seconds": 0.0, "status": "resumed"}
+                            logger.info(f"Stage {name}: resumed from checkpoint")
+                            continue
+
+                        inputs = {dep: self.results[dep] for dep in stage.deps}
+                        logger.info(f"Stage {name}: started")
+                        running[executor.submit(self._execute, stage, inputs)] = name
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    stage = self.stages[name]
+                    output, seconds, error = future.result()
+
+                    if error is None and output is not None:
+                        self.results[name] = output
+                        self.timings[name] = {"seconds": seconds, "status": "ok"}
+                        self._save_checkpoint(stage, output)
+                        logger.info(f"Stage {name}: done in {seconds:.2f}s")
+                        continue
+
+                    reason = f"{error}" if error is not None else "no output"
+                    self.timings[name] = {"seconds": seconds, "status": "failed" if error else "no output"}
+                    if stage.required:
+                        failed = True
+                        logger.error(f"Stage {name} failed after {seconds:.2f}s: {reason}")
+                    else:
+                        # Optional stages degrade to None for their dependents
+                        self.results[name] = None
+                        logger.warning(f"Optional stage {name} failed after {seconds:.2f}s: {reason}")
+
+        for name in pending:
+            self.timings[name] = {"seconds": 0.0, "status": "skipped"}
+
+        success = not failed and not pending
+        if success:
+            self.clear_checkpoints()
+        return success
+
+    def timing_lines(self) -> List[str]:
+        """Per-stage wall time and status, in declaration order"""
+        lines = []
+        for name in self.stages:
+            timing = self.timings.get(name)
+            if timing is not None:
+                lines.append(f"{name:14s} {timing['seconds']:8.2f}s  {timing['status']}")
+        return lines
@@ -0,0 +1,370 @@
+"""
+Storage Module
+Reads and writes raw and processed deal snapshots as CSV, Parquet or
+Feather, preserving the compact dtype schema declared by GameDataTransformer
+"""
+
+import logging
+import operator
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.feather as feather
+import pyarrow.ipc as ipc
+import pyarrow.parquet as pq
+
+from metrics import instrumented
+from transform import GameDataTransformer
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def write_deals_csv(df: pd.DataFrame, path: Path) -> int:
+    """
+    Write a processed deals frame to CSV
+
+    Args:
+        df: Processed deals DataFrame
+        path: Destination file
+
+    Returns:
+        Bytes written
+    """
+    df.to_csv(path, index=False)
+    return Path(path).stat().st_size
+
+
+def _csv_dtypes(path: Path, columns: Optional[List[str]] = None) -> dict:
+    """DEALS_SCHEMA dtypes for the columns present in a CSV header"""
+    header = pd.read_csv(path, nrows=0).columns
+    return {
+        col: dtype
+        for col, dtype in GameDataTransformer.DEALS_SCHEMA.items()
+        if col in header and (columns is None or col in columns)
+    }
+
+
+def read_deals_csv(path: Path, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a processed deals CSV back with the compact schema
+
+    Args:
+        path: CSV file written by write_deals_csv
+        columns: Only load these columns
+
+    Returns:
+        DataFrame with DEALS_SCHEMA dtypes
+    """
+    df = pd.read_csv(path, usecols=columns, dtype=_csv_dtypes(path, columns))
+    return GameDataTransformer.apply_deals_schema(df)
+
+
+def iter_deals_csv(path: Path, chunksize: int, columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Read a processed deals CSV in chunks with the compact schema
+
+    Args:
+        path: CSV file written by write_deals_csv
+        chunksize: Rows per chunk
+        columns: Only load these columns
+
+    Yields:
+        DataFrame chunks with DEALS_SCHEMA dtypes
+    """
+    reader = pd.read_csv(path, usecols=columns, dtype=_csv_dtypes(path, columns), chunksize=chunksize)
+    with reader:
+        for chunk in reader:
+            yield GameDataTransformer.apply_deals_schema(chunk)
+
+
+def iter_raw_deals_csv(path: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Read a raw deals_raw_*.csv snapshot in chunks
+
+    Args:
+        path: Raw CSV saved by the pipeline
+        chunksize: Rows per chunk
+
+    Yields:
+        Raw DataFrame chunks
+    """
+    with pd.read_csv(path, chunksize=chunksize) as reader:
+        yield from reader
+
+
+# Snapshot formats by file extension
+FORMAT_SUFFIXES = {"csv": ".csv", "parquet": ".parquet", "feather": ".feather"}
+
+# Run timestamp embedded in every snapshot file name
+_SNAPSHOT_STAMP = re.compile(r"(\d{8}_\d{6})")
+COMPRESSION = "zstd"
+
+# Row filters: (column, op, value) tuples combined with AND, as in pd.read_parquet
+Filter = Tuple[str, str, object]
+
+_FILTER_OPS = {
+    "==": operator.eq,
+    "=": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+def snapshot_suffix(fmt: str) -> str:
+    """
+    File extension for a storage format
+
+    Args:
+        fmt: "csv", "parquet" or "feather"
+
+    Returns:
+        Extension including the dot
+    """
+    try:
+        return FORMAT_SUFFIXES[fmt]
+    except KeyError:
+        raise ValueError(f"Unknown storage format {fmt!r}; expected one of {sorted(FORMAT_SUFFIXES)}")
+
+
+def snapshot_format(path: Path) -> str:
+    """Storage format of a snapshot file, from its extension"""
+    suffix = Path(path).suffix.lower()
+    for fmt, fmt_suffix in FORMAT_SUFFIXES.items():
+        if suffix == fmt_suffix:
+            return fmt
+    raise ValueError(f"Unsupported snapshot file {path}")
+
+
+def snapshot_files(directory: Path, prefix: str) -> List[Path]:
+    """
+    Snapshot files in any supported format, newest name first
+
+    Args:
+        directory: Directory to list
+        prefix: File name prefix, e.g. "deals_processed_"
+
+    Returns:
+        Paths sorted by name, descending
+    """
+    return sorted(
+        (path for suffix in FORMAT_SUFFIXES.values() for path in Path(directory).glob(f"{prefix}*{suffix}")),
+        key=lambda path: path.name,
+        reverse=True,
+    )
+
+
+def snapshot_time(path: Path) -> Optional[pd.Timestamp]:
+    """
+    Parse the run timestamp from a deals_<kind>_YYYYmmdd_HHMMSS.<ext> name
+
+    Args:
+        path: Snapshot path
+
+    Returns:
+        Timestamp of the run or None if the name does not carry one
+    """
+    match = _SNAPSHOT_STAMP.search(Path(path).name)
+    if not match:
+        return None
+    try:
+        return pd.Timestamp(datetime.strptime(match.group(1), "%Y%m%d_%H%M%S"))
+    except ValueError:
+        return None
+
+
+@instrumented("storage.write_deals", bytes_result=True)
+def write_deals(df: pd.DataFrame, path: Path) -> int:
+    """
+    Write a deals frame in the format given by the file extension
+
+    Parquet and Feather are compressed and keep dtypes (including
+    categoricals), so nothing has to be re-parsed on load.
+
+    Args:
+        df: Raw or processed deals DataFrame
+        path: Destination .csv, .parquet or .feather file
+
+    Returns:
+        Bytes written
+    """
+    fmt = snapshot_format(path)
+    if fmt == "csv":
+        return write_deals_csv(df, path)
+
+    if fmt == "parquet":
+        df.to_parquet(path, index=False, compression=COMPRESSION)
+    else:
+        feather.write_feather(
+            pa.Table.from_pandas(df, preserve_index=False), str(path), compression=COMPRESSION
+        )
+    return Path(path).stat().st_size
+
+
+def _filter_mask(df: pd.DataFrame, filters: Sequence[Filter]) -> np.ndarray:
+    """Boolean mask for AND-ed (column, op, value) filters over a loaded frame"""
+    mask = np.ones(len(df), dtype=bool)
+    for col, op, value in filters:
+        if op == "in":
+            hit = df[col].isin(value)
+        elif op == "not in":
+            hit = ~df[col].isin(value)
+        else:
+            hit = _FILTER_OPS[op](df[col], value)
+        mask &= hit.fillna(False).to_numpy(dtype=bool)
+    return mask
+
+
+@instrumented("storage.read_deals")
+def read_deals(
+    path: Path,
+    columns: Optional[List[str]] = None,
+    filters: Optional[Sequence[Filter]] = None,
+) -> pd.DataFrame:
+    """
+    Read a processed deals snapshot in any supported format
+
+    For Parquet and Feather only the requested columns are decoded and
+    filters are pushed into the scan (Parquet also skips row groups by
+    their statistics). CSV falls back to usecols plus an in-memory filter.
+
+    Args:
+        path: Snapshot written by write_deals
+        columns: Only load these columns
+        filters: (column, op, value) tuples combined with AND; op is one of
+            ==, !=, <, <=, >, >=, in, not in
+
+    Returns:
+        DataFrame with DEALS_SCHEMA dtypes, in file order
+    """
+    fmt = snapshot_format(path)
+
+    if fmt == "csv":
+        filter_columns = [col for col, _, _ in filters or []]
+        load = None if columns is None else list(dict.fromkeys(list(columns) + filter_columns))
+        df = read_deals_csv(path, load)
+        if filters:
+            df = df[_filter_mask(df, filters)]
+        return df if columns is None else df[list(columns)]
+
+    dataset = ds.dataset(str(path), format="parquet" if fmt == "parquet" else "feather")
+    table = dataset.to_table(
+        columns=list(columns) if columns is not None else None,
+        filter=pq.filters_to_expression(list(filters)) if filters else None,
+    )
+    return GameDataTransformer.apply_deals_schema(table.to_pandas())
+
+
+def deals_columns(path: Path) -> List[str]:
+    """Column names of a snapshot without loading its rows"""
+    if snapshot_format(path) == "csv":
+        return list(pd.read_csv(path, nrows=0).columns)
+    fmt = "parquet" if snapshot_format(path) == "parquet" else "feather"
+    return list(ds.dataset(str(path), format=fmt).schema.names)
+
+
+def iter_raw_deals(path: Path, chunksize: int) -> Iterator[pd.DataFrame]:
+    """
+    Read a raw deals_raw_* snapshot in chunks, in any supported format
+
+    Args:
+        path: Raw snapshot saved by the pipeline
+        chunksize: Rows per chunk
+
+    Yields:
+        Raw DataFrame chunks
+    """
+    fmt = snapshot_format(path)
+    if fmt == "csv":
+        yield from iter_raw_deals_csv(path, chunksize)
+        return
+
+    dataset = ds.dataset(str(path), format="parquet" if fmt == "parquet" else "feather")
+    for batch in dataset.to_batches(batch_size=chunksize):
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+
+def read_raw_deals(path: Path) -> pd.DataFrame:
+    """Read a whole raw deals_raw_* snapshot in any supported format"""
+    if snapshot_format(path) == "csv":
+        return pd.read_csv(path)
+    return pd.read_parquet(path) if snapshot_format(path) == "parquet" else pd.read_feather(path)
+
+
+class DealsFileWriter:
+    """Appends deal chunks to one snapshot file in any supported format"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: Destination .csv, .parquet or .feather file (overwritten)
+        """
+        self.path = Path(path)
+        self.format = snapshot_format(path)
+        self.rows = 0
+        self._schema: Optional[pa.Schema] = None
+        self._writer = None
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """
+        Append one chunk (columns must match the first chunk)
+
+        Args:
+            chunk: Deals chunk
+        """
+        if self.format == "csv":
+            chunk.to_csv(self.path, mode="a" if self.rows else "w", header=not self.rows, index=False)
+            self.rows += len(chunk)
+            return
+
+        # Each chunk has its own categories; store plain values so every
+        # batch shares one schema (DEALS_SCHEMA restores them on read)
+        plain = {
+            col: chunk[col].astype(chunk[col].dtype.categories.dtype)
+            for col in chunk.columns
+            if isinstance(chunk[col].dtype, pd.CategoricalDtype)
+        }
+        if plain:
+            chunk = chunk.assign(**plain)
+
+        table = pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False)
+        if self._writer is None:
+            # An all-null column in the first chunk infers Arrow's null type,
+            # which later chunks holding values could not be cast to; optional
+            # raw fields are strings, so widen them to string instead
+            self._schema = pa.schema([
+                field.with_type(pa.large_string()) if pa.types.is_null(field.type) else field
+                for field in table.schema
+            ], metadata=table.schema.metadata)
+            table = table.cast(self._schema)
+            if self.format == "parquet":
+                self._writer = pq.ParquetWriter(str(self.path), self._schema, compression=COMPRESSION)
+            else:
+                options = ipc.IpcWriteOptions(compression=COMPRESSION)
+                self._writer = ipc.new_file(str(self.path), self._schema, options=options)
+
+        self._writer.write_table(table)
+        self.rows += len(chunk)
+
+    def close(self) -> None:
+        """Finish the file"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self) -> "DealsFileWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
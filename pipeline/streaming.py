@@ -0,0 +1,157 @@
+"""
+Streaming Module
+Bounded-memory ordering of transformed deal chunks: an external k-way
+merge sort over spilled sorted runs, and a running top-K selection
+"""
+
+import heapq
+import logging
+import math
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence
+
+import pandas as pd
+
+from storage import DealsFileWriter, iter_deals_csv, write_deals_csv
+from transform import GameDataTransformer
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Sort keys shared with GameDataTransformer.sort_by_deal_quality (both descending)
+SORT_COLUMNS = ["deal_rating", "discount_pct"]
+
+
+def _sort_key(rating_pos: int, discount_pos: int):
+    """Row-tuple key matching sort_by_deal_quality: best first, missing ratings last"""
+
+    def key(row: tuple) -> tuple:
+        rating = row[rating_pos]
+        missing = rating is None or (isinstance(rating, float) and math.isnan(rating))
+        return (missing, 0.0 if missing else -rating, -row[discount_pos])
+
+    return key
+
+
+def _iter_rows(path: Path, chunksize: int) -> Iterator[tuple]:
+    for chunk in iter_deals_csv(path, chunksize=chunksize):
+        yield from chunk.itertuples(index=False, name=None)
+
+
+def merge_sorted_runs(
+    run_paths: Sequence[Path],
+    output_path: Path,
+    chunksize: int = 50_000,
+    fan_in: int = 64,
+) -> int:
+    """
+    K-way merge of sorted deal CSV runs into one sorted snapshot
+
+    Each run is read back in chunks, so memory holds at most one chunk per
+    open run plus one output chunk. More than fan_in runs are merged in
+    several passes to bound the number of open files.
+
+    Args:
+        run_paths: CSV files, each already sorted by sort_by_deal_quality order
+        output_path: Destination file (.csv, .parquet or .feather)
+        chunksize: Rows read per run and written per output batch
+        fan_in: Maximum runs merged at once
+
+    Returns:
+        Number of rows written
+    """
+    run_paths = list(run_paths)
+    merge_pass = 0
+
+    while len(run_paths) > fan_in:
+        merged_runs = []
+        for start in range(0, len(run_paths), fan_in):
+            group = run_paths[start:start + fan_in]
+            merged = Path(group[0]).with_name(f"merge{merge_pass}_{start // fan_in:05d}.csv")
+            _merge_group(group, merged, chunksize)
+            for path in group:
+                path.unlink()
+            merged_runs.append(merged)
+        run_paths = merged_runs
+        merge_pass += 1
+
+    return _merge_group(run_paths, output_path, chunksize)
+
+
+def _merge_group(run_paths: List[Path], output_path: Path, chunksize: int) -> int:
+    if not run_paths:
+        return 0
+
+    columns = list(pd.read_csv(run_paths[0], nrows=0).columns)
+    key = _sort_key(columns.index(SORT_COLUMNS[0]), columns.index(SORT_COLUMNS[1]))
+    streams = [_iter_rows(path, chunksize) for path in run_paths]
+
+    batch: List[tuple] = []
+
+    with DealsFileWriter(output_path) as writer:
+
+        def flush() -> None:
+            writer.write(
+                GameDataTransformer.apply_deals_schema(pd.DataFrame.from_records(batch, columns=columns))
+            )
+            batch.clear()
+
+        for row in heapq.merge(*streams, key=key):
+            batch.append(row)
+            if len(batch) >= chunksize:
+                flush()
+        if batch or not writer.rows:
+            flush()
+
+    return writer.rows
+
+
+class TopKDeals:
+    """Keeps the k best deals (sort_by_deal_quality order) across streamed chunks"""
+
+    def __init__(self, k: int):
+        """
+        Args:
+            k: Number of deals to keep
+        """
+        self.k = k
+        self._top: Optional[pd.DataFrame] = None
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Merge a chunk into the current top k
+
+        Args:
+            chunk: Transformed deals chunk
+        """
+        if chunk is None or chunk.empty:
+            return
+
+        candidates = chunk if self._top is None else pd.concat([self._top, chunk], ignore_index=True)
+        self._top = (
+            GameDataTransformer.sort_by_deal_quality(candidates).head(self.k).reset_index(drop=True)
+        )
+
+    def result(self) -> pd.DataFrame:
+        """Current top k deals, best first"""
+        if self._top is None:
+            return pd.DataFrame()
+        return GameDataTransformer.apply_deals_schema(self._top)
+
+
+def spill_run(chunk: pd.DataFrame, run_dir: Path, index: int) -> Path:
+    """
+    Write one sorted chunk as a run file for merge_sorted_runs
+
+    Args:
+        chunk: Chunk already sorted by sort_by_deal_quality order
+        run_dir: Directory for temporary runs
+        index: Run number
+
+    Returns:
+        Path of the run file
+    """
+    path = Path(run_dir) / f"run_{index:05d}.csv"
+    write_deals_csv(chunk, path)
+    return path
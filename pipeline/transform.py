@@ -3,20 +3,89 @@ Data Transformation Module
 Cleans, validates, and enriches game price data with deal metrics
 """
 
+import contextlib
 import logging
+import re
+import tracemalloc
 import pandas as pd
 import numpy as np
-from typing import Optional
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+
+from metrics import instrumented
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Title normalization shared by the scalar and vectorized paths
+# (literal characters: pandas' Arrow-backed strings use RE2, which rejects \u escapes)
+_TITLE_SYMBOLS = "[\u2122\u00ae\u00a9]"  # trademark, registered, copyright signs
+_TITLE_SEPARATORS = r"[^0-9a-z]+"
+
+
+def normalize_title(title: str) -> str:
+    """
+    Normalize a game title for cross-source matching
+
+    Args:
+        title: Raw title, e.g. "DOOM Eternal - Deluxe Edition"
+
+    Returns:
+        Lowercase alphanumeric words separated by single spaces
+    """
+    title = str(title).lower().replace("&", " and ")
+    title = re.sub(_TITLE_SYMBOLS, "", title)
+    return re.sub(_TITLE_SEPARATORS, " ", title).strip()
+
+
+def _copy_on_write():
+    """Enable pandas copy-on-write for a block (always on from pandas 3.0)"""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return contextlib.nullcontext()
+    return pd.option_context("mode.copy_on_write", True)
+
 
 class GameDataTransformer:
     """Handles game deal data cleaning, validation, and feature engineering"""
 
+    # Discount % lower bounds and the deal quality label each one starts
+    DEAL_QUALITY_BINS = [10, 25, 50, 75]
+    DEAL_QUALITY_LABELS = ["Minimal", "Moderate", "Good", "Excellent", "Exceptional"]
+
+    # Raw CheapShark columns kept by the transform and their standardized names
+    RAW_COLUMN_MAP = {
+        "gameID": "game_id",
+        "title": "title",
+        "salePrice": "current_price",
+        "normalPrice": "retail_price",
+        "savings": "discount_amount",
+        "dealRating": "deal_rating",
+        "storeName": "store",
+        "storeID": "store_id",
+        "thumb": "thumbnail",
+        "isListed": "is_listed",
+    }
+    NUMERIC_COLUMNS = ["current_price", "retail_price", "discount_amount", "deal_rating"]
+    REQUIRED_COLUMNS = ["game_id", "title", "current_price"]
+
+    # Compact dtypes for processed deal frames. Prices and ratings fit in
+    # float32, IDs in small nullable integers; fetched_at is one value per
+    # run, so it is stored as a category rather than a timestamp per row.
+    DEAL_QUALITY_DTYPE = pd.CategoricalDtype(["Unknown"] + DEAL_QUALITY_LABELS, ordered=True)
+    DEALS_SCHEMA = {
+        "game_id": "Int32",
+        "retail_price": "float32",
+        "current_price": "float32",
+        "discount_amount": "float32",
+        "discount_pct": "float32",
+        "deal_rating": "float32",
+        "deal_quality": DEAL_QUALITY_DTYPE,
+        "store": "category",
+        "store_id": "Int16",
+    }
+
     @staticmethod
+    @instrumented("transform.clean_deal_data")
     def clean_deal_data(df: pd.DataFrame) -> pd.DataFrame:
         """
         Clean and standardize game deal data from CheapShark
@@ -31,41 +100,24 @@ class GameDataTransformer:
 
         df = df.copy()
 
-        # Select and rename key columns
-        key_columns = {
-            "gameID": "game_id",
-            "title": "title",
-            "salePrice": "current_price",
-            "normalPrice": "retail_price",
-            "savings": "discount_amount",
-            "dealRating": "deal_rating",
-            "storeName": "store",
-            "storeID": "store_id",
-            "thumb": "thumbnail",
-            "isListed": "is_listed",
-        }
-
-        # Keep only columns that exist
+        # Select and rename key columns, keeping only columns that exist
+        key_columns = GameDataTransformer.RAW_COLUMN_MAP
         available_cols = {k: v for k, v in key_columns.items() if k in df.columns}
         df = df[list(available_cols.keys())].rename(columns=available_cols)
 
-        # Convert price columns to numeric
-        price_cols = ["current_price", "retail_price", "discount_amount"]
-        for col in price_cols:
+        # Convert price and deal rating columns to numeric
+        for col in GameDataTransformer.NUMERIC_COLUMNS:
             if col in df.columns:
                 df[col] = pd.to_numeric(df[col], errors="coerce")
 
-        # Convert deal rating to numeric
-        if "deal_rating" in df.columns:
-            df["deal_rating"] = pd.to_numeric(df["deal_rating"], errors="coerce")
-
         # Remove rows with missing critical data
-        df = df.dropna(subset=["game_id", "title", "current_price"])
+        df = df.dropna(subset=GameDataTransformer.REQUIRED_COLUMNS)
 
         logger.info(f"Data cleaning complete. Retained {len(df)} records.")
         return df
 
     @staticmethod
+    @instrumented("transform.calculate_discount_percentage")
     def calculate_discount_percentage(df: pd.DataFrame) -> pd.DataFrame:
         """
         Calculate discount percentage and savings
@@ -77,51 +129,71 @@ class GameDataTransformer:
             DataFrame with added discount columns
         """
         df = df.copy()
-
-        # Calculate discount percentage
-        df["discount_pct"] = (
-            (df["retail_price"] - df["current_price"]) / df["retail_price"] * 100
-        ).round(2)
-
-        # Handle cases where discount_pct might be negative or NaN
-        df["discount_pct"] = df["discount_pct"].fillna(0)
-        df["discount_pct"] = df["discount_pct"].clip(lower=0)  # No negative discounts
-
+        df["discount_pct"] = GameDataTransformer._discount_pct(
+            df["retail_price"].to_numpy(dtype="float64", na_value=np.nan),
+            df["current_price"].to_numpy(dtype="float64", na_value=np.nan),
+        )
         logger.info("Calculated discount percentages")
         return df
 
     @staticmethod
-    def categorize_deal_quality(df: pd.DataFrame) -> pd.DataFrame:
+    def _discount_pct(retail: np.ndarray, current: np.ndarray) -> np.ndarray:
+        """Discount % rounded to 2 places; missing or negative discounts become 0"""
+        with np.errstate(divide="ignore", invalid="ignore"):
+            discount_pct = np.round((retail - current) / retail * 100, 2)
+
+        discount_pct[np.isnan(discount_pct)] = 0
+        return np.maximum(discount_pct, 0)
+
+    @staticmethod
+    @instrumented("transform.categorize_deal_quality")
+    def categorize_deal_quality(
+        df: pd.DataFrame,
+        bins: Optional[Sequence[float]] = None,
+        labels: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
         """
         Categorize deals based on discount percentage
 
+        Each bin edge is the inclusive lower bound of the next label, so the
+        default edges [10, 25, 50, 75] map 75%+ to "Exceptional", 50-75% to
+        "Excellent", and so on down to "Minimal" below 10%.
+
         Args:
             df: DataFrame with discount_pct column
+            bins: Ascending discount thresholds (defaults to DEAL_QUALITY_BINS)
+            labels: One label per bin plus one (defaults to DEAL_QUALITY_LABELS)
 
         Returns:
-            DataFrame with added deal_quality column
+            DataFrame with added ordered categorical deal_quality column
         """
         df = df.copy()
-
-        def quality(discount):
-            if pd.isna(discount):
-                return "Unknown"
-            elif discount >= 75:
-                return "Exceptional"
-            elif discount >= 50:
-                return "Excellent"
-            elif discount >= 25:
-                return "Good"
-            elif discount >= 10:
-                return "Moderate"
-            else:
-                return "Minimal"
-
-        df["deal_quality"] = df["discount_pct"].apply(quality)
+        df["deal_quality"] = GameDataTransformer._deal_quality(
+            df["discount_pct"].to_numpy(dtype="float64", na_value=np.nan), bins, labels
+        )
         logger.info("Categorized deal qualities")
         return df
 
     @staticmethod
+    def _deal_quality(
+        discount: np.ndarray,
+        bins: Optional[Sequence[float]] = None,
+        labels: Optional[Sequence[str]] = None,
+    ) -> pd.Categorical:
+        """Ordered deal quality categorical for an array of discount percentages"""
+        bins = np.asarray(GameDataTransformer.DEAL_QUALITY_BINS if bins is None else bins, dtype="float64")
+        labels = list(GameDataTransformer.DEAL_QUALITY_LABELS if labels is None else labels)
+        if len(labels) != len(bins) + 1:
+            raise ValueError(f"Expected {len(bins) + 1} labels for {len(bins)} bin edges, got {len(labels)}")
+
+        # Code 0 is "Unknown" (missing discount); 1.. follow the bins in order
+        codes = np.searchsorted(bins, discount, side="right") + 1
+        codes[np.isnan(discount)] = 0
+
+        return pd.Categorical.from_codes(codes, categories=["Unknown"] + labels, ordered=True)
+
+    @staticmethod
+    @instrumented("transform.add_time_metadata")
     def add_time_metadata(df: pd.DataFrame) -> pd.DataFrame:
         """
         Add time-related metadata for tracking when deals were found
@@ -138,6 +210,7 @@ class GameDataTransformer:
         return df
 
     @staticmethod
+    @instrumented("transform.transform_deals_data")
     def transform_deals_data(df: pd.DataFrame) -> pd.DataFrame:
         """
         Complete transformation pipeline for game deals
@@ -162,21 +235,325 @@ class GameDataTransformer:
         df = GameDataTransformer.categorize_deal_quality(df)
         df = GameDataTransformer.add_time_metadata(df)
 
-        # Ensure consistent column order
+        # Ensure consistent column order and compact dtypes
+        df = df[GameDataTransformer._ordered_columns(df.columns)]
+        df = GameDataTransformer.apply_deals_schema(df)
+
+        logger.info("Game deals transformation complete")
+        return df
+
+    @staticmethod
+    @instrumented("transform.apply_deals_schema")
+    def apply_deals_schema(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast a processed deals frame to the compact DEALS_SCHEMA dtypes
+
+        Columns missing from df are skipped; a deal_quality column that is
+        already categorical (e.g. built with custom labels) is kept as is.
+
+        Args:
+            df: Processed deals DataFrame
+
+        Returns:
+            DataFrame with compact dtypes
+        """
+        casts = {}
+        for col, dtype in GameDataTransformer.DEALS_SCHEMA.items():
+            if col not in df.columns or df[col].dtype == dtype:
+                continue
+            if col == "deal_quality" and isinstance(df[col].dtype, pd.CategoricalDtype):
+                continue
+            casts[col] = dtype
+
+        # Integer IDs may arrive as strings (raw API values or CSV text)
+        for col in ("game_id", "store_id"):
+            if col in casts and not pd.api.types.is_numeric_dtype(df[col]):
+                df = df.assign(**{col: pd.to_numeric(df[col], errors="coerce")})
+
+        if casts:
+            df = df.astype(casts)
+
+        if "fetched_at" in df.columns and not isinstance(df["fetched_at"].dtype, pd.CategoricalDtype):
+            df = df.assign(fetched_at=pd.to_datetime(df["fetched_at"]).astype("category"))
+
+        return df
+
+    @staticmethod
+    def _ordered_columns(columns: Sequence[str]) -> list:
+        """Output column order: IDs, prices, rating/store, then everything else"""
         base_cols = ["game_id", "title"]
         price_cols = ["retail_price", "current_price", "discount_amount", "discount_pct"]
         rating_cols = ["deal_rating", "deal_quality", "store", "store_id"]
-        other_cols = [col for col in df.columns if col not in base_cols + price_cols + rating_cols]
+        other_cols = [col for col in columns if col not in base_cols + price_cols + rating_cols]
 
         final_cols = base_cols + price_cols + rating_cols + other_cols
-        final_cols = [col for col in final_cols if col in df.columns]
+        return [col for col in final_cols if col in columns]
 
-        df = df[final_cols]
+    @staticmethod
+    @instrumented("transform.transform_deals_data_fused")
+    def transform_deals_data_fused(
+        df: pd.DataFrame,
+        sort: bool = True,
+        report_memory: bool = False,
+        fetched_at: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        """
+        Single-pass equivalent of transform_deals_data (+ sort_by_deal_quality)
 
-        logger.info("Game deals transformation complete")
+        Columns are converted once, the drop mask and sort order are combined
+        into one row selection, and every output column is gathered exactly
+        once. Under copy-on-write the input is never defensively copied, so
+        peak memory is about one working copy of the output.
+
+        Args:
+            df: Raw game deals DataFrame from CheapShark
+            sort: Apply the sort_by_deal_quality ordering
+            report_memory: Trace allocations and log the peak (slower)
+            fetched_at: Timestamp to stamp on every row (defaults to now)
+
+        Returns:
+            Transformed DataFrame with the same columns as transform_deals_data;
+            with report_memory, df.attrs["peak_memory_bytes"] holds the peak
+        """
+        logger.info("Starting fused game deals transformation...")
+
+        if df.empty:
+            logger.warning("Empty DataFrame provided")
+            return df
+
+        tracing = report_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        if report_memory:
+            tracemalloc.reset_peak()
+
+        try:
+            with _copy_on_write():
+                result = GameDataTransformer._fused_transform(df, sort, fetched_at)
+
+            if report_memory:
+                peak = tracemalloc.get_traced_memory()[1]
+                result.attrs["peak_memory_bytes"] = peak
+                input_bytes = df.memory_usage(deep=True).sum()
+                output_bytes = result.memory_usage(deep=True).sum()
+                logger.info(
+                    f"Fused transform peak memory {peak / 1e6:.1f} MB "
+                    f"(input {input_bytes / 1e6:.1f} MB, output {output_bytes / 1e6:.1f} MB)"
+                )
+        finally:
+            if tracing:
+                tracemalloc.stop()
+
+        logger.info(f"Fused game deals transformation complete. Retained {len(result)} records.")
+        return result
+
+    @staticmethod
+    def _fused_transform(
+        df: pd.DataFrame, sort: bool, fetched_at: Optional[pd.Timestamp]
+    ) -> pd.DataFrame:
+        """Body of transform_deals_data_fused (runs under copy-on-write)"""
+        columns = {
+            new: df[raw] for raw, new in GameDataTransformer.RAW_COLUMN_MAP.items() if raw in df.columns
+        }
+        for col in GameDataTransformer.NUMERIC_COLUMNS:
+            if col in columns:
+                columns[col] = pd.to_numeric(columns[col], errors="coerce")
+
+        # Rows kept after the dropna in clean_deal_data
+        keep = np.ones(len(df), dtype=bool)
+        for col in GameDataTransformer.REQUIRED_COLUMNS:
+            keep &= columns[col].notna().to_numpy()
+        positions = np.flatnonzero(keep)
+
+        retail = columns["retail_price"].to_numpy(dtype="float64", na_value=np.nan)[positions]
+        current = columns["current_price"].to_numpy(dtype="float64", na_value=np.nan)[positions]
+        discount_pct = GameDataTransformer._discount_pct(retail, current)
+
+        if sort:
+            # Same ordering as sort_by_deal_quality, computed on the two keys only
+            rating = columns["deal_rating"].to_numpy(dtype="float64", na_value=np.nan)[positions]
+            order = (
+                pd.DataFrame({"deal_rating": rating, "discount_pct": discount_pct}, copy=False)
+                .sort_values(
+                    by=["deal_rating", "discount_pct"], ascending=[False, False], na_position="last"
+                )
+                .index.to_numpy()
+            )
+            positions = positions[order]
+            discount_pct = discount_pct[order]
+
+        data = {name: column.array.take(positions) for name, column in columns.items()}
+        data["discount_pct"] = discount_pct
+        data["deal_quality"] = GameDataTransformer._deal_quality(discount_pct)
+        data["fetched_at"] = pd.Categorical.from_codes(
+            np.zeros(len(positions), dtype="int8"),
+            categories=pd.DatetimeIndex([fetched_at if fetched_at is not None else pd.Timestamp.now()]),
+        )
+
+        result = pd.DataFrame(data, index=df.index.take(positions), copy=False)
+        result = result[GameDataTransformer._ordered_columns(result.columns)]
+        return GameDataTransformer.apply_deals_schema(result)
+
+    @staticmethod
+    def transform_deals_chunks(
+        chunks: Iterable[pd.DataFrame], sort: bool = True
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Streaming variant of transform_deals_data for inputs larger than memory
+
+        Each raw chunk (an API page or a chunk of a raw CSV) is transformed
+        with the fused path as it arrives; every row shares one fetched_at.
+
+        Args:
+            chunks: Iterable of raw game deals DataFrames
+            sort: Sort each chunk by deal quality (for a later k-way merge)
+
+        Yields:
+            Transformed, non-empty chunks
+        """
+        fetched_at = pd.Timestamp.now()
+
+        for chunk in chunks:
+            if chunk is None or chunk.empty:
+                continue
+
+            transformed = GameDataTransformer.transform_deals_data_fused(
+                chunk, sort=sort, fetched_at=fetched_at
+            )
+            if not transformed.empty:
+                yield transformed
+
+    @staticmethod
+    @instrumented("transform.attach_store_names")
+    def attach_store_names(df: pd.DataFrame, stores: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add a categorical store name column from the store catalog
+
+        Args:
+            df: DataFrame with store_id column
+            stores: Store catalog with store_id and store_name columns
+
+        Returns:
+            DataFrame with store column (unknown IDs become "Store <id>")
+        """
+        df = df.copy()
+
+        store_ids = pd.to_numeric(df["store_id"], errors="coerce").astype("Int64")
+        names = pd.Series(
+            stores["store_name"].to_numpy(),
+            index=pd.to_numeric(stores["store_id"], errors="coerce").astype("Int64"),
+        )
+        names = names[~names.index.duplicated()]
+
+        store = store_ids.map(names)
+        store = store.fillna("Store " + store_ids.astype(str))
+
+        if "store" in df.columns:
+            df["store"] = store.astype("category")
+        else:
+            df.insert(df.columns.get_loc("store_id"), "store", store.astype("category"))
+
+        logger.info("Attached store names")
+        return df
+
+    @staticmethod
+    def normalize_titles(titles: pd.Series) -> pd.Series:
+        """
+        Vectorized equivalent of normalize_title
+
+        Args:
+            titles: Series of raw titles
+
+        Returns:
+            Series of normalized titles
+        """
+        return (
+            titles.fillna("").astype(str).str.lower()
+            .str.replace("&", " and ", regex=False)
+            .str.replace(_TITLE_SYMBOLS, "", regex=True)
+            .str.replace(_TITLE_SEPARATORS, " ", regex=True)
+            .str.strip()
+        )
+
+    @staticmethod
+    @instrumented("transform.flag_game_pass")
+    def flag_game_pass(df: pd.DataFrame, game_pass_lookup: Dict[str, str]) -> pd.DataFrame:
+        """
+        Flag deals for games already included in Game Pass
+
+        Hash-joins normalized deal titles against the Game Pass lookup.
+
+        Args:
+            df: DataFrame with title column
+            game_pass_lookup: Normalized title -> Game Pass product ID
+
+        Returns:
+            DataFrame with added on_game_pass column
+        """
+        df = df.copy()
+        keys = GameDataTransformer.normalize_titles(df["title"])
+        df["on_game_pass"] = keys.map(game_pass_lookup).notna()
+        logger.info(f"Flagged {int(df['on_game_pass'].sum())} deals already on Game Pass")
         return df
 
     @staticmethod
+    @instrumented("transform.build_best_price_index")
+    def build_best_price_index(df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Build a per-game index of the best current price and the runner-up
+
+        One sort by (game_id, current_price) keeps each store's cheapest deal
+        per game, then a grouped rank picks the cheapest store and the
+        cheapest *other* store of every game in a single pass.
+
+        Args:
+            df: Processed deals DataFrame with game_id and current_price columns
+
+        Returns:
+            DataFrame indexed by game_id, ordered by best discount (highest first)
+        """
+        ordered = df.sort_values(["game_id", "current_price"], kind="stable")
+        store_col = next((col for col in ("store_id", "store") if col in ordered.columns), None)
+        if store_col is not None:
+            # A second deal at the best store is not a runner-up
+            ordered = ordered.drop_duplicates(["game_id", store_col])
+        grouped = ordered.groupby("game_id", sort=False, observed=True)
+        rank = grouped.cumcount().to_numpy()
+
+        best = ordered[rank == 0].set_index("game_id")
+        runner_up = ordered[rank == 1].set_index("game_id")
+
+        detail_cols = [col for col in ["title", "retail_price", "discount_pct", "deal_rating"] if col in best.columns]
+        price_cols = [col for col in ["current_price", "store", "store_id"] if col in best.columns]
+
+        index = pd.concat(
+            [
+                best[detail_cols],
+                best[price_cols].rename(columns=GameDataTransformer._prefixed("best")),
+                runner_up[price_cols].rename(columns=GameDataTransformer._prefixed("runner_up")),
+            ],
+            axis=1,
+        )
+        store_count = grouped[store_col].nunique() if store_col is not None else grouped.size()
+        index["store_count"] = store_count.astype("int32")
+
+        if "discount_pct" in index.columns:
+            index = index.sort_values("discount_pct", ascending=False, kind="stable")
+
+        logger.info(f"Built best price index for {len(index)} games")
+        return index
+
+    @staticmethod
+    def _prefixed(prefix: str) -> dict:
+        """Column renames for one side of the best price index"""
+        return {
+            "current_price": f"{prefix}_price",
+            "store": f"{prefix}_store",
+            "store_id": f"{prefix}_store_id",
+        }
+
+    @staticmethod
+    @instrumented("transform.filter_by_discount")
     def filter_by_discount(df: pd.DataFrame, min_discount_pct: float = 10) -> pd.DataFrame:
         """
         Filter deals to show only those with minimum discount
@@ -195,6 +572,7 @@ class GameDataTransformer:
         return filtered
 
     @staticmethod
+    @instrumented("transform.sort_by_deal_quality")
     def sort_by_deal_quality(df: pd.DataFrame) -> pd.DataFrame:
         """
         Sort deals by best deal rating and discount percentage
@@ -0,0 +1,188 @@
+"""
+Validation Module
+Vectorized rule checks on raw CheapShark deal frames; rows failing any
+rule are split off with reason codes so they can be quarantined instead
+of silently dropped or coerced to NaN
+"""
+
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Column holding the ";"-separated reason codes in quarantine files
+REASON_COLUMN = "reject_reasons"
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of validating one raw deals frame"""
+
+    valid: pd.DataFrame
+    rejected: pd.DataFrame
+    counts: Counter = field(default_factory=Counter)
+
+
+class DealValidator:
+    """Declared column rules for raw deals, checked with boolean masks"""
+
+    # Must be present and non-empty
+    REQUIRED_COLUMNS = ["gameID", "title", "salePrice"]
+    # Must be non-empty when the column is present
+    ID_COLUMNS = ["gameID", "dealID", "storeID"]
+    # Must parse as whole numbers when present
+    INTEGER_COLUMNS = ["gameID", "storeID"]
+    # Must parse as numbers within (low, high) when present; None leaves a side open
+    NUMERIC_RANGES: Dict[str, Tuple[Optional[float], Optional[float]]] = {
+        "salePrice": (0, None),
+        "normalPrice": (0, None),
+        "savings": (0, 100),
+        "dealRating": (0, 10),
+    }
+    # Rounding slack for the price <= retail check
+    PRICE_TOLERANCE = 0.005
+
+    @staticmethod
+    def _blank(values: pd.Series) -> np.ndarray:
+        """Missing or whitespace-only values"""
+        missing = values.isna().to_numpy()
+        if values.dtype == object or pd.api.types.is_string_dtype(values.dtype):
+            missing = missing | (values.astype("str").str.strip() == "").to_numpy()
+        return missing
+
+    @staticmethod
+    def _to_float(values: pd.Series) -> np.ndarray:
+        """Parse as float64, NaN where unparseable"""
+        try:
+            # Direct cast is several times faster and succeeds on clean columns
+            return values.astype("float64").to_numpy()
+        except (TypeError, ValueError):
+            return pd.to_numeric(values, errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+    @classmethod
+    def rule_masks(cls, df: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Evaluate every rule as a boolean violation mask
+
+        Args:
+            df: Raw deals DataFrame
+
+        Returns:
+            Reason code -> mask of rows violating that rule
+        """
+        masks: Dict[str, np.ndarray] = {}
+        n_rows = len(df)
+        blank: Dict[str, np.ndarray] = {}
+        numeric: Dict[str, np.ndarray] = {}
+
+        for col in dict.fromkeys(cls.REQUIRED_COLUMNS + cls.ID_COLUMNS):
+            if col in df.columns:
+                blank[col] = cls._blank(df[col])
+                masks[f"missing_{col}"] = blank[col]
+            elif col in cls.REQUIRED_COLUMNS:
+                masks[f"missing_{col}"] = np.ones(n_rows, dtype=bool)
+
+        # A value that is present but does not parse is a type error, not a gap
+        for col in dict.fromkeys(cls.INTEGER_COLUMNS + list(cls.NUMERIC_RANGES)):
+            if col not in df.columns:
+                continue
+            parsed = numeric[col] = cls._to_float(df[col])
+            present = ~blank.get(col, cls._blank(df[col]))
+            bad_type = present & np.isnan(parsed)
+            if col in cls.INTEGER_COLUMNS:
+                bad_type |= present & ~np.isnan(parsed) & (parsed != np.floor(parsed))
+            masks[f"invalid_type_{col}"] = bad_type
+
+        for col, (low, high) in cls.NUMERIC_RANGES.items():
+            if col not in numeric:
+                continue
+            parsed = numeric[col]
+            out_of_range = np.zeros(n_rows, dtype=bool)
+            with np.errstate(invalid="ignore"):
+                if low is not None:
+                    out_of_range |= parsed < low
+                if high is not None:
+                    out_of_range |= parsed > high
+            masks[f"out_of_range_{col}"] = out_of_range
+
+        if "salePrice" in numeric and "normalPrice" in numeric:
+            sale, retail = numeric["salePrice"], numeric["normalPrice"]
+            with np.errstate(invalid="ignore"):
+                masks["price_above_retail"] = sale > retail + cls.PRICE_TOLERANCE
+
+        return masks
+
+    @classmethod
+    def validate(cls, df: pd.DataFrame) -> ValidationResult:
+        """
+        Split a raw deals frame into valid rows and rejected rows with reasons
+
+        Args:
+            df: Raw deals DataFrame
+
+        Returns:
+            ValidationResult with valid rows, rejected rows (plus a
+            reject_reasons column) and violation counts per rule
+        """
+        masks = cls.rule_masks(df)
+
+        failed = np.zeros(len(df), dtype=bool)
+        counts: Counter = Counter()
+        for code, mask in masks.items():
+            violations = int(mask.sum())
+            if violations:
+                counts[code] = violations
+                failed |= mask
+
+        rejected = df[failed]
+        if len(rejected):
+            # Reason strings are built only for the failing rows
+            reasons = pd.Series("", index=rejected.index, dtype="object")
+            for code in counts:
+                hit = masks[code][failed]
+                reasons[hit] = reasons[hit] + (code + ";")
+            rejected = rejected.assign(**{REASON_COLUMN: reasons.str.rstrip(";")})
+
+        valid = df[~failed] if len(rejected) else df
+        return ValidationResult(valid=valid, rejected=rejected, counts=counts)
+
+    @staticmethod
+    def log_counts(result: ValidationResult) -> None:
+        """Log per-rule violation counts for one validation pass"""
+        total = len(result.valid) + len(result.rejected)
+        if not result.counts:
+            logger.info(f"Validation passed: {total} rows, no violations")
+            return
+
+        logger.warning(f"Validation rejected {len(result.rejected)} of {total} rows")
+        for code, count in result.counts.most_common():
+            logger.warning(f"  {code}: {count}")
+
+
+def write_quarantine(rejected: pd.DataFrame, path: Path) -> int:
+    """
+    Append rejected rows to a quarantine CSV
+
+    Args:
+        rejected: Rows returned in ValidationResult.rejected
+        path: Quarantine file (header written when it is new)
+
+    Returns:
+        Number of rows written
+    """
+    if rejected is None or rejected.empty:
+        return 0
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    exists = path.exists()
+    rejected.to_csv(path, mode="a" if exists else "w", header=not exists, index=False)
+    return len(rejected)
@@ -0,0 +1,106 @@
+"""
+Fetch Data Tests
+Streaming Game Pass catalog parsing
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from fetch_data import GamePriceFetcher, JsonRecordScanner
+from transform import normalize_title
+
+TITLE_KEYS = ("productTitle", "title")
+ID_KEYS = ("productId", "id")
+LIST_KEYS = ("products",)
+
+
+def scan(chunks):
+    scanner = JsonRecordScanner(TITLE_KEYS, ID_KEYS, LIST_KEYS)
+    return [record for chunk in chunks for record in scanner.feed(chunk)]
+
+
+def test_escaped_quotes_and_brackets_inside_strings():
+    """Quotes, backslashes and brackets inside strings never open or close records"""
+    records = [
+        {"title": 'Forza "H" [5] {GOTY}', "id": "9N"},
+        {"title": "Back\\slash ]}", "id": "B1"},
+        {"title": "Halo", "id": "H1"},
+    ]
+    document = json.dumps(records)
+
+    assert scan([document]) == [('Forza "H" [5] {GOTY}', "9N"), ("Back\\slash ]}", "B1"), ("Halo", "H1")]
+
+
+def test_titles_match_only_at_record_depth():
+    """Nested objects and lists outside the record list are not records"""
+    document = json.dumps({
+        "meta": {"title": "Catalog"},
+        "products": [
+            {
+                "productTitle": "Halo",
+                "productId": "H1",
+                "publisher": {"title": "Xbox Game Studios"},
+                "related": [{"title": "Halo 2", "id": "H2"}],
+            },
+            {"publisher": {"title": "No title of its own"}},
+        ],
+        "other": [{"title": "Not a record", "id": "X"}],
+    })
+
+    assert scan([document]) == [("Halo", "H1")]
+
+
+@pytest.mark.parametrize("split", range(1, 60))
+def test_records_survive_any_chunk_boundary(split):
+    """Splitting the document anywhere, including inside escapes, gives the same records"""
+    document = json.dumps({"products": [{"title": 'A "b" \\ [c]', "id": "1"}, {"title": "Halo", "id": "H1"}]})
+    expected = [('A "b" \\ [c]', "1"), ("Halo", "H1")]
+
+    assert scan([document[:split], document[split:]]) == expected
+
+
+class _StreamedResponse:
+    """Minimal streamed response yielding the body one byte at a time"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size=1):
+        for i in range(len(self.body)):
+            yield self.body[i:i + 1]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+class _Session:
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def get(self, url, **kwargs):
+        return _StreamedResponse(self.body)
+
+    def close(self):
+        pass
+
+
+def test_game_pass_catalog_keeps_final_chunk():
+    """The last record and multi-byte characters split across chunks are kept"""
+    body = json.dumps([{"title": "Halo", "id": "H1"}, {"title": "Pokémon Café", "id": "P1"}], ensure_ascii=False)
+    fetcher = GamePriceFetcher()
+    fetcher.session = _Session(body.encode("utf-8"))
+
+    lookup = fetcher.fetch_game_pass_catalog()
+
+    assert lookup == {"halo": "H1", normalize_title("Pokémon Café"): "P1"}
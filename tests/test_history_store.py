@@ -0,0 +1,67 @@
+"""
+Price History Store Tests
+Chunked snapshot appends are published only on close
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from history_store import PriceHistoryStore
+
+SNAPSHOT_TIME = pd.Timestamp("2024-01-01 12:00:00")
+
+
+def deals(game_ids):
+    return pd.DataFrame({
+        "game_id": game_ids,
+        "title": [f"Game {game_id}" for game_id in game_ids],
+        "store_id": [1] * len(game_ids),
+        "current_price": [4.99] * len(game_ids),
+    })
+
+
+def test_parts_are_hidden_until_close(tmp_path):
+    """Readers never see a streamed snapshot before close()"""
+    store = PriceHistoryStore(tmp_path, buckets=4)
+    appender = store.appender(SNAPSHOT_TIME)
+    appender.write(deals(range(1, 21)))
+    appender.write(deals(range(21, 41)))
+
+    assert store.date_range().empty
+    appender.close()
+
+    history = store.date_range()
+    assert sorted(history["game_id"]) == list(range(1, 41))
+    assert len(list(tmp_path.rglob("*.parquet"))) == 4
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_abort_discards_written_chunks(tmp_path):
+    """A failed run leaves nothing in history, and a rerun is not duplicated"""
+    store = PriceHistoryStore(tmp_path, buckets=4)
+    appender = store.appender(SNAPSHOT_TIME)
+    appender.write(deals(range(1, 21)))
+    appender.abort()
+    appender.close()
+
+    assert store.date_range().empty
+    assert not [path for path in tmp_path.rglob("*") if path.is_file()]
+
+    store.append(deals(range(1, 21)), SNAPSHOT_TIME)
+    assert len(store.date_range()) == 20
+
+
+def test_context_manager_aborts_on_error(tmp_path):
+    store = PriceHistoryStore(tmp_path, buckets=4)
+    try:
+        with store.appender(SNAPSHOT_TIME) as appender:
+            appender.write(deals(range(1, 21)))
+            raise RuntimeError("stream failed")
+    except RuntimeError:
+        pass
+
+    assert store.date_range().empty
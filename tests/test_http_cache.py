@@ -0,0 +1,70 @@
+"""
+HTTP Response Cache Tests
+TTL freshness, conditional revalidation and LRU eviction
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from http_cache import ResponseCache
+
+URL = "https://www.cheapshark.com/api/1.0/deals"
+
+
+def response(body: bytes, etag: str = None) -> requests.Response:
+    resp = requests.Response()
+    resp.status_code = 200
+    resp._content = body
+    if etag:
+        resp.headers["ETag"] = etag
+    return resp
+
+
+def test_store_and_lookup_with_validators(tmp_path):
+    """Parameter order does not change the key, and validators round-trip"""
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds={"deals": 60, "default": 0})
+    cache.store(URL, {"pageNumber": "0", "pageSize": "60"}, response(b'[{"dealID": "a"}]', etag='"v1"'))
+
+    entry = cache.lookup(URL, {"pageSize": "60", "pageNumber": "0"})
+    assert entry.payload() == [{"dealID": "a"}]
+    assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+    assert entry.validators() == {"ETag": '"v1"'}
+    assert cache.lookup(URL, {"pageNumber": "1", "pageSize": "60"}) is None
+    cache.close()
+
+
+def test_ttl_per_endpoint_and_revalidation(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", ttl_seconds={"deals": 60, "default": 0})
+    cache.store(URL, {}, response(b"[]"))
+    entry = cache.lookup(URL, {})
+
+    assert cache.is_fresh(entry, "deals")
+    assert not cache.is_fresh(entry, "games")
+
+    entry.stored_at -= 120
+    assert not cache.is_fresh(entry, "deals")
+    cache.mark_revalidated(entry)
+    assert cache.is_fresh(cache.lookup(URL, {}), "deals")
+    assert cache.stats()["revalidated"] == 1
+    cache.close()
+
+
+def test_evicts_least_recently_used_over_size_cap(tmp_path):
+    cache = ResponseCache(tmp_path / "cache.sqlite", max_bytes=25)
+    cache.store(URL, {"page": "0"}, response(b"[" + b"0" * 9 + b"]"))
+    time.sleep(0.01)
+    cache.store(URL, {"page": "1"}, response(b"[" + b"1" * 9 + b"]"))
+    time.sleep(0.01)
+    cache.lookup(URL, {"page": "0"})
+    time.sleep(0.01)
+    cache.store(URL, {"page": "2"}, response(b"[" + b"2" * 9 + b"]"))
+
+    assert cache.lookup(URL, {"page": "1"}) is None
+    assert cache.lookup(URL, {"page": "0"}) is not None
+    assert cache.lookup(URL, {"page": "2"}) is not None
+    cache.close()
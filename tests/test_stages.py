@@ -0,0 +1,71 @@
+"""
+Stage Runner Tests
+Checkpoint and resume behavior of the stage graph
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from stages import Stage, StageRunner
+
+
+def test_resume_skips_checkpointed_stages(tmp_path):
+    """A failed run keeps completed stages, and the rerun only runs the rest"""
+    calls = []
+    outcome = {"report": None}
+
+    def stage(name, value=None):
+        def func(inputs):
+            calls.append(name)
+            return outcome.get(name, value)
+        return func
+
+    stages = [
+        Stage("deals", stage("deals", [1, 2, 3])),
+        Stage("report", stage("report"), deps=("deals",)),
+    ]
+
+    assert not StageRunner(stages, tmp_path).run()
+    assert calls == ["deals", "report"]
+
+    outcome["report"] = "done"
+    runner = StageRunner(stages, tmp_path)
+    assert runner.run()
+    assert calls == ["deals", "report", "report"]
+    assert runner.timings["deals"]["status"] == "resumed"
+    assert not list(tmp_path.glob("*.pkl"))
+
+
+def test_optional_none_output_is_retried_on_resume(tmp_path):
+    """An optional stage with no output is passed on as None but never checkpointed"""
+    catalog = {"stores": None}
+    seen = []
+
+    stages = [
+        Stage("stores", lambda _: catalog["stores"], required=False),
+        Stage("deals", lambda _: [1]),
+        Stage("transform", lambda r: seen.append(r["stores"]) or None, deps=("deals", "stores")),
+    ]
+
+    runner = StageRunner(stages, tmp_path)
+    assert not runner.run()
+    assert seen == [None]
+    assert runner.timings["stores"]["status"] == "no output"
+    assert not (tmp_path / "stores.pkl").exists()
+
+    catalog["stores"] = ["Steam"]
+    StageRunner(stages, tmp_path).run()
+    assert seen == [None, ["Steam"]]
+
+
+def test_checkpointed_none_is_not_resumed(tmp_path):
+    """Checkpoints holding None, e.g. from older runs, are rerun"""
+    stage = Stage("game_pass", lambda _: {"halo": "H1"}, required=False)
+    runner = StageRunner([stage], tmp_path)
+    runner._save_checkpoint(stage, None)
+
+    assert runner.run()
+    assert runner.results["game_pass"] == {"halo": "H1"}
+    assert runner.timings["game_pass"]["status"] == "ok"
@@ -0,0 +1,32 @@
+"""
+Storage Tests
+Regression checks for chunked snapshot writing
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from storage import DealsFileWriter, read_deals
+
+
+@pytest.mark.parametrize("suffix", [".parquet", ".feather"])
+def test_writer_accepts_values_after_all_null_first_chunk(tmp_path, suffix):
+    """A column that is entirely null in chunk 1 must still accept values in chunk 2"""
+    path = tmp_path / f"deals_raw_20240101_000000{suffix}"
+    first = pd.DataFrame({"gameID": ["1", "2"], "steamAppID": [None, None]})
+    second = pd.DataFrame({"gameID": ["3", "4"], "steamAppID": ["620", None]})
+
+    with DealsFileWriter(path) as writer:
+        writer.write(first)
+        writer.write(second)
+
+    result = read_deals(path)
+    assert writer.rows == 4
+    assert list(result["gameID"]) == ["1", "2", "3", "4"]
+    assert result["steamAppID"].iloc[2] == "620"
+    assert result["steamAppID"].isna().sum() == 3
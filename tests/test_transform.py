@@ -0,0 +1,46 @@
+"""
+Transform Tests
+Best price index built from processed deals
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from transform import GameDataTransformer, normalize_title
+
+
+def test_best_price_index_runner_up_is_another_store():
+    """Two deals at one store count as one store and never rank as runner-up"""
+    deals = pd.DataFrame({
+        "game_id": [1, 1, 1, 2],
+        "title": ["Halo", "Halo", "Halo", "Doom"],
+        "current_price": [5.0, 6.0, 9.0, 3.0],
+        "store_id": [1, 1, 7, 3],
+        "store": ["Steam", "Steam", "GOG", "Green Man Gaming"],
+        "discount_pct": [50.0, 40.0, 10.0, 20.0],
+    })
+
+    index = GameDataTransformer.build_best_price_index(deals)
+
+    halo = index.loc[1]
+    assert (halo["best_store"], halo["best_price"]) == ("Steam", 5.0)
+    assert (halo["runner_up_store"], halo["runner_up_price"]) == ("GOG", 9.0)
+    assert halo["store_count"] == 2
+
+    doom = index.loc[2]
+    assert pd.isna(doom["runner_up_price"])
+    assert doom["store_count"] == 1
+
+
+def test_normalize_titles_matches_scalar_for_string_dtypes():
+    """The vectorized path works on Arrow-backed strings too"""
+    raw = ["Halo™ Infinite", "Tom Clancy's® Rainbow Six", "Ori & the Blind Forest", None]
+    expected = [normalize_title(title) for title in raw[:3]] + [""]
+
+    for dtype in ("object", "string[pyarrow]"):
+        titles = pd.Series(raw, dtype=dtype)
+        assert GameDataTransformer.normalize_titles(titles).tolist() == expected
@@ -0,0 +1,55 @@
+"""
+Validation Tests
+Raw deal rules, reason codes and quarantine files
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "pipeline"))
+
+from validation import REASON_COLUMN, DealValidator, write_quarantine
+
+
+def raw_deals():
+    return pd.DataFrame({
+        "gameID": ["1", "2", "3.5", "4", "5"],
+        "dealID": ["a", "b", "c", " ", "e"],
+        "title": ["Halo", None, "Doom", "Portal", "Hades"],
+        "salePrice": ["4.99", "1.00", "2.00", "3.00", "30.00"],
+        "normalPrice": ["19.99", "2.00", "4.00", "6.00", "20.00"],
+        "savings": ["75", "50", "50", "150", "0"],
+    })
+
+
+def test_validate_splits_rows_with_reason_codes():
+    result = DealValidator.validate(raw_deals())
+
+    assert list(result.valid["gameID"]) == ["1"]
+    reasons = dict(zip(result.rejected["gameID"], result.rejected[REASON_COLUMN]))
+    assert reasons == {
+        "2": "missing_title",
+        "3.5": "invalid_type_gameID",
+        "4": "missing_dealID;out_of_range_savings",
+        "5": "price_above_retail",
+    }
+    assert result.counts["missing_title"] == 1
+
+
+def test_missing_required_column_rejects_every_row():
+    result = DealValidator.validate(raw_deals().drop(columns="salePrice"))
+
+    assert result.valid.empty
+    assert result.counts["missing_salePrice"] == 5
+
+
+def test_write_quarantine_appends_with_one_header(tmp_path):
+    rejected = DealValidator.validate(raw_deals()).rejected
+    path = tmp_path / "quarantine" / "deals_quarantine.csv"
+
+    assert write_quarantine(rejected, path) == 4
+    assert write_quarantine(rejected, path) == 4
+    assert write_quarantine(rejected.iloc[0:0], path) == 0
+    assert len(pd.read_csv(path)) == 8